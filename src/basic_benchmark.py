@@ -0,0 +1,697 @@
+"""
+Python Implementation of a Benchmark for a Subset of BASIC (ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import contextlib
+import datetime
+import glob
+import hashlib
+import io
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from basic_scanner import Scanner, TokenBuffer
+from basic_parser import Parser, ParserError
+from basic_interpreter import Interpreter, RECURSION_LIMIT
+from basic_program import Expression
+from basic_tokens import Operators
+
+"""
+This file includes the benchmark history used as a performance regression
+gate. A fixed corpus of BASIC programs is run through the scanner, parser
+and interpreter stages. Every sample is stored in a SQLite file together
+with the git commit and a fingerprint of the machine, and a run is
+compared with an earlier run on the same machine. A stage regresses if
+its mean time grew by more than the threshold and the 95% confidence
+interval of the difference excludes zero.
+
+The startup time of a tiny program is timed as well, once interpreted and
+once run from its compiled module, as running many tiny programs is
+dominated by starting Python and importing the modules. The startup
+command breaks the import time down by module with python -X importtime.
+
+The memory command runs a generated program with a huge number of
+variables once with the dict enviornment and once with the compact one
+of basic_memory, and compares the peak resident set size of the runs.
+"""
+
+# directory with the modules of the interpreter
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+# directory with the fixed benchmark corpus
+CORPUS_DIR = os.path.join(SRC_DIR, "bench")
+# program whose startup time is measured
+STARTUP_PROGRAM = "PRINT 1\n"
+
+# two sided 95% critical values of the t distribution by degrees of freedom
+T_TABLE = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262,
+           2.228, 2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101,
+           2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052,
+           2.048, 2.045, 2.042)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    machine TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    program TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+"""
+
+
+class TokenReplay:
+    """
+    Scanner replacement which replays already scanned tokens, used to time
+    the parser without the scanner.
+    """
+
+    def __init__(self, buffer: TokenBuffer):
+        self.buffer = buffer
+
+    def tokens(self) -> TokenBuffer:
+        return self.buffer
+
+
+class RecursiveDescentParser(Parser):
+    """
+    Parser with the recursive descent expression parser which precedence
+    climbing replaced, a function per precedence level and several frames
+    per perenthesis, used as the baseline of the expressions benchmark.
+    Logical operators are not supported.
+    """
+
+    def expr(self) -> Expression:
+        # lex to get the first term in expression
+        self.lex()
+        expr = self.addition()
+        while self.next_type in (Operators.EQUAL_OP, Operators.LESS_THAN,
+                                 Operators.GREATER_THAN,
+                                 Operators.NOT_GREATER, Operators.NOT_LESS):
+            operator = self.next_type
+            self.lex()
+            expr = Expression.Binary(expr, operator, self.addition())
+        return expr
+
+    def addition(self) -> Expression:
+        expr = self.multiplication()
+        while self.next_type in (Operators.ADD_OP, Operators.SUB_OP):
+            operator = self.next_type
+            self.lex()
+            expr = Expression.Binary(expr, operator, self.multiplication())
+        return expr
+
+    def multiplication(self) -> Expression:
+        expr = self.unary()
+        while self.next_type in (Operators.MULT_OP, Operators.DIV_OP):
+            operator = self.next_type
+            self.lex()
+            expr = Expression.Binary(expr, operator, self.unary())
+        return expr
+
+    def unary(self) -> Expression:
+        if self.next_type in (Operators.ADD_OP, Operators.SUB_OP):
+            operator = self.next_type
+            self.lex()
+            return Expression.Unary(operator, self.unary())
+        if self.next_type == Operators.LEFT_PEREN:
+            expr = self.expr()
+            if self.next_type != Operators.RIGHT_PEREN:
+                raise ParserError(self.next_pos(), "Mismatched perenthesis")
+            # consume perenthesis
+            self.lex()
+            return Expression.Grouping(expr)
+        return self.primary()
+
+
+def corpus() -> dict:
+    """
+    Loads the benchmark corpus.
+
+    Returns:
+        dict -- the source lines of each program by name.
+    """
+    programs = {}
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.bas"))):
+        with open(path, "r") as f:
+            programs[os.path.basename(path)] = f.readlines()
+    return programs
+
+
+def time_stages(lines: list) -> dict:
+    """
+    Times each stage once for a program.
+
+    Arguments:
+        lines {list} -- The source lines of the program.
+
+    Returns:
+        dict -- seconds spent in each stage.
+    """
+    start = time.perf_counter()
+    tokens = Scanner(lines).tokens()
+    scanned = time.perf_counter()
+    parser = Parser(TokenReplay(tokens))
+    program = parser.program()
+    parsed = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        Interpreter(parser).run(program)
+    interpreted = time.perf_counter()
+    return {"scan": scanned - start,
+            "parse": parsed - scanned,
+            "interpret": interpreted - parsed}
+
+
+def startup_commands(directory: str) -> dict:
+    """
+    Writes the startup program and its compiled module to a directory.
+    The modules of the interpreter are compiled to bytecode first, as they
+    are when they are installed.
+
+    Arguments:
+        directory {str} -- A temporary directory.
+
+    Returns:
+        dict -- the command line of each way of starting the program,
+        "python" is the startup of Python itself.
+    """
+    # imported here as only the startup benchmark needs them
+    import compileall
+    import basic_compiler
+    compileall.compile_dir(SRC_DIR, maxlevels=0, quiet=1)
+    source = os.path.join(directory, "startup.bas")
+    with open(source, "w") as f:
+        f.write(STARTUP_PROGRAM)
+    module = basic_compiler.compile_file(source)
+    return {"python": [sys.executable, "-c", "pass"],
+            "interpret": [sys.executable,
+                          os.path.join(SRC_DIR, "basic_interpreter.py"),
+                          source],
+            "compiled": [sys.executable, module]}
+
+
+def startup_env() -> dict:
+    """
+    Returns the enviornment of the startup commands, in which compiled
+    modules find the runtime.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [SRC_DIR] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    return env
+
+
+def time_startup(samples: int) -> dict:
+    """
+    Times starting the startup program interpreted and compiled.
+
+    Arguments:
+        samples {int} -- The number of times each command is run.
+
+    Returns:
+        dict -- list of seconds by ("startup", stage).
+    """
+    times = {}
+    env = startup_env()
+    with tempfile.TemporaryDirectory() as directory:
+        commands = startup_commands(directory)
+        for stage in ("interpret", "compiled"):
+            for _ in range(samples):
+                start = time.perf_counter()
+                subprocess.run(commands[stage], env=env, check=True,
+                               stdout=subprocess.DEVNULL)
+                times.setdefault(("startup", stage), []).append(
+                    time.perf_counter() - start)
+    return times
+
+
+def import_times(command: list, env: dict) -> dict:
+    """
+    Runs a command under python -X importtime.
+
+    Returns:
+        dict -- microseconds spent importing each module itself, without
+        the modules it imports.
+    """
+    result = subprocess.run(command[:1] + ["-X", "importtime"] + command[1:],
+                            env=env, check=True, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[0].startswith("import time:") \
+                and fields[0].split(":")[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[0].split(":")[1])
+    return times
+
+
+def git_commit() -> str:
+    """
+    Returns the current git commit, marked if the tree has changes.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=CORPUS_DIR,
+                                capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain"],
+                               cwd=CORPUS_DIR, capture_output=True,
+                               text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+
+def machine_fingerprint() -> str:
+    """
+    Returns a short fingerprint of the machine and Python build, so runs
+    are only compared with runs of the same setup.
+    """
+    description = "|".join((platform.node(), platform.machine(),
+                            platform.processor(), str(os.cpu_count()),
+                            platform.python_implementation(),
+                            platform.python_version()))
+    return hashlib.sha1(description.encode()).hexdigest()[:12]
+
+
+def record_run(db: sqlite3.Connection, samples: dict) -> int:
+    """
+    Stores the samples of a run.
+
+    Arguments:
+        db {sqlite3.Connection} -- The history database.
+        samples {dict} -- list of seconds by (program, stage).
+
+    Returns:
+        int -- the id of the stored run.
+    """
+    with db:
+        cursor = db.execute(
+            "INSERT INTO runs (created, git_commit, machine) VALUES (?, ?, ?)",
+            (datetime.datetime.now().isoformat(timespec="seconds"),
+             git_commit(), machine_fingerprint()))
+        run_id = cursor.lastrowid
+        db.executemany(
+            "INSERT INTO samples (run_id, program, stage, seconds) "
+            "VALUES (?, ?, ?, ?)",
+            [(run_id, program, stage, seconds)
+             for (program, stage), values in samples.items()
+             for seconds in values])
+    return run_id
+
+
+def load_run(db: sqlite3.Connection, run_id: int) -> dict:
+    """
+    Loads the samples of a stored run.
+
+    Returns:
+        dict -- list of seconds by (program, stage).
+    """
+    samples = {}
+    for program, stage, seconds in db.execute(
+            "SELECT program, stage, seconds FROM samples WHERE run_id = ?",
+            (run_id,)):
+        samples.setdefault((program, stage), []).append(seconds)
+    return samples
+
+
+def previous_run(db: sqlite3.Connection, before: int = None) -> int:
+    """
+    Finds the latest run on this machine, optionally before a given run.
+
+    Returns:
+        int -- the id of the run, or None if there is none.
+    """
+    row = db.execute(
+        "SELECT MAX(id) FROM runs WHERE machine = ? AND id < ?",
+        (machine_fingerprint(),
+         before if before is not None else sys.maxsize)).fetchone()
+    return row[0]
+
+
+def t_critical(df: float) -> float:
+    """
+    Returns the two sided 95% critical value of the t distribution.
+    """
+    if df < 1:
+        return T_TABLE[0]
+    if df > len(T_TABLE):
+        return 1.96
+    return T_TABLE[int(math.floor(df)) - 1]
+
+
+def compare(baseline: list, current: list) -> tuple:
+    """
+    Compares two sets of samples using Welch's t interval.
+
+    Arguments:
+        baseline {list} -- seconds of the earlier run.
+        current {list} -- seconds of the new run.
+
+    Returns:
+        tuple -- relative change of the mean and the 95% confidence interval
+        (low, high) of the difference of the means in seconds.
+    """
+    mean_b, mean_c = statistics.fmean(baseline), statistics.fmean(current)
+    var_b = statistics.variance(baseline) / len(baseline)
+    var_c = statistics.variance(current) / len(current)
+    diff = mean_c - mean_b
+    if var_b + var_c == 0:
+        return diff / mean_b, (diff, diff)
+    # Welch–Satterthwaite degrees of freedom
+    df = (var_b + var_c) ** 2 / (var_b ** 2 / (len(baseline) - 1)
+                                 + var_c ** 2 / (len(current) - 1))
+    margin = t_critical(df) * math.sqrt(var_b + var_c)
+    return diff / mean_b, (diff - margin, diff + margin)
+
+
+def report(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Prints the comparison of two runs.
+
+    Arguments:
+        baseline {dict} -- samples of the earlier run.
+        current {dict} -- samples of the new run.
+        threshold {float} -- relative slowdown which counts as a regression.
+
+    Returns:
+        list -- the (program, stage) keys which regressed.
+    """
+    regressions = []
+    print("{:<20}{:<12}{:>12}{:>12}{:>9}  {}".format(
+        "program", "stage", "baseline", "current", "change",
+        "95% CI of difference"))
+    for key in sorted(current):
+        if key not in baseline or len(baseline[key]) < 2 \
+                or len(current[key]) < 2:
+            continue
+        change, (low, high) = compare(baseline[key], current[key])
+        regressed = change > threshold and low > 0
+        if regressed:
+            regressions.append(key)
+        print("{:<20}{:<12}{:>10.3f}ms{:>10.3f}ms{:>+8.1%}  "
+              "[{:+.3f}ms, {:+.3f}ms]{}".format(
+                  key[0], key[1], statistics.fmean(baseline[key]) * 1000,
+                  statistics.fmean(current[key]) * 1000, change,
+                  low * 1000, high * 1000,
+                  "  REGRESSION" if regressed else ""))
+    return regressions
+
+
+def run(args) -> int:
+    """
+    Runs the corpus, stores the run and compares it with the baseline.
+
+    Returns:
+        int -- exit code, 1 if any stage regressed.
+    """
+    samples = {}
+    for name, lines in corpus().items():
+        time_stages(lines)  # warm up
+        for _ in range(args.samples):
+            for stage, seconds in time_stages(lines).items():
+                samples.setdefault((name, stage), []).append(seconds)
+    samples.update(time_startup(args.samples))
+    db = sqlite3.connect(args.db)
+    db.executescript(SCHEMA)
+    baseline_id = args.baseline or previous_run(db)
+    run_id = record_run(db, samples) if not args.no_store else None
+    if baseline_id is None:
+        print("No earlier run on this machine, stored run {}".format(run_id))
+        return 0
+    print("Run {} compared with run {}".format(run_id or "(not stored)",
+                                               baseline_id))
+    regressions = report(load_run(db, baseline_id), samples, args.threshold)
+    if regressions:
+        print("{} stage(s) regressed by more than {:.0%}".format(
+            len(regressions), args.threshold))
+        return 1
+    return 0
+
+
+def history(args) -> int:
+    """
+    Lists the stored runs.
+    """
+    db = sqlite3.connect(args.db)
+    db.executescript(SCHEMA)
+    for row in db.execute(
+            "SELECT runs.id, created, git_commit, machine, SUM(seconds) "
+            "FROM runs JOIN samples ON samples.run_id = runs.id "
+            "GROUP BY runs.id ORDER BY runs.id"):
+        print("{:>4}  {}  {:<48}  {}  {:8.3f}s".format(*row))
+    return 0
+
+
+def expressions(args) -> int:
+    """
+    Times the parsing and the evaluation of deeply nested and very long
+    expressions and checks that operators associate correctly. The parse
+    time is compared with the recursive descent parser which precedence
+    climbing replaced, both under the recursion limit of the interpreter.
+    The parser does not recurse, but the optimizers and the interpreter
+    walk the parse tree recursively, so an expression nested more than
+    about 3000 operators deep parses but can not be run.
+
+    Returns:
+        int -- exit code, 1 if an expression evaluated to a wrong value.
+    """
+    if sys.getrecursionlimit() < RECURSION_LIMIT:
+        sys.setrecursionlimit(RECURSION_LIMIT)
+    failed = too_deep = 0
+    print("{:<8}{:>14}  {:>12}  {:>12}  {:>8}  {:>12}".format(
+        "", "", "parse", "recursive", "speedup", "run"))
+    for depth in (100, 1000, args.depth):
+        nested = "PRINT " + "(" * depth + "1" + ")" * depth
+        chain = "PRINT 1" + " - 1" * depth
+        for name, source, expected in (("nested", nested, 1),
+                                       ("chain", chain, 1 - depth)):
+            # both parsers parse the same tokens, scanning is not timed, and
+            # the best of a few parses is taken
+            tokens = Scanner([source]).tokens()
+            times = []
+            for parser_class in (Parser, RecursiveDescentParser):
+                best = None
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    try:
+                        parser_class(TokenReplay(tokens)).program()
+                    except RecursionError:
+                        break
+                    seconds = time.perf_counter() - start
+                    best = seconds if best is None else min(best, seconds)
+                times.append(best)
+            parsed, baseline = times
+            parser = Parser(TokenReplay(tokens))
+            program = parser.program()
+            start = time.perf_counter()
+            output = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(output):
+                    Interpreter(parser).run(program)
+            except RecursionError:
+                result = "too deep"
+                too_deep += 1
+            else:
+                value = float(output.getvalue())
+                result = "{:10.3f}ms".format(
+                    (time.perf_counter() - start) * 1000)
+                if value != expected:
+                    result += "  {} expected {}".format(value, expected)
+                    failed += 1
+            print("{:<8}{:>7} levels  {:>10.3f}ms  {:>12}  {:>8}  {:>12}"
+                  .format(name, depth, parsed * 1000,
+                          "too deep" if baseline is None else
+                          "{:10.3f}ms".format(baseline * 1000),
+                          "" if baseline is None else
+                          "{:.1f}x".format(baseline / parsed), result))
+    if too_deep:
+        print("{} expressions are too deep to run, the interpreter walks "
+              "the parse tree\nrecursively".format(too_deep))
+    for source, expected in (("1 - 2 - 3", -4), ("8 / 4 / 2", 1),
+                             ("-2 + 3", 1), ("2 + 3 * 4", 14),
+                             ("-(2 + 3) * 4", -20), ("2 * -3 - 1", -7)):
+        parser = Parser(Scanner(["PRINT " + source]))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            Interpreter(parser).interpret()
+        value = float(output.getvalue())
+        print("{:<16} = {:<6}{}".format(source, value,
+                                        "" if value == expected else
+                                        "  expected {}".format(expected)))
+        failed += value != expected
+    return 1 if failed else 0
+
+
+def variables_program(count: int) -> str:
+    """
+    Returns a program assigning a computed value to each of a number of
+    distinct variables, alternately an integer and a float.
+    """
+    lines = ["LET v{0} = {0} * 3\n".format(i) if i % 2 == 0 else
+             "LET v{0} = {0} / 4\n".format(i) for i in range(count)]
+    lines.append("PRINT v{}\n".format(count - 1))
+    return "".join(lines)
+
+
+def peak_rss(command: list) -> tuple:
+    """
+    Runs a command and measures its peak resident set size.
+
+    Returns:
+        tuple -- the peak resident set size in bytes and the seconds the
+        command took.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    seconds = time.perf_counter() - start
+    # wait4 reaped the process, Popen must not wait for it again
+    process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) \
+        else -os.WTERMSIG(status)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return usage.ru_maxrss * scale, seconds
+
+
+def memory(args) -> int:
+    """
+    Prints the peak resident set size of a program with a huge number of
+    variables run with the dict and with the compact enviornment.
+
+    Returns:
+        int -- exit code, 1 if the peak can not be measured here.
+    """
+    if not hasattr(os, "wait4"):
+        print("Measuring the peak resident set size needs os.wait4")
+        return 1
+    interpreter = os.path.join(SRC_DIR, "basic_interpreter.py")
+    peaks = {}
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "variables.bas")
+        with open(source, "w") as f:
+            f.write(variables_program(args.variables))
+        for name, options in (("dict", []), ("compact", ["--compact-env"])):
+            peak, seconds = peak_rss([sys.executable, interpreter, source] +
+                                     options)
+            peaks[name] = peak
+            print("{:<10}{:>10.1f}MiB peak RSS  {:8.3f}s".format(
+                name, peak / 2 ** 20, seconds))
+    print("{:,} variables, {:.1f} bytes less per variable".format(
+        args.variables, (peaks["dict"] - peaks["compact"]) / args.variables))
+    return 0
+
+
+def startup(args) -> int:
+    """
+    Prints the startup time of the startup program and the modules which
+    take the longest to import.
+
+    Returns:
+        int -- exit code, always 0.
+    """
+    env = startup_env()
+    with tempfile.TemporaryDirectory() as directory:
+        commands = startup_commands(directory)
+        for name, command in commands.items():
+            seconds = []
+            imports = {}
+            for _ in range(args.samples):
+                start = time.perf_counter()
+                subprocess.run(command, env=env, check=True,
+                               stdout=subprocess.DEVNULL)
+                seconds.append(time.perf_counter() - start)
+                for module, us in import_times(command, env).items():
+                    imports.setdefault(module, []).append(us)
+            total = sum(statistics.median(us) for us in imports.values())
+            print("{:<10}{:>8.1f}ms  (imports {:.1f}ms)".format(
+                name, statistics.median(seconds) * 1000, total / 1000))
+            slowest = sorted(imports.items(),
+                             key=lambda item: -statistics.median(item[1]))
+            for module, us in slowest[:args.top]:
+                print("    {:<28}{:>8.2f}ms".format(
+                    module, statistics.median(us) / 1000))
+    return 0
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    The benchmark can be run with the following command:
+
+    python3 basic_benchmark.py run [--samples N] [--threshold 0.1]
+
+    The exit code is 1 if a stage regressed compared with the previous
+    run on this machine. Stored runs can be listed with:
+
+    python3 basic_benchmark.py history
+
+    The startup time of a tiny program and the slowest imports are shown
+    with:
+
+    python3 basic_benchmark.py startup [--samples N] [--top N]
+
+    The parsing and evaluation of deeply nested expressions is timed
+    with:
+
+    python3 basic_benchmark.py expressions [--depth N] [--repeat N]
+
+    The peak memory of a program with a million variables with either
+    enviornment is compared with:
+
+    python3 basic_benchmark.py memory [--variables N]
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Benchmark the BASIC interpreter stages.")
+    arg_parser.add_argument("--db", default="bench_history.sqlite",
+                            help="SQLite file with the benchmark history")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmark corpus")
+    run_parser.add_argument("--samples", type=int, default=10,
+                            help="samples per program and stage")
+    run_parser.add_argument("--threshold", type=float, default=0.1,
+                            help="relative slowdown counted as regression")
+    run_parser.add_argument("--baseline", type=int,
+                            help="run id to compare with")
+    run_parser.add_argument("--no-store", action="store_true",
+                            help="do not store this run")
+    run_parser.set_defaults(func=run)
+    history_parser = commands.add_parser("history", help="list stored runs")
+    history_parser.set_defaults(func=history)
+    expressions_parser = commands.add_parser(
+        "expressions", help="time deeply nested expressions")
+    expressions_parser.add_argument("--depth", type=int, default=10000,
+                                    help="deepest nesting level")
+    expressions_parser.add_argument("--repeat", type=int, default=5,
+                                    help="times each expression is parsed")
+    expressions_parser.set_defaults(func=expressions)
+    startup_parser = commands.add_parser(
+        "startup", help="time the startup and the imports")
+    startup_parser.add_argument("--samples", type=int, default=10,
+                                help="runs of each command")
+    startup_parser.add_argument("--top", type=int, default=10,
+                                help="number of imports listed")
+    startup_parser.set_defaults(func=startup)
+    memory_parser = commands.add_parser(
+        "memory", help="compare the peak memory of the enviornments")
+    memory_parser.add_argument("--variables", type=int, default=10 ** 6,
+                               help="number of variables of the program")
+    memory_parser.set_defaults(func=memory)
+    args = arg_parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+Python Implementation of Checkpointing for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import hashlib
+import json
+import os
+import signal
+import zlib
+from array import array
+from basic_interpreter import Interpreter, InterpreterError, Halt, Jump
+from basic_parser import Parser
+from basic_program import Statement, Program
+
+"""
+This file includes an interpreter which can snapshot its full execution
+state to a file and resume a program from such a snapshot. The state
+consists of the enviornment, the position of the next statement within
+the nested DO WHILE/IF bodies and the output buffered so far. Snapshots
+are taken at statement boundaries whenever a checkpoint was requested,
+either by the interval timer or by a signal. While a subroutine called by
+GOSUB runs, the checkpoint is delayed until it returns, as the position
+of the GOSUB statements is not part of the state:
+
+    SIGALRM  (interval timer) write a checkpoint and continue
+    SIGUSR1  write a checkpoint and continue
+    SIGTERM  write a checkpoint and stop
+"""
+
+# format version of checkpoint files
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointExit(Exception):
+    """
+    Raised after the final checkpoint has been written when the
+    interpreter was asked to stop (SIGTERM).
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def __str__(self) -> str:
+        return "Checkpoint written to {}".format(self.filename)
+
+
+def fingerprint(source: str, *options) -> str:
+    """
+    Computes the fingerprint of a program which is stored in checkpoints
+    so a checkpoint is never resumed with a different program.
+
+    Arguments:
+        source {str} -- The BASIC source code.
+        options -- Any options which change the shape of the parsed program.
+
+    Returns:
+        str -- hex digest identifying the program.
+    """
+    digest = hashlib.sha256(source.encode())
+    digest.update(repr(options).encode())
+    return digest.hexdigest()
+
+
+def save_checkpoint(filename: str, state: dict):
+    """
+    Atomically writes a compressed checkpoint file.
+
+    Arguments:
+        filename {str} -- The checkpoint file.
+        state {dict} -- The execution state to save.
+    """
+    data = json.dumps(state, separators=(",", ":")).encode()
+    temp = filename + ".tmp"
+    with open(temp, "wb") as f:
+        f.write(zlib.compress(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, filename)
+
+
+def load_checkpoint(filename: str) -> dict:
+    """
+    Reads a checkpoint file written by save_checkpoint.
+
+    Arguments:
+        filename {str} -- The checkpoint file.
+
+    Raises:
+        InterpreterError: If the file is not a valid checkpoint.
+
+    Returns:
+        dict -- The saved execution state.
+    """
+    with open(filename, "rb") as f:
+        try:
+            state = json.loads(zlib.decompress(f.read()))
+        except (zlib.error, ValueError):
+            raise InterpreterError("Invalid checkpoint file " + filename)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise InterpreterError("Unsupported checkpoint version")
+    return state
+
+
+class CheckpointInterpreter(Interpreter):
+    """
+    Interpreter which keeps track of its position in the program so the
+    execution can be checkpointed and later resumed. Output is buffered
+    and written when the program finishes, so it can be part of the
+    checkpoint.
+    """
+
+    def __init__(self, parser: Parser, filename: str, program_id: str,
+                 interval: float = None):
+        """
+        Arguments:
+            parser {Parser} -- The parser of the program.
+            filename {str} -- The checkpoint file.
+            program_id {str} -- Fingerprint of the program.
+            interval {float} -- Seconds between checkpoints, or None to only
+            checkpoint on signals.
+        """
+        super().__init__(parser)
+        self.filename = filename
+        self.program_id = program_id
+        self.interval = interval
+        self.requested = False
+        self.stop = False
+
+    def run(self, program: Program, state: dict = None):
+        """
+        Executes a program, optionally resuming from a saved state. The
+        checkpoint file is removed once the program completes.
+
+        Arguments:
+            program {Program} -- The program to execute.
+            state {dict} -- A state returned by load_checkpoint.
+
+        Raises:
+            InterpreterError: If the state belongs to another program.
+            CheckpointExit: If execution was stopped by SIGTERM.
+        """
+        self.start(program)
+        self.output = []
+        self.path = []
+        self.resume = []
+        if state is not None:
+            if state["program"] != self.program_id:
+                raise InterpreterError("Checkpoint is for another program")
+            # restored into the mapping type of the enviornment
+            self.env = self.environment()
+            self.env.update(state["env"])
+            self.arrays = {identifier: array(typecode, values)
+                           for identifier, (typecode, values)
+                           in state.get("arrays", {}).items()}
+            self.data_pointer = state.get("data_pointer", 0)
+            # skip the input which was read before the checkpoint
+            for channel, count in state.get("inputs", {}).items():
+                self.input_channel(int(channel)).skip(count)
+            self.output = state["output"]
+            self.resume = state["path"]
+        handlers = self.install_handlers()
+        try:
+            self.run_from(None)
+        except Halt:
+            pass
+        finally:
+            self.restore_handlers(handlers)
+        for line in self.output:
+            print(line)
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def install_handlers(self) -> dict:
+        """
+        Installs the signal handlers and the interval timer which request
+        checkpoints.
+
+        Returns:
+            dict -- the previous handler of each signal.
+        """
+        handlers = {}
+        for signum, handler in ((signal.SIGUSR1, self.request),
+                                (signal.SIGTERM, self.request_stop),
+                                (signal.SIGALRM, self.request)):
+            handlers[signum] = signal.signal(signum, handler)
+        if self.interval:
+            signal.setitimer(signal.ITIMER_REAL, self.interval,
+                             self.interval)
+        return handlers
+
+    def restore_handlers(self, handlers: dict):
+        """
+        Stops the interval timer and restores the previous signal handlers.
+        """
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+
+    def request(self, signum, frame):
+        """
+        Signal handler requesting a checkpoint at the next statement.
+        """
+        self.requested = True
+
+    def request_stop(self, signum, frame):
+        """
+        Signal handler requesting a final checkpoint at the next statement.
+        """
+        self.requested = True
+        self.stop = True
+
+    def checkpoint(self):
+        """
+        Writes the current execution state to the checkpoint file.
+
+        Raises:
+            CheckpointExit: If a stop was requested.
+        """
+        self.requested = False
+        save_checkpoint(self.filename, {
+            "version": CHECKPOINT_VERSION,
+            "program": self.program_id,
+            "env": dict(self.env),
+            "arrays": {identifier: (values.typecode, values.tolist())
+                       for identifier, values in self.arrays.items()},
+            "data_pointer": self.data_pointer,
+            "inputs": {channel: reader.count
+                       for channel, reader in self.inputs.items()},
+            "path": self.path,
+            "output": self.output,
+        })
+        if self.stop:
+            raise CheckpointExit(self.filename)
+
+    def run_from(self, index: int):
+        """
+        Executes the top-level statements from an index to the end of the
+        program, following GOTO statements.
+
+        Arguments:
+            index {int} -- The index of the first statement, None to start
+            at the saved index when resuming.
+        """
+        depth = len(self.path)
+        while True:
+            try:
+                self.execute_block(self.statements, index)
+                return
+            except Jump as jump:
+                # the bodies left by the jump did not pop their index
+                del self.path[depth:]
+                index = jump.index
+
+    def execute_block(self, statements: list, start: int = None):
+        """
+        Executes a list of statements while recording the index of the
+        current statement in the path. When resuming, execution starts at
+        the saved index instead of the first statement.
+
+        Arguments:
+            statements {list} -- The statements of the block.
+            start {int} -- The index of the first statement to execute.
+        """
+        if start is None:
+            start = self.resume.pop(0) if self.resume else 0
+        path = self.path
+        depth = len(path)
+        path.append(start)
+        for index in range(start, len(statements)):
+            path[depth] = index
+            if self.requested and not self.gosub_depth:
+                self.checkpoint()
+            self.execute(statements[index])
+        path.pop()
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        """
+        Visit method for a do while statement. When resuming inside the
+        body the remainder of the interrupted iteration is run before the
+        condition is evaluated again.
+
+        Arguments:
+            dowhile_stmnt {Statement.DoWhile} -- The do while statement
+            visited.
+        """
+        if self.resume:
+            self.execute_block(dowhile_stmnt.body)
+        while self.evaluate(dowhile_stmnt.rel_expr):
+            self.execute_block(dowhile_stmnt.body)
+
+    def visit_if(self, if_stmnt: Statement.If):
+        """
+        Visit method for an if statement. When resuming inside the body
+        the condition is not evaluated again.
+
+        Arguments:
+            if_stmnt {Statement.If} -- The if statement visited.
+        """
+        if self.resume or self.evaluate(if_stmnt.rel_expr):
+            self.execute_block(if_stmnt.body)
+
+    def visit_gosub(self, gosub_stmnt: Statement.Gosub):
+        """
+        Visit method for a GOSUB statement. The path is restored after the
+        subroutine, which may return from within nested bodies.
+
+        Arguments:
+            gosub_stmnt {Statement.Gosub} -- The GOSUB statement visited.
+        """
+        depth = len(self.path)
+        try:
+            super().visit_gosub(gosub_stmnt)
+        finally:
+            del self.path[depth:]
+
+    def visit_guarded(self, guarded_stmnt: Statement.Guarded):
+        """
+        Visit method for a loop with hoisted bounds checks. The original
+        loop is always executed, so a checkpoint taken inside it resumes
+        the same loop whatever the checks would give.
+
+        Arguments:
+            guarded_stmnt {Statement.Guarded} -- The guarded loop visited.
+        """
+        guarded_stmnt.fallback.accept(self)
+
+    def print_value(self, value):
+        """
+        Buffers the value of a PRINT statement.
+        """
+        self.output.append(str(value))
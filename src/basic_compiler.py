@@ -0,0 +1,542 @@
+"""
+Python Implementation of an Ahead-of-Time Compiler for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import hashlib
+import importlib.util
+import math
+import os
+import re
+import sys
+from basic_interpreter import Interpreter, resolve_functions, help_formatter
+from basic_optimizer import data_statements, definitions
+from basic_parser import Parser, ParserError
+from basic_program import ExpressionVisitor, Expression, StatementVisitor
+from basic_program import Statement, Program
+from basic_runtime import InterpreterError, open_inputs, run_module
+from basic_scanner import Scanner, ScannerError
+from basic_tokens import Operators, Keywords
+
+"""
+This file includes an ahead-of-time compiler which translates a program to
+a Python module, and the loader which runs such a module in place of the
+program. The module only imports basic_runtime.py, which has to be
+importable wherever the module is run. Variables become local variables
+of the run() function of the module (v_ followed by the BASIC identifier,
+a_ for arrays), DO WHILE and IF become while and if statements and
+functions defined by DEF become nested functions, so running a compiled
+program neither scans, parses nor walks a tree. Every line of run() is
+mapped to the BASIC line it was compiled from in the LINES table of the
+module, which is used to report errors against the source file.
+
+The loader compiles a program to <name>.py next to <name>.bas, and uses
+that module as long as it was compiled from the same source text, whose
+SHA-256 hash is recorded in its first line, by the same version of the
+compiler. Programs using GOTO, GOSUB or RETURN can not
+be compiled to structured Python code, they are interpreted instead.
+"""
+
+# version of the generated code, modules of another version are compiled
+# again
+FORMAT = 3
+# first line of every compiled module, with the hash of the source text,
+# only files starting with it are replaced by the loader
+MARKER = "# Compiled from {} by basic_compiler.py (format {}, source {}), " \
+    "do not edit"
+MARKER_PATTERN = re.compile(
+    r"# Compiled from .* by basic_compiler\.py \(format (\d+)"
+    r"(?:, source ([0-9a-f]+))?\)")
+
+# Python operators of the BASIC operators
+SYMBOLS = {
+    Operators.ADD_OP: "+",
+    Operators.SUB_OP: "-",
+    Operators.MULT_OP: "*",
+    Operators.DIV_OP: "/",
+    Operators.EQUAL_OP: "==",
+    Operators.LESS_THAN: "<",
+    Operators.GREATER_THAN: ">",
+    Operators.NOT_GREATER: "<=",
+    Operators.NOT_LESS: ">=",
+    Keywords.AND: "and",
+    Keywords.OR: "or",
+}
+
+
+class CompileError(Exception):
+    """
+    Exception class for a program which can not be compiled.
+    """
+
+    def __init__(self, err: str):
+        self.err = err
+
+    def __str__(self):
+        return "CompileError: {}".format(self.err)
+
+
+class Compiler(StatementVisitor, ExpressionVisitor):
+    """
+    Visitor which translates a program to the source of a Python module.
+    Statements emit lines of code, expressions return Python expressions,
+    which are fully parenthesized as BASIC comparisons do not chain.
+    """
+
+    def __init__(self):
+        # lines of run() and the BASIC line of each
+        self.code = []
+        self.lines = []
+        self.indent = 1
+        self.line = None
+        self.data_count = 0
+        # whether the code converts the storage of arrays
+        self.arrays = False
+
+    def compile(self, program: Program, source: str,
+                digest: str = "") -> str:
+        """
+        Compiles a program.
+
+        Arguments:
+            program {Program} -- The program to compile.
+            source {str} -- The name of the BASIC file, used in errors.
+            digest {str} -- The hash of the source text, see source_hash.
+
+        Raises:
+            CompileError: If the program jumps, or the generated code is too
+            deeply nested for Python.
+            InterpreterError: If a function call can not be resolved.
+
+        Returns:
+            str -- The source of the module.
+        """
+        program = resolve_functions(program)
+        data = [value for data_stmnt in data_statements(program.statements)
+                for value in data_stmnt.values]
+        self.data_count = len(data)
+        self.code, self.lines = [], []
+        self.arrays = False
+        self.emit("if inputs is None:")
+        self.emit("    inputs = {}")
+        for def_stmnt in definitions(program.statements):
+            # defined first, a function can be called before its DEF
+            self.execute(def_stmnt)
+        if data:
+            self.emit("data_pointer = 0")
+        self.block(program.statements)
+        header = [
+            MARKER.format(source, FORMAT, digest),
+            '"""',
+            "BASIC program {} compiled ahead of time, run it with".format(
+                source),
+            "basic_runtime.py on the Python path.",
+            '"""',
+            "import sys",
+            "from basic_runtime import InterpreterError, make_array, "
+            "subscript",
+            "from basic_runtime import input_channel, next_input",
+        ]
+        if self.arrays:
+            # only imported by programs storing array elements
+            header.append("from array import array")
+        header += [
+            "",
+            "FORMAT = {}".format(FORMAT),
+            "SOURCE = {!r}".format(source),
+            "DATA = ({})".format("".join(
+                self.literal(value) + ", " for value in data)),
+            "",
+            "",
+            "def run(inputs=None):",
+        ]
+        first = len(header) + 1
+        line_map = {first + number: line
+                    for number, line in enumerate(self.lines)
+                    if line is not None}
+        footer = [
+            "",
+            "",
+            "# BASIC line of each line of run()",
+            "LINES = {!r}".format(line_map),
+            "",
+            'if __name__ == "__main__":',
+            "    from basic_runtime import run_module",
+            "    run_module(sys.modules[__name__], sys.argv[1:])",
+        ]
+        module = "\n".join(header + self.code + footer) + "\n"
+        try:
+            compile(module, source, "exec")
+        except (SyntaxError, RecursionError, MemoryError):
+            raise CompileError("{} is too deeply nested to be compiled"
+                               .format(source))
+        return module
+
+    def emit(self, text: str):
+        """
+        Appends a line of code to run(), at the current indentation.
+        """
+        self.code.append("    " * self.indent + text)
+        self.lines.append(self.line)
+
+    def execute(self, statement: Statement):
+        self.line = getattr(statement, "line", self.line)
+        statement.accept(self)
+
+    def evaluate(self, exp: Expression) -> str:
+        return exp.accept(self)
+
+    def block(self, statements: list):
+        """
+        Emits the statements of a body, an empty body is a pass.
+        """
+        start = len(self.code)
+        for statement in statements:
+            if not isinstance(statement, Statement.Def):
+                self.execute(statement)
+        if len(self.code) == start:
+            self.emit("pass")
+
+    def literal(self, value) -> str:
+        if isinstance(value, float) and not math.isfinite(value):
+            # folded constants can overflow, inf and nan have no literal
+            return "float({!r})".format(repr(value))
+        return repr(value)
+
+    def visit_binary(self, binary_exp: Expression.Binary) -> str:
+        return "({} {} {})".format(self.evaluate(binary_exp.l_expr),
+                                   SYMBOLS[binary_exp.operator],
+                                   self.evaluate(binary_exp.r_expr))
+
+    def visit_unary(self, unary_exp: Expression.Unary) -> str:
+        if unary_exp.operator == Operators.SUB_OP:
+            return "(-{})".format(self.evaluate(unary_exp.expr))
+        return self.evaluate(unary_exp.expr)
+
+    def visit_literal(self, literal_exp: Expression.Literal) -> str:
+        return self.literal(literal_exp.value)
+
+    def visit_grouping(self, grouping_exp: Expression.Grouping) -> str:
+        return self.evaluate(grouping_exp.expr)
+
+    def visit_variable(self, variable_exp: Expression.Variable) -> str:
+        return "v_" + variable_exp.identifier
+
+    def visit_compare(self, compare_exp: Expression.Compare) -> str:
+        return "(v_{} {} {})".format(compare_exp.identifier,
+                                     SYMBOLS[compare_exp.operator],
+                                     self.literal(compare_exp.value))
+
+    def visit_logical(self, logical_exp: Expression.Logical) -> str:
+        # Python returns the deciding operand, BASIC a bool
+        return "bool{}".format(self.condition(logical_exp))
+
+    def visit_not(self, not_exp: Expression.Not) -> str:
+        return self.condition(not_exp)
+
+    def condition(self, exp: Expression) -> str:
+        """
+        Returns the Python expression of the condition of a loop or if
+        statement. AND, OR and NOT become the Python operators, which
+        Python compiles to jumps past the operands that do not decide the
+        condition, and the comparisons are tested without converting them
+        to bool first.
+        """
+        if isinstance(exp, Expression.Logical):
+            return "({} {} {})".format(self.condition(exp.l_expr),
+                                       SYMBOLS[exp.operator],
+                                       self.condition(exp.r_expr))
+        if isinstance(exp, Expression.Not):
+            return "(not {})".format(self.condition(exp.expr))
+        if isinstance(exp, Expression.Grouping):
+            return self.condition(exp.expr)
+        return self.evaluate(exp)
+
+    def visit_index(self, index_exp: Expression.Index) -> str:
+        index = self.evaluate(index_exp.index)
+        if index_exp.checked:
+            index = "subscript(a_{}, {})".format(index_exp.identifier, index)
+        return "a_{}[{}]".format(index_exp.identifier, index)
+
+    def visit_call(self, call_exp: Expression.Call) -> str:
+        return "f_{}({})".format(call_exp.name, ", ".join(
+            self.evaluate(arg) for arg in call_exp.args))
+
+    def visit_parameter(self, parameter_exp: Expression.Parameter) -> str:
+        return "p{}".format(parameter_exp.index)
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        self.emit("v_{} = {}".format(assign_stmnt.identifier,
+                                     self.evaluate(assign_stmnt.expr)))
+
+    def visit_print(self, print_stmnt: Statement.Print):
+        self.emit("print({})".format(self.evaluate(print_stmnt.expr)))
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        self.emit("while {}:".format(self.condition(dowhile_stmnt.rel_expr)))
+        self.indent += 1
+        self.block(dowhile_stmnt.body)
+        self.indent -= 1
+
+    def visit_if(self, if_stmnt: Statement.If):
+        self.emit("if {}:".format(self.condition(if_stmnt.rel_expr)))
+        self.indent += 1
+        self.block(if_stmnt.body)
+        self.indent -= 1
+
+    def visit_end(self, end_stmnt: Statement.End):
+        if not end_stmnt.placeholder:
+            self.emit("return")
+
+    def visit_increment(self, increment_stmnt: Statement.Increment):
+        self.emit("v_{} += {}".format(increment_stmnt.identifier,
+                                      self.literal(increment_stmnt.step)))
+
+    def visit_print_variable(self, print_stmnt: Statement.PrintVariable):
+        self.emit("print(v_{})".format(print_stmnt.identifier))
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        self.emit("a_{} = make_array({})".format(
+            dim_stmnt.identifier, self.evaluate(dim_stmnt.bound)))
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        self.store_element(assign_stmnt.identifier, assign_stmnt.index,
+                           assign_stmnt.checked,
+                           self.evaluate(assign_stmnt.expr))
+
+    def visit_guarded(self, guarded_stmnt: Statement.Guarded):
+        # the loop checks its subscripts, like on the virtual machine
+        self.execute(guarded_stmnt.fallback)
+
+    def visit_data(self, data_stmnt: Statement.Data):
+        # the constants of all DATA statements are in the DATA tuple
+        pass
+
+    def visit_read(self, read_stmnt: Statement.Read):
+        for target in read_stmnt.targets:
+            self.emit("if data_pointer == {}:".format(self.data_count))
+            self.emit('    raise InterpreterError("Out of DATA")')
+            self.store(target, "DATA[data_pointer]")
+            self.emit("data_pointer += 1")
+
+    def visit_input(self, input_stmnt: Statement.Input):
+        self.emit("reader = input_channel(inputs, {})".format(
+            input_stmnt.channel))
+        for target in input_stmnt.targets:
+            self.store(target, "next_input(reader, {})".format(
+                input_stmnt.channel))
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        self.emit("def f_{}({}):".format(def_stmnt.name, ", ".join(
+            "p{}".format(index)
+            for index in range(len(def_stmnt.parameters)))))
+        self.emit("    return {}".format(self.evaluate(def_stmnt.expr)))
+
+    def visit_goto(self, goto_stmnt: Statement.Goto):
+        self.jump("GOTO")
+
+    def visit_gosub(self, gosub_stmnt: Statement.Gosub):
+        self.jump("GOSUB")
+
+    def visit_return(self, return_stmnt: Statement.Return):
+        self.jump("RETURN")
+
+    def jump(self, keyword: str):
+        raise CompileError("{} on line {} can not be compiled".format(
+            keyword, self.line))
+
+    def store(self, target: Expression, value: str):
+        """
+        Emits the assignment of a value to the target of a READ or INPUT
+        statement.
+        """
+        if isinstance(target, Expression.Index):
+            self.store_element(target.identifier, target.index,
+                               target.checked, value)
+        else:
+            self.emit("v_{} = {}".format(target.identifier, value))
+
+    def store_element(self, identifier: str, index: Expression,
+                      checked: bool, value: str):
+        """
+        Emits the assignment of a value to an array element, converting
+        the storage of an integer array to floats when the value does not
+        fit into it (see store_element() of basic_interpreter).
+        """
+        self.arrays = True
+        index = self.evaluate(index)
+        if checked:
+            index = "subscript(a_{}, {})".format(identifier, index)
+        self.emit("index = {}".format(index))
+        self.emit("value = {}".format(value))
+        self.emit("try:")
+        self.emit("    a_{}[index] = value".format(identifier))
+        self.emit("except (TypeError, OverflowError):")
+        self.emit('    a_{0} = array("d", a_{0})'.format(identifier))
+        self.emit("    a_{}[index] = value".format(identifier))
+
+
+def compiled_path(filename: str) -> str:
+    """
+    Returns the path of the module compiled from a BASIC file.
+    """
+    return os.path.splitext(filename)[0] + ".py"
+
+
+def source_hash(text: str) -> str:
+    """
+    Returns the hash of the source text of a program, which tells whether
+    a module was compiled from it.
+    """
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def compiled_header(path: str) -> tuple:
+    """
+    Returns the format of a compiled module and the hash of the source it
+    was compiled from, or None if the file does not exist.
+
+    Raises:
+        CompileError: If the file exists and was not written by the
+        compiler, so it must not be replaced.
+    """
+    try:
+        with open(path, "r") as f:
+            first = f.readline()
+    except FileNotFoundError:
+        return None
+    match = MARKER_PATTERN.match(first)
+    if match is None:
+        raise CompileError("{} was not compiled from BASIC and is not "
+                           "replaced".format(path))
+    return int(match.group(1)), match.group(2)
+
+
+def compiled_format(path: str):
+    """
+    Returns the format of a compiled module, or None if the file does not
+    exist.
+
+    Raises:
+        CompileError: If the file exists and was not written by the
+        compiler, so it must not be replaced.
+    """
+    header = compiled_header(path)
+    return header and header[0]
+
+
+def compile_file(filename: str, path: str = None) -> str:
+    """
+    Compiles a BASIC file to a Python module.
+
+    Arguments:
+        filename {str} -- The BASIC source file.
+        path {str} -- The module written, <name>.py by default.
+
+    Returns:
+        str -- The path of the module.
+    """
+    path = path or compiled_path(filename)
+    compiled_format(path)
+    with open(filename, "r") as f:
+        text = f.read()
+    program = Parser(Scanner(text.splitlines(keepends=True))).program()
+    module = Compiler().compile(program, os.path.basename(filename),
+                                source_hash(text))
+    # written under another name first, so a module is never half written
+    temporary = path + ".tmp"
+    with open(temporary, "w") as f:
+        f.write(module)
+    os.replace(temporary, path)
+    return path
+
+
+def load(filename: str, path: str = None):
+    """
+    Returns the module compiled from a BASIC file, compiling it first if
+    it is missing, of another format or compiled from another source text
+    (another file or an earlier version of the file, whatever its
+    modification time).
+
+    Arguments:
+        filename {str} -- The BASIC source file.
+        path {str} -- The compiled module, <name>.py by default.
+
+    Returns:
+        module -- The module, whose run() executes the program.
+    """
+    path = path or compiled_path(filename)
+    with open(filename, "r") as f:
+        digest = source_hash(f.read())
+    if compiled_header(path) != (FORMAT, digest):
+        compile_file(filename, path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    A BASIC file can be compiled to <filename>.py with the command:
+
+    python3 basic_compiler.py <filename> [-o FILE]
+
+    and run from the compiled module, which is compiled again only if the
+    source changed, with:
+
+    python3 basic_compiler.py <filename> --run [--input N=FILE] [--mmap]
+
+    Programs which can not be compiled are interpreted. A compiled module
+    imports basic_runtime.py, with which it can also be run without this
+    script (PYTHONPATH=<directory of basic_runtime.py>):
+
+    python3 <name>.py [N=FILE ...]
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Compile a BASIC source file to a Python module.",
+        formatter_class=help_formatter)
+    arg_parser.add_argument("filename", help="BASIC source file")
+    arg_parser.add_argument("-o", "--output", metavar="FILE",
+                            help="compiled module (<filename>.py by default)")
+    arg_parser.add_argument("--run", action="store_true",
+                            help="run the program from the compiled module")
+    arg_parser.add_argument("--input", action="append", metavar="N=FILE",
+                            help="file of numbers read by INPUT #N")
+    arg_parser.add_argument("--mmap", action="store_true",
+                            help="memory map the input files")
+    args = arg_parser.parse_args()
+    try:
+        if not args.run:
+            path = compile_file(args.filename, args.output)
+            print("Compiled {} to {}".format(args.filename, path),
+                  file=sys.stderr)
+            return
+        # a file which was not compiled is an error, not a reason to
+        # interpret the program
+        compiled_format(args.output or compiled_path(args.filename))
+        try:
+            module = load(args.filename, args.output)
+        except CompileError as e:
+            print("{}, interpreting {}".format(e, args.filename),
+                  file=sys.stderr)
+            with open(args.filename, "r") as f:
+                parser = Parser(Scanner(f.readlines()))
+            interpreter = Interpreter(parser)
+            interpreter.inputs = open_inputs(args.input, args.mmap)
+            interpreter.interpret()
+            return
+        run_module(module, args.input, args.mmap)
+    except (ParserError, ScannerError, InterpreterError, CompileError) as e:
+        print(e)
+    except Exception as e:
+        # print any other errors of an interpreted program
+        print("Uknown Error Occured!")
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Python Implementation of Interpreter Hooks for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+from basic_interpreter import Interpreter, Halt, Jump, SubroutineReturn
+from basic_program import Expression, Statement
+from basic_runtime import subscript
+
+"""
+This file includes a registry of hooks, functions called when the
+interpreter reaches an event, to observe a running program without
+editing the interpreter:
+
+    statement   hook(interpreter, statement) after a statement executed
+    loop        hook(interpreter, dowhile_stmnt, iteration) before every
+                iteration of a DO WHILE loop, counting from 1
+    assignment  hook(interpreter, identifier, index, value) after a
+                variable (index None) or array element was assigned
+    print       hook(interpreter, value) after a value was printed
+    error       hook(interpreter, error, statement) when an error stops
+                the program, with the innermost statement it stopped in
+
+The Interpreter itself has no hooks. instrument() derives a subclass of
+an interpreter class which overrides only the methods of the events with
+registered hooks, so an event without hooks costs nothing and a program
+without hooks runs the original class.
+"""
+
+# the events hooks can be registered for
+EVENTS = ("statement", "loop", "assignment", "print", "error")
+# exceptions which stop statements without being errors
+CONTROL_FLOW = (Halt, Jump, SubroutineReturn)
+
+
+class Hooks:
+    """
+    Registry of the hooks of each event.
+    """
+
+    def __init__(self):
+        self.hooks = {event: [] for event in EVENTS}
+
+    def __bool__(self):
+        return any(self.hooks.values())
+
+    def register(self, event: str, hook):
+        """
+        Registers a hook, hooks of an event are called in the order they
+        were registered.
+
+        Arguments:
+            event {str} -- One of EVENTS.
+            hook {callable} -- The function called on the event, see the
+            signatures above.
+
+        Raises:
+            ValueError: If the event is not known.
+        """
+        if event not in self.hooks:
+            raise ValueError("Unknown event {!r}, expected one of {}".format(
+                event, ", ".join(EVENTS)))
+        self.hooks[event].append(hook)
+        return hook
+
+    def unregister(self, event: str, hook):
+        """
+        Removes a registered hook.
+        """
+        self.hooks[event].remove(hook)
+
+
+def instrument(cls: type, hooks: Hooks) -> type:
+    """
+    Returns a subclass of an interpreter class which calls the registered
+    hooks, or the class itself if no hook is registered. Events which had
+    no hooks when the class was derived are never reported, more hooks can
+    be registered for the other events later.
+
+    Arguments:
+        cls {type} -- Interpreter or a subclass of it.
+        hooks {Hooks} -- The hook registry.
+
+    Raises:
+        TypeError: If loop hooks are registered and the class executes DO
+        WHILE loops on its own.
+    """
+    if not hooks:
+        return cls
+    namespace = {}
+    statement_hooks = hooks.hooks["statement"]
+    error_hooks = hooks.hooks["error"]
+    loop_hooks = hooks.hooks["loop"]
+    assignment_hooks = hooks.hooks["assignment"]
+    print_hooks = hooks.hooks["print"]
+    if error_hooks:
+        def execute(self, statement: Statement):
+            try:
+                cls.execute(self, statement)
+            except CONTROL_FLOW:
+                raise
+            except Exception as e:
+                # reported by the innermost statement only
+                if not getattr(e, "hooked", False):
+                    e.hooked = True
+                    for hook in error_hooks:
+                        hook(self, e, statement)
+                raise
+            for hook in statement_hooks:
+                hook(self, statement)
+        namespace["execute"] = execute
+    elif statement_hooks:
+        def execute(self, statement: Statement):
+            cls.execute(self, statement)
+            for hook in statement_hooks:
+                hook(self, statement)
+        namespace["execute"] = execute
+    if loop_hooks:
+        if cls.visit_dowhile is not Interpreter.visit_dowhile:
+            raise TypeError("{} executes loops on its own, loop hooks are "
+                            "not supported".format(cls.__name__))
+
+        def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+            iteration = 0
+            while self.evaluate(dowhile_stmnt.rel_expr):
+                iteration += 1
+                for hook in loop_hooks:
+                    hook(self, dowhile_stmnt, iteration)
+                for statement in dowhile_stmnt.body:
+                    self.execute(statement)
+        namespace["visit_dowhile"] = visit_dowhile
+    if assignment_hooks:
+        # the base methods are wrapped, expressions have no side effects
+        # so a subscript can be evaluated again to report the element
+        def element(self, identifier: str, index_exp: Expression,
+                    checked: bool):
+            values = self.arrays[identifier]
+            index = self.evaluate(index_exp)
+            if checked:
+                index = subscript(values, index)
+            for hook in assignment_hooks:
+                hook(self, identifier, index, values[index])
+
+        def visit_assignment(self, assign_stmnt: Statement.Assignment):
+            cls.visit_assignment(self, assign_stmnt)
+            for hook in assignment_hooks:
+                hook(self, assign_stmnt.identifier, None,
+                     self.env[assign_stmnt.identifier])
+
+        def visit_increment(self, increment_stmnt: Statement.Increment):
+            cls.visit_increment(self, increment_stmnt)
+            for hook in assignment_hooks:
+                hook(self, increment_stmnt.identifier, None,
+                     self.env[increment_stmnt.identifier])
+
+        def visit_element_assignment(
+                self, assign_stmnt: Statement.ElementAssignment):
+            cls.visit_element_assignment(self, assign_stmnt)
+            element(self, assign_stmnt.identifier, assign_stmnt.index,
+                    assign_stmnt.checked)
+
+        def assign(self, target: Expression, value):
+            cls.assign(self, target, value)
+            if isinstance(target, Expression.Index):
+                element(self, target.identifier, target.index,
+                        target.checked)
+            else:
+                for hook in assignment_hooks:
+                    hook(self, target.identifier, None, value)
+        namespace.update(visit_assignment=visit_assignment,
+                         visit_increment=visit_increment,
+                         visit_element_assignment=visit_element_assignment,
+                         assign=assign)
+    if print_hooks:
+        # both kinds of PRINT statements print the value they evaluated
+        # once with print_value
+        def print_value(self, value):
+            cls.print_value(self, value)
+            for hook in print_hooks:
+                hook(self, value)
+        namespace["print_value"] = print_value
+    return type("Hooked" + cls.__name__, (cls,), namespace)
+
+
+def attach(interpreter: Interpreter, hooks: Hooks) -> Interpreter:
+    """
+    Instruments an interpreter which was already created, by changing its
+    class to the one instrument derives from it.
+
+    Returns:
+        Interpreter -- The interpreter.
+    """
+    interpreter.__class__ = instrument(type(interpreter), hooks)
+    return interpreter
@@ -0,0 +1,309 @@
+"""
+Python Implementation of an Incremental Parser for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import random
+import time
+from basic_scanner import Scanner, ScannerError, TokenBuffer
+from basic_parser import Parser, ParserError
+from basic_program import Program, dump
+from basic_tokens import Delimiters, Keywords, Literals, TOKEN_TYPES
+
+"""
+This file includes an incremental front end for editors and live reload.
+The source is kept as a list of lines with a token cache per line, and the
+parse tree as a list of top-level blocks, each of which is the range of
+lines of one top-level statement (a single line, or a DO WHILE ... LOOP
+or IF ... END IF with everything nested in it). After an edit only the
+changed lines are scanned again, and only the blocks touching the edit
+are parsed again; the statements of every other block are reused. The
+Program returned is identical to the one of a full parse.
+"""
+
+
+class Block:
+    """
+    A range of lines holding one top-level statement and its parse tree,
+    which is None until the block is parsed, and the index of the line
+    the block started at when it was parsed.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.statements = None
+        self.first_line = 0
+
+
+class LineTokens:
+    """
+    Scanner replacement which produces the tokens of a range of lines from
+    the per line token cache, with their absolute positions.
+    """
+
+    def __init__(self, lines: list, first_line: int):
+        """
+        Parameters:
+        lines (list): the cached tokens of each line
+        first_line (int): the index of the first line in the source
+        """
+        self.lines = lines
+        self.first_line = first_line
+
+    def tokens(self) -> TokenBuffer:
+        """
+        Returns the cached tokens in a TokenBuffer, raising the scanner
+        error of a line which could not be scanned.
+        """
+        buffer = TokenBuffer()
+        line_num, end = self.first_line, 1
+        for line_num, tokens in enumerate(self.lines, self.first_line + 1):
+            if isinstance(tokens, ScannerError):
+                raise ScannerError((line_num, tokens.pos[1]))
+            for type, lexeme, col in tokens:
+                buffer.append(type, lexeme, (line_num, col))
+            end = col + len(lexeme) if tokens else 1
+        buffer.append(Delimiters.EOF, "/Z", (line_num, end))
+        return buffer
+
+
+def scan_line(line: str, symbols: dict = None):
+    """
+    Scans a single line.
+
+    Parameters:
+    line (str): the line including its line break
+    symbols (dict): the symbol table of the program
+
+    Returns:
+    the list of (type, lexeme, column) of its tokens, or the ScannerError
+    if the line can not be scanned
+    """
+    try:
+        buffer = Scanner([line], symbols=symbols).tokens()
+    except ScannerError as e:
+        return e
+    # the last token is the EOF token
+    return [(TOKEN_TYPES[type_id], lexeme, col)
+            for type_id, lexeme, col in zip(buffer.types[:-1],
+                                            buffer.lexemes,
+                                            buffer.columns)]
+
+
+def shift_lines(statements: list, offset: int):
+    """
+    Adds an offset to the source lines of statements, including the ones
+    nested in loop and if bodies.
+    """
+    for statement in statements:
+        if hasattr(statement, "line"):
+            statement.line += offset
+        body = getattr(statement, "body", None)
+        if body is not None:
+            shift_lines(body, offset)
+
+
+def nesting(tokens) -> int:
+    """
+    Returns by how much a line changes the nesting depth of DO WHILE and IF
+    bodies, judging only from its first tokens and, for an IF, the token
+    after THEN. A line number is skipped and a single line IF does not
+    open a body.
+    """
+    if isinstance(tokens, ScannerError):
+        return 0
+    if tokens and tokens[0][0] == Literals.INT_LIT:
+        tokens = tokens[1:]
+    if not tokens:
+        return 0
+    first = tokens[0][0]
+    if first == Keywords.DO:
+        return 1
+    if first == Keywords.IF:
+        types = [token[0] for token in tokens]
+        if Keywords.THEN in types:
+            following = types[types.index(Keywords.THEN) + 1:]
+            if following and following[0] != Delimiters.EOL:
+                return 0
+        return 1
+    if first == Keywords.LOOP:
+        return -1
+    if first == Keywords.END and len(tokens) > 1 \
+            and tokens[1][0] == Keywords.IF:
+        return -1
+    return 0
+
+
+class IncrementalParser:
+    """
+    Keeps the tokens and parse tree of a source which is edited line by
+    line.
+    """
+
+    def __init__(self, source: str = ""):
+        """
+        Parameters:
+        source (str): the initial source code
+        """
+        self.cache = {}  # tokens by line text, shared by identical lines
+        self.symbols = {}  # symbol table shared by the scans of all lines
+        self.lines = []
+        self.tokens = []
+        self.depths = []
+        self.blocks = []
+        self.edit(0, 0, source)
+
+    def scan(self, line: str):
+        """
+        Returns the tokens of a line, scanning it if it is not cached.
+        """
+        tokens = self.cache.get(line)
+        if tokens is None:
+            tokens = self.cache[line] = scan_line(line, self.symbols)
+        return tokens
+
+    def edit(self, start: int, end: int, text: str):
+        """
+        Replaces a range of lines with new text.
+
+        Parameters:
+        start (int): index of the first replaced line
+        end (int): index after the last replaced line, equal to start to
+                   insert text before the line start
+        text (str): the new lines
+        """
+        new_lines = text.splitlines(keepends=True)
+        if len(self.cache) > 2 * len(self.lines) + 1024:
+            # forget the tokens of lines which were edited away
+            self.cache = dict(zip(self.lines, self.tokens))
+        new_tokens = [self.scan(line) for line in new_lines]
+        # find the blocks touched by the edit
+        first = last = len(self.blocks)
+        region_start = offset = len(self.lines)
+        line = 0
+        for index, block in enumerate(self.blocks):
+            if line + block.length > start or (
+                    line == start and start == end):
+                first, region_start = index, line
+                break
+            line += block.length
+        line = region_start
+        for index in range(first, len(self.blocks)):
+            line += self.blocks[index].length
+            last = index + 1
+            if line >= end:
+                break
+        offset = max(line, end)
+        if first == len(self.blocks) and first:
+            # appending lines may close an unterminated last block
+            first -= 1
+            region_start -= self.blocks[first].length
+        # replace the lines and their tokens
+        self.lines[start:end] = new_lines
+        self.tokens[start:end] = new_tokens
+        self.depths[start:end] = [nesting(tokens) for tokens in new_tokens]
+        # partition the touched region into blocks again, continuing into
+        # following blocks until a boundary lines up with an old one
+        region_end = offset + len(new_lines) - (end - start)
+        blocks = []
+        line, depth, length = region_start, 0, 0
+        while line < len(self.lines):
+            depth += self.depths[line]
+            length += 1
+            line += 1
+            if depth <= 0:
+                blocks.append(Block(length))
+                depth, length = 0, 0
+                while line > region_end and last < len(self.blocks):
+                    region_end += self.blocks[last].length
+                    last += 1
+                if line == region_end:
+                    break
+        if length:
+            blocks.append(Block(length))
+            last = len(self.blocks)
+        self.blocks[first:last] = blocks
+
+    def program(self) -> Program:
+        """
+        Returns the parse tree of the current source, parsing the blocks
+        which changed since the last call. The source lines of blocks which
+        moved are updated in place.
+
+        Raises:
+            ScannerError: If a line of a changed block can not be scanned.
+            ParserError: If a changed block is not valid.
+
+        Returns:
+            Program -- The parse tree of the current source.
+        """
+        statements = []
+        line = 0
+        for block in self.blocks:
+            if block.statements is None:
+                tokens = self.tokens[line:line + block.length]
+                block.statements = Parser(
+                    LineTokens(tokens, line)).statements()
+            elif block.first_line != line:
+                shift_lines(block.statements, line - block.first_line)
+            block.first_line = line
+            statements.extend(block.statements)
+            line += block.length
+        return Program(statements)
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    The incremental parser can be checked against the full parser with:
+
+    python3 basic_incremental.py <filename> [--edits N]
+
+    Every edit re-types a random line of the file (indenting it by a
+    space) and the resulting parse tree is compared with a full parse. The
+    average time of an incremental update and of a full parse are printed.
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Check and time the incremental parser.")
+    arg_parser.add_argument("filename", help="BASIC source file")
+    arg_parser.add_argument("--edits", type=int, default=100,
+                            help="number of random edits")
+    args = arg_parser.parse_args()
+    with open(args.filename, "r") as f:
+        source = f.read()
+    incremental = IncrementalParser(source)
+    try:
+        incremental.program()
+    except (ScannerError, ParserError) as e:
+        # an invalid source can not be compared
+        print(e)
+        return
+    lines = source.splitlines(keepends=True)
+    incremental_time = full_time = 0
+    for _ in range(args.edits):
+        index = random.randrange(len(lines))
+        # a space appended to a last line without a line break would be
+        # rejected by the scanner, a leading space keeps every line valid
+        lines[index] = " " + lines[index]
+        start = time.perf_counter()
+        incremental.edit(index, index + 1, lines[index])
+        program = incremental.program()
+        incremental_time += time.perf_counter() - start
+        start = time.perf_counter()
+        full = Parser(Scanner(lines)).program()
+        full_time += time.perf_counter() - start
+        if dump(program) != dump(full):
+            print("Mismatch after editing line {}".format(index + 1))
+            return
+    print("{} edits of {} lines, identical to a full parse".format(
+        args.edits, len(lines)))
+    if not args.edits:
+        return
+    print("incremental: {:.3f}ms per edit".format(
+        incremental_time / args.edits * 1000))
+    print("full:        {:.3f}ms per edit".format(
+        full_time / args.edits * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Python Implementation of Buffered Numeric Input for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import mmap
+import os
+import re
+import time
+
+"""
+This file includes the reader behind the INPUT statement. Input files hold
+numbers separated by commas and/or whitespace (CSV or plain columns). The
+file is read in large chunks, optionally through a memory map, and every
+chunk is split and converted in one pass, so a program asking for one
+value at a time only takes the next element of a list. A number split by
+the end of a chunk is carried over to the next chunk.
+"""
+
+# bytes read from the file at a time
+CHUNK_SIZE = 1 << 20
+# a decimal point, exponent or inf/nan marks a float rather than an integer
+FLOAT_MARK = re.compile(rb"[.eEnN]")
+
+
+class InputError(Exception):
+    """
+    Exception class for input which is not a number.
+    """
+
+    def __init__(self, err: str):
+        self.err = err
+
+    def __str__(self):
+        return "InputError: {}".format(self.err)
+
+
+def convert(field: bytes):
+    """
+    Converts a field to an int, or to a float if it has a decimal point,
+    an exponent or is inf/nan.
+
+    Raises:
+        InputError: If the field is not a number.
+    """
+    try:
+        return float(field) if FLOAT_MARK.search(field) else int(field)
+    except ValueError:
+        raise InputError("Invalid number {!r}".format(field.decode(
+            errors="replace")))
+
+
+class NumberReader:
+    """
+    Iterator over the numbers of a binary file, converted a chunk at a
+    time. The number of values taken is kept in count.
+    """
+
+    def __init__(self, f, use_mmap: bool = False,
+                 chunk_size: int = CHUNK_SIZE):
+        """
+        Arguments:
+            f {file} -- A file opened in binary mode.
+            use_mmap {bool} -- Read the file through a memory map, which
+            needs a regular file.
+            chunk_size {int} -- Bytes converted at a time.
+        """
+        self.file = f
+        self.use_mmap = use_mmap
+        self.chunk_size = chunk_size
+        self.count = 0
+        self.values = []
+        self.position = 0
+        self.chunks = self.read_chunks()
+
+    @classmethod
+    def open(cls, filename: str, use_mmap: bool = False):
+        """
+        Opens a file for reading numbers.
+        """
+        return cls(open(filename, "rb"), use_mmap)
+
+    def read_chunks(self):
+        """
+        Generates chunks of the file which end between two numbers.
+        """
+        if self.use_mmap:
+            if os.fstat(self.file.fileno()).st_size == 0:
+                # empty files can not be mapped
+                return
+            with mmap.mmap(self.file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as buffer:
+                start, size = 0, len(buffer)
+                while start < size:
+                    end = start + self.chunk_size
+                    # extend the chunk to the end of the number it splits
+                    while end < size and buffer[end:end + 1] not in \
+                            b" \t\r\n,":
+                        end += 1
+                    yield buffer[start:end]
+                    start = end
+            return
+        rest = b""
+        while True:
+            chunk = self.file.read(self.chunk_size)
+            if not chunk:
+                break
+            chunk = rest + chunk
+            # carry the number split by the end of the chunk over
+            end = max(chunk.rfind(separator) for separator in b" \t\r\n,")
+            rest = chunk[end + 1:]
+            yield chunk[:end + 1]
+        yield rest
+
+    def fill(self) -> bool:
+        """
+        Converts the next chunk which holds numbers.
+
+        Returns:
+            bool -- False at the end of the file.
+        """
+        is_float = FLOAT_MARK.search
+        for chunk in self.chunks:
+            fields = chunk.replace(b",", b" ").split()
+            try:
+                # convert() inlined, as this is the innermost loop
+                self.values = [float(field) if is_float(field)
+                               else int(field) for field in fields]
+            except ValueError:
+                # find the field which is not a number
+                self.values = [convert(field) for field in fields]
+            self.position = 0
+            if self.values:
+                return True
+        return False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.position == len(self.values) and not self.fill():
+            raise StopIteration
+        value = self.values[self.position]
+        self.position += 1
+        self.count += 1
+        return value
+
+    def skip(self, count: int):
+        """
+        Skips values, used to resume reading at a saved count.
+        """
+        for _ in range(count):
+            next(self)
+
+    def close(self):
+        self.chunks.close()
+        self.file.close()
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    The reading speed of a numeric file can be measured with:
+
+    python3 basic_input.py <filename> [--mmap]
+    '''
+    # imported here as programs reading INPUT do not need it
+    import argparse  # import argparse used for CLI options
+    arg_parser = argparse.ArgumentParser(
+        description="Time reading the numbers of a file.")
+    arg_parser.add_argument("filename", help="CSV or whitespace separated "
+                            "file of numbers")
+    arg_parser.add_argument("--mmap", action="store_true",
+                            help="read the file through a memory map")
+    args = arg_parser.parse_args()
+    start = time.perf_counter()
+    reader = NumberReader.open(args.filename, args.mmap)
+    total = 0
+    try:
+        for value in reader:
+            total += value
+    except InputError as e:
+        print(e)
+        return
+    finally:
+        reader.close()
+    elapsed = time.perf_counter() - start
+    print("{} values in {:.3f}s, sum {}".format(reader.count, elapsed,
+                                                total))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,62 +9,246 @@ Created by Nihad Kalathingal and Nick Green on 4/26/2020. Modified (04-26-2020)
     Nihad Kalathingal (nkalathi@students.kennesaw.edu)
     Nick Green (ngreen@students.kennesaw.edu)
 """
+# annotations are not evaluated, so typing is not imported at startup
+from __future__ import annotations
 # import scanner and scanner errors
-from basic_scanner import Scanner, ScannerError
+from basic_scanner import Scanner, ScannerError, token_buffer
 import sys  # import sys used for CLI args
 from basic_parser import ParserError, Parser
 from basic_program import ExpressionVisitor, Expression, StatementVisitor
 from basic_program import Statement, Program
-from typing import Union
-from basic_tokens import Operators, Literals
+from basic_optimizer import Fuser, DeadCodeEliminator
+from basic_optimizer import BoundsCheckHoister, data_statements, walk
+from basic_optimizer import ExpressionRewriter, definitions
+from basic_runtime import InterpreterError, make_array, get_array
+from basic_runtime import subscript, store_element, input_channel
+from basic_runtime import next_input, open_inputs
+from basic_tokens import Operators, Literals, Keywords
+import argparse  # import argparse used for CLI options
+import copy
+import os
+import operator
 
 """
 This file includes the interpreter class which is used to execute/interpret
 a BASIC program using both the parser and scanner.
 """
 
+# comparison functions used by fused comparisons
+COMPARE = {
+    Operators.EQUAL_OP: operator.eq,
+    Operators.LESS_THAN: operator.lt,
+    Operators.GREATER_THAN: operator.gt,
+    Operators.NOT_GREATER: operator.le,
+    Operators.NOT_LESS: operator.ge,
+}
 
-class InterpreterError(Exception):
+# largest number of GOSUB calls which can be active at the same time
+RETURN_STACK_SIZE = 100
+# Python stack depth needed by the tree interpreter, a GOSUB takes a few
+# frames for every body enclosing it and an operator three frames, so
+# expressions nested more than about 3000 operators deep can not be run
+RECURSION_LIMIT = 10000
+
+
+class Halt(Exception):
     """
-    Exception class for a Interpreter error.
-    Used in case a Interpreter error occurs.
+    Raised by the END statement to stop the execution of the program.
     """
+    pass
 
-    def __init__(self, err=None):
-        """
-        Simple constructor to assign InterpreterError attributes.
 
-        Parameters:
-        pos (tuple): tuple of length 2 of the form (row, column)
-        pos (str): string description of an error, a generic error is used
-        if none is given
-        """
+class Jump(Exception):
+    """
+    Raised by the GOTO statement to leave the enclosing bodies and continue
+    at the top-level statement with the given index.
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+
+
+class SubroutineReturn(Exception):
+    """
+    Raised by the RETURN statement to leave the subroutine called by the
+    last GOSUB statement.
+    """
+    pass
+
+
+def jump_table(statements: list) -> dict:
+    """
+    Resolves line numbers to the index of the top-level statement they
+    number, so a jump never searches the program. Every GOTO and GOSUB
+    target is checked once, before the program runs.
 
-        if err is None:
-            # use a default error if none specified
-            err = "Interpreter error occured."
-        self.err = err
+    Arguments:
+        statements {list} -- The top-level statements of a program.
 
-    def __str__(self) -> str:
+    Raises:
+        InterpreterError: If a line number is used twice, or a target is
+        not the number of a top-level statement.
+
+    Returns:
+        dict -- The index of the statement of each line number.
+    """
+    targets = {}
+    for index, statement in enumerate(statements):
+        label = getattr(statement, "label", None)
+        if label is not None:
+            if label in targets:
+                raise InterpreterError(
+                    "Duplicate line number {}".format(label))
+            targets[label] = index
+    labels = {getattr(statement, "label", None)
+              for statement in walk(statements)}
+    for statement in walk(statements):
+        if isinstance(statement, (Statement.Goto, Statement.Gosub)) \
+                and statement.target not in targets:
+            if statement.target in labels:
+                raise InterpreterError(
+                    "Line {} is inside a block and can not be jumped "
+                    "to".format(statement.target))
+            raise InterpreterError("Undefined line number {}".format(
+                statement.target))
+    return targets
+
+
+class FunctionResolver(ExpressionRewriter):
+    """
+    Pass which resolves every call of a function to its DEF statement, so
+    a call never looks a function up by name. The bodies of the functions
+    are resolved as well, each definition once.
+
+    Raises:
+        InterpreterError: If a function is defined twice, is not defined,
+        is called with the wrong number of arguments or calls itself.
+    """
+
+    def __init__(self, statements: list):
+        """
+        Arguments:
+            statements {list} -- The top-level statements of the program.
         """
-        Returns an error message with details of the error.
+        self.definitions = {}
+        for def_stmnt in definitions(statements):
+            if def_stmnt.name in self.definitions:
+                raise InterpreterError("Duplicate function {}".format(
+                    def_stmnt.name))
+            self.definitions[def_stmnt.name] = def_stmnt
+        # definitions with resolved bodies, and the ones being resolved
+        self.resolved = {}
+        self.resolving = set()
+
+    def function(self, name: str) -> Statement.Def:
+        """
+        Returns the definition of a function with its body resolved.
         """
-        return "InterpreterError: {}".format(self.err)
+        resolved = self.resolved.get(name)
+        if resolved is None:
+            if name in self.resolving:
+                raise InterpreterError("Function {} is recursive".format(
+                    name))
+            if name not in self.definitions:
+                raise InterpreterError("Undefined function {}".format(name))
+            self.resolving.add(name)
+            resolved = copy.copy(self.definitions[name])
+            resolved.expr = self.rewrite(resolved.expr)
+            self.resolving.discard(name)
+            self.resolved[name] = resolved
+        return resolved
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        return self.function(def_stmnt.name)
+
+    def visit_call(self, call_exp: Expression.Call):
+        function = self.function(call_exp.name)
+        if len(call_exp.args) != len(function.parameters):
+            raise InterpreterError("{} takes {} arguments, {} given".format(
+                call_exp.name, len(function.parameters),
+                len(call_exp.args)))
+        return Expression.Call(call_exp.name, [self.rewrite(arg)
+                                               for arg in call_exp.args],
+                               function)
+
+
+def resolve_functions(program: Program) -> Program:
+    """
+    Returns a copy of a program in which every call is resolved to the
+    definition of its function, see FunctionResolver.
+    """
+    return FunctionResolver(program.statements).transform(program)
 
 
 class Interpreter(StatementVisitor, ExpressionVisitor):
+    # the mapping type of the enviornment, see basic_memory.Environment
+    environment = dict
+
     def __init__(self, parser: Parser):
         self.parser = parser
+        # NumberReader of each open INPUT channel
+        self.inputs = {}
 
     def interpret(self):
         """
         Interpreting involves retrieving the program from the parser and
         executing in a provided enviornment.
         """
-        self.env = {}
-        program = self.parser.program()
-        for statement in program.statements:
-            self.execute(statement)
+        self.run(self.parser.program())
+
+    def run(self, program: Program):
+        """
+        Executes an already parsed (and possibly optimized) program in a
+        fresh enviornment.
+
+        Arguments:
+            program {Program} -- The program to execute.
+        """
+        self.start(program)
+        try:
+            self.run_from(0)
+        except Halt:
+            pass
+
+    def start(self, program: Program):
+        """
+        Prepares a fresh enviornment for a program without executing it.
+
+        Arguments:
+            program {Program} -- The program to execute.
+        """
+        # raised first, resolving the functions walks every expression
+        if sys.getrecursionlimit() < RECURSION_LIMIT:
+            sys.setrecursionlimit(RECURSION_LIMIT)
+        self.env = self.environment()
+        self.arrays = {}
+        self.data = [value for data_stmnt in data_statements(
+            program.statements) for value in data_stmnt.values]
+        self.data_pointer = 0
+        program = resolve_functions(program)
+        # argument values of the function call being evaluated
+        self.arguments = ()
+        self.statements = program.statements
+        self.targets = jump_table(program.statements)
+        self.gosub_depth = 0
+
+    def run_from(self, index: int):
+        """
+        Executes the top-level statements from an index to the end of the
+        program, following GOTO statements.
+
+        Arguments:
+            index {int} -- The index of the first statement.
+        """
+        statements = self.statements
+        end = len(statements)
+        while index < end:
+            try:
+                while index < end:
+                    self.execute(statements[index])
+                    index += 1
+            except Jump as jump:
+                index = jump.index
 
     def execute(self, statement: Statement):
         """
@@ -75,7 +259,7 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
         """
         statement.accept(self)
 
-    def evaluate(self, exp: Expression) -> Union[float, int]:
+    def evaluate(self, exp: Expression) -> float | int:
         """
         Evaluating an expression is visiting that expression.
 
@@ -87,7 +271,7 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
         """
         return exp.accept(self)
 
-    def visit_binary(self, binary_exp: Expression.Binary) -> Union[float, int]:
+    def visit_binary(self, binary_exp: Expression.Binary) -> float | int:
         """
         Visit method for a binary expression.
         evaluating a binary expression returns the operator appplied to
@@ -125,7 +309,7 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
         else:
             raise InterpreterError("Illegal operator found")
 
-    def visit_unary(self, unary_exp: Expression.Unary) -> Union[float, int]:
+    def visit_unary(self, unary_exp: Expression.Unary) -> float | int:
         """
         Visit method for a unary expression.
         Evaluating a unary expression returns the operator applied to the
@@ -148,7 +332,7 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
             raise InterpreterError("Inavalid unary operator")
 
     def visit_literal(self,
-                      literal_exp: Expression.Literal) -> Union[float, int]:
+                      literal_exp: Expression.Literal) -> float | int:
         """
         Visit method for a literal expression.
         Evaluating a literal returns the value of the literal.
@@ -162,7 +346,7 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
         return literal_exp.value
 
     def visit_grouping(self,
-                       grouping_exp: Expression.Grouping) -> Union[float, int]:
+                       grouping_exp: Expression.Grouping) -> float | int:
         """
         Visit method for a grouping expression.
         The value of a grouping expression is the value evaluated
@@ -192,6 +376,110 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
         """
         return self.env[variable_exp.identifier]
 
+    def visit_compare(self, compare_exp: Expression.Compare) -> bool:
+        """
+        Visit method for a fused variable/constant comparison.
+        The value is the comparison of the variable value in the
+        enviornment with the constant.
+
+        Arguments:
+            compare_exp {Expression.Compare} -- The comparison expression
+            visited.
+
+        Returns:
+            bool -- the result of the comparison.
+        """
+        return COMPARE[compare_exp.operator](
+            self.env[compare_exp.identifier], compare_exp.value)
+
+    def visit_logical(self, logical_exp: Expression.Logical) -> bool:
+        """
+        Visit method for an AND or OR expression.
+        The right operand is only evaluated if the left one does not
+        decide the value, so it may use variables which are not assigned.
+
+        Arguments:
+            logical_exp {Expression.Logical} -- The logical expression
+            visited.
+
+        Returns:
+            bool -- the value of the expression.
+        """
+        if logical_exp.operator == Keywords.AND:
+            return bool(self.evaluate(logical_exp.l_expr)
+                        and self.evaluate(logical_exp.r_expr))
+        return bool(self.evaluate(logical_exp.l_expr)
+                    or self.evaluate(logical_exp.r_expr))
+
+    def visit_not(self, not_exp: Expression.Not) -> bool:
+        """
+        Visit method for a NOT expression.
+
+        Arguments:
+            not_exp {Expression.Not} -- The NOT expression visited.
+
+        Returns:
+            bool -- True if the operand is false or zero.
+        """
+        return not self.evaluate(not_exp.expr)
+
+    def visit_index(self, index_exp: Expression.Index) -> float | int:
+        """
+        Visit method for an array element expression.
+        The value is the element of the array at the subscript.
+
+        Raises:
+            InterpreterError: If the array was not declared or the subscript
+            is out of range.
+
+        Arguments:
+            index_exp {Expression.Index} -- The array element expression
+            visited.
+
+        Returns:
+            Union[float, int] -- the value of the element.
+        """
+        values = get_array(self.arrays, index_exp.identifier)
+        index = self.evaluate(index_exp.index)
+        if index_exp.checked:
+            index = subscript(values, index)
+        return values[index]
+
+    def visit_call(self, call_exp: Expression.Call) -> float | int:
+        """
+        Visit method for a call of a user defined function.
+        The value is the value of the body of the function with its
+        parameters bound to the values of the arguments. The arguments are
+        passed in a tuple indexed by the parameters, not in an enviornment.
+
+        Arguments:
+            call_exp {Expression.Call} -- The call expression visited.
+
+        Returns:
+            Union[float, int] -- the value of the function.
+        """
+        arguments = self.arguments
+        self.arguments = tuple([self.evaluate(arg) for arg in call_exp.args])
+        try:
+            return self.evaluate(call_exp.function.expr)
+        finally:
+            # also restored when the body raises an error
+            self.arguments = arguments
+
+    def visit_parameter(self, parameter_exp: Expression.Parameter):
+        """
+        Visit method for a parameter in the body of a function.
+        The value is the argument of the call being evaluated.
+
+        Arguments:
+            parameter_exp {Expression.Parameter} -- The parameter expression
+            visited.
+
+        Returns:
+            Union[float, int] -- the value of the argument.
+        """
+        return self.arguments[parameter_exp.index]
+
     def visit_assignment(self, assign_stmnt: Statement.Assignment):
         """
         Visit method for a assignment statement.
@@ -212,7 +500,17 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
         Arguments:
             print_stmnt {Statement.Print} -- The print statement visited.
         """
-        print(self.evaluate(print_stmnt.expr))
+        self.print_value(self.evaluate(print_stmnt.expr))
+
+    def print_value(self, value):
+        """
+        Prints the value of a PRINT statement to STDOUT. Overridden by
+        interpreters which buffer their output.
+
+        Arguments:
+            value -- The value printed.
+        """
+        print(value)
 
     def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
         """
@@ -245,13 +543,293 @@ class Interpreter(StatementVisitor, ExpressionVisitor):
     def visit_end(self, end_stmnt: Statement.End):
         """
         Visit method for an end statement.
-        Executing the end statement does nothing.
+        Executing the end statement stops the program, unless it is the
+        placeholder of an empty line which does nothing.
+
+        Raises:
+            Halt: To stop the program.
 
         Arguments:
             end_stmnt {Statement.End} -- The end statement visited.
         """
+        if not end_stmnt.placeholder:
+            raise Halt()
+
+    def visit_increment(self, increment_stmnt: Statement.Increment):
+        """
+        Visit method for a fused increment statement.
+        Executing an increment adds the step to the variable value in the
+        enviornment.
+
+        Arguments:
+            increment_stmnt {Statement.Increment} -- The increment statement
+            visited.
+        """
+        env = self.env
+        identifier = increment_stmnt.identifier
+        env[identifier] = env[identifier] + increment_stmnt.step
+
+    def visit_print_variable(self, print_stmnt: Statement.PrintVariable):
+        """
+        Visit method for a fused print of a variable.
+        Executing it prints the variable value in the enviornment to STDOUT.
+
+        Arguments:
+            print_stmnt {Statement.PrintVariable} -- The print statement
+            visited.
+        """
+        self.print_value(self.env[print_stmnt.identifier])
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        """
+        Visit method for a DIM statement.
+        Executing it creates an array of zeros, replacing an array of the
+        same name.
+
+        Arguments:
+            dim_stmnt {Statement.Dim} -- The DIM statement visited.
+        """
+        self.arrays[dim_stmnt.identifier] = make_array(
+            self.evaluate(dim_stmnt.bound))
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        """
+        Visit method for an assignment to an array element.
+        Execution sets the element at the subscript to the value of the
+        expression.
+
+        Raises:
+            InterpreterError: If the array was not declared or the subscript
+            is out of range.
+
+        Arguments:
+            assign_stmnt {Statement.ElementAssignment} -- The assignment
+            statement visited.
+        """
+        values = get_array(self.arrays, assign_stmnt.identifier)
+        index = self.evaluate(assign_stmnt.index)
+        if assign_stmnt.checked:
+            index = subscript(values, index)
+        store_element(self.arrays, assign_stmnt.identifier, index,
+                      self.evaluate(assign_stmnt.expr))
+
+    def visit_guarded(self, guarded_stmnt: Statement.Guarded):
+        """
+        Visit method for a loop with hoisted bounds checks.
+        The loop with unchecked subscripts is executed if the checks hold
+        on entry, otherwise the original loop.
+
+        Arguments:
+            guarded_stmnt {Statement.Guarded} -- The guarded loop visited.
+        """
+        value = self.env.get(guarded_stmnt.variable)
+        arrays = self.arrays
+        if type(value) is int and value >= 0 and all(
+                identifier in arrays
+                and len(arrays[identifier]) > guarded_stmnt.limit
+                for identifier in guarded_stmnt.arrays):
+            guarded_stmnt.loop.accept(self)
+        else:
+            guarded_stmnt.fallback.accept(self)
+
+    def visit_data(self, data_stmnt: Statement.Data):
+        """
+        Visit method for a DATA statement.
+        Executing it does nothing, the constants were collected when the
+        program started.
+
+        Arguments:
+            data_stmnt {Statement.Data} -- The DATA statement visited.
+        """
+        pass
+
+    def visit_read(self, read_stmnt: Statement.Read):
+        """
+        Visit method for a READ statement.
+        Executing it assigns the next DATA constants to the targets.
+
+        Raises:
+            InterpreterError: If all DATA constants were read.
+
+        Arguments:
+            read_stmnt {Statement.Read} -- The READ statement visited.
+        """
+        for target in read_stmnt.targets:
+            if self.data_pointer == len(self.data):
+                raise InterpreterError("Out of DATA")
+            self.assign(target, self.data[self.data_pointer])
+            self.data_pointer += 1
+
+    def visit_input(self, input_stmnt: Statement.Input):
+        """
+        Visit method for an INPUT statement.
+        Executing it assigns the next numbers of the channel to the targets.
+
+        Raises:
+            InterpreterError: If the channel is not open, at the end of the
+            input or if the input is not a number.
+
+        Arguments:
+            input_stmnt {Statement.Input} -- The INPUT statement visited.
+        """
+        reader = self.input_channel(input_stmnt.channel)
+        for target in input_stmnt.targets:
+            self.assign(target, next_input(reader, input_stmnt.channel))
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        """
+        Visit method for a DEF statement.
+        Executing it does nothing, the calls of the function were resolved
+        when the program started.
+
+        Arguments:
+            def_stmnt {Statement.Def} -- The DEF statement visited.
+        """
         pass
 
+    def visit_goto(self, goto_stmnt: Statement.Goto):
+        """
+        Visit method for a GOTO statement.
+        Executing it continues the program at the numbered statement.
+
+        Raises:
+            Jump: To leave the enclosing bodies.
+
+        Arguments:
+            goto_stmnt {Statement.Goto} -- The GOTO statement visited.
+        """
+        raise Jump(self.targets[goto_stmnt.target])
+
+    def visit_gosub(self, gosub_stmnt: Statement.Gosub):
+        """
+        Visit method for a GOSUB statement.
+        Executing it runs the program from the numbered statement until a
+        RETURN statement. The return stack is the Python stack of nested
+        subroutine calls, its depth is limited to RETURN_STACK_SIZE.
+
+        Raises:
+            InterpreterError: If too many subroutine calls are active.
+            Halt: If the subroutine reaches the end of the program.
+
+        Arguments:
+            gosub_stmnt {Statement.Gosub} -- The GOSUB statement visited.
+        """
+        if self.gosub_depth == RETURN_STACK_SIZE:
+            raise InterpreterError("GOSUB nested deeper than {}".format(
+                RETURN_STACK_SIZE))
+        self.gosub_depth += 1
+        try:
+            self.run_from(self.targets[gosub_stmnt.target])
+            raise Halt()
+        except SubroutineReturn:
+            pass
+        finally:
+            self.gosub_depth -= 1
+
+    def visit_return(self, return_stmnt: Statement.Return):
+        """
+        Visit method for a RETURN statement.
+        Executing it continues the program after the last GOSUB statement.
+
+        Raises:
+            InterpreterError: If no subroutine was called.
+            SubroutineReturn: To leave the subroutine.
+
+        Arguments:
+            return_stmnt {Statement.Return} -- The RETURN statement visited.
+        """
+        if not self.gosub_depth:
+            raise InterpreterError("RETURN without GOSUB")
+        raise SubroutineReturn()
+
+    def input_channel(self, channel: int):
+        """
+        Returns the reader of an INPUT channel, channel 0 reads from STDIN.
+
+        Raises:
+            InterpreterError: If the channel is not open.
+        """
+        return input_channel(self.inputs, channel)
+
+    def assign(self, target: Expression, value):
+        """
+        Assigns a value to the target of a READ or INPUT statement.
+
+        Arguments:
+            target {Expression} -- A variable or array element.
+            value {Union[float, int]} -- The value to assign.
+        """
+        if isinstance(target, Expression.Index):
+            values = get_array(self.arrays, target.identifier)
+            index = self.evaluate(target.index)
+            if target.checked:
+                index = subscript(values, index)
+            store_element(self.arrays, target.identifier, index, value)
+        else:
+            self.env[target.identifier] = value
+
+
+class NoPhase:
+    """
+    Stands in for the phases of basic_metrics.Metrics when no metrics are
+    collected.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def help_formatter(prog: str) -> argparse.HelpFormatter:
+    """
+    Returns the formatter of the CLI help, as wide as the COLUMNS variable
+    says. Without a width argparse imports shutil (and with it bz2 and
+    lzma) to measure the terminal, which is a noticeable part of the
+    startup time of a short program.
+    """
+    try:
+        width = int(os.environ["COLUMNS"])
+    except (KeyError, ValueError):
+        width = 80
+    return argparse.HelpFormatter(prog, width=width - 2)
+
+
+def check_options(arg_parser: argparse.ArgumentParser, args):
+    """
+    Rejects combinations of execution options of which one would be
+    ignored. The virtual machine (or --dump-ir, which does not execute the
+    tree) and the checkpointing, memoizing, parallel and tracing
+    interpreters each run the program on their own, and only the other
+    interpreters can be profiled.
+
+    Arguments:
+        arg_parser {ArgumentParser} -- The parser reporting the error,
+        which exits.
+        args {Namespace} -- The parsed options.
+    """
+    runners = [option for option, used in (
+        ("--vm", args.vm),
+        ("--dump-ir", args.dump_ir and not args.vm),
+        ("--checkpoint", args.checkpoint),
+        ("--memoize", args.memoize),
+        ("--jobs", args.jobs),
+        ("--trace", args.trace)) if used]
+    if len(runners) > 1:
+        arg_parser.error("{} can not be combined with {}".format(
+            runners[0], runners[1]))
+    if args.profile and runners and runners[0] in ("--vm", "--dump-ir",
+                                                   "--checkpoint"):
+        arg_parser.error("--profile can not be combined with {}".format(
+            runners[0]))
+    if args.resume and not args.checkpoint:
+        arg_parser.error("--resume needs --checkpoint")
+
 
 def main():
     '''
@@ -266,33 +844,293 @@ def main():
 
     Ensure that the file is in the same folder as the script or provide an
     a path to file.
+
+    Options:
+    --fuse      rewrite common statement shapes into fused nodes and
+                print how many places each pattern rewrote to STDERR
+    --eliminate-dead-code
+                remove empty lines, statements after END and blocks with
+                constant false conditions and print what was removed to
+                STDERR
+    --checkpoint FILE
+                snapshot the execution state to FILE on SIGUSR1, on
+                SIGTERM (and stop) and every --checkpoint-interval seconds
+    --resume    resume the program from the --checkpoint FILE
+    --parse-jobs N
+                parse the top-level statements in N processes
+    --dump-ir   print the instructions the program is lowered to before
+                and after peephole optimization
+    --hoist-bounds-checks
+                check the array subscripts of counting loops once before
+                the loop and print how many were hoisted to STDERR
+    --vm        execute the optimized instructions on the virtual machine
+                instead of interpreting the parse tree
+    --input N=FILE
+                open FILE as channel N of INPUT #N (channel 1 if N= is left
+                out), INPUT without a channel reads from STDIN
+    --mmap      read the input files through memory maps
+    --memoize   cache the values of expensive expressions until one of
+                their variables is assigned and print the cache hit and
+                miss counts to STDERR
+    --memo-size N
+                maximum number of cached values (1024 by default)
+    --jobs N    run top-level DO WHILE blocks which do not depend on each
+                other in N processes and print how many ran there to
+                STDERR
+    --profile FILE
+                sample the statement being executed every
+                --profile-interval seconds of CPU time, write the samples
+                to FILE as collapsed stacks for flame graphs and print the
+                busiest lines to STDERR
+    --trace FILE
+                record every assignment and branch decision to FILE, which
+                basic_trace.py replays
+    --trace-chunk N
+                steps between the snapshots of the trace (65536 by
+                default)
+    --metrics FILE
+                write the counters of scanned tokens, parsed nodes and
+                executed statements, the peak enviornment size and the
+                time of every phase to FILE
+    --metrics-format FORMAT
+                json or prometheus, by default json for a FILE ending with
+                .json and prometheus otherwise
+    --compact-env
+                store the values of variables in typed arrays, which
+                takes less memory for programs with huge numbers of
+                variables but looks variables up more slowly
+    --memory    trace the allocations and print the bytes taken by the
+                tokens, the parse tree and the enviornment after every
+                phase to STDERR
+
+    --vm, --dump-ir, --checkpoint, --memoize, --jobs and --trace each run
+    the program their own way and can not be combined with each other
+    (except --vm with --dump-ir), --profile can not be combined with --vm,
+    --dump-ir or --checkpoint.
     '''
-    # get the filename from the first CLI argument
-    filename = sys.argv[1]
+    arg_parser = argparse.ArgumentParser(
+        description="Interpret a BASIC source file.",
+        formatter_class=help_formatter)
+    arg_parser.add_argument("filename", help="BASIC source file")
+    arg_parser.add_argument("--fuse", action="store_true",
+                            help="fuse common statement shapes")
+    arg_parser.add_argument("--eliminate-dead-code", action="store_true",
+                            help="remove statements which have no effect")
+    arg_parser.add_argument("--hoist-bounds-checks", action="store_true",
+                            help="check array subscripts before loops")
+    arg_parser.add_argument("--checkpoint", metavar="FILE",
+                            help="checkpoint file for the execution state")
+    arg_parser.add_argument("--checkpoint-interval", type=float,
+                            metavar="SECONDS",
+                            help="seconds between checkpoints")
+    arg_parser.add_argument("--resume", action="store_true",
+                            help="resume from the checkpoint file")
+    arg_parser.add_argument("--parse-jobs", type=int, metavar="N",
+                            help="number of processes used for parsing")
+    arg_parser.add_argument("--dump-ir", action="store_true",
+                            help="print the lowered instructions")
+    arg_parser.add_argument("--vm", action="store_true",
+                            help="run the program on the virtual machine")
+    arg_parser.add_argument("--input", action="append", metavar="N=FILE",
+                            help="file of numbers read by INPUT #N")
+    arg_parser.add_argument("--mmap", action="store_true",
+                            help="memory map the input files")
+    arg_parser.add_argument("--memoize", action="store_true",
+                            help="cache the values of expressions")
+    arg_parser.add_argument("--memo-size", type=int, default=1024,
+                            metavar="N", help="maximum number of cached "
+                            "values")
+    arg_parser.add_argument("--jobs", type=int, metavar="N",
+                            help="number of processes running blocks")
+    arg_parser.add_argument("--profile", metavar="FILE",
+                            help="file for the sampled collapsed stacks")
+    arg_parser.add_argument("--profile-interval", type=float,
+                            default=0.005, metavar="SECONDS",
+                            help="seconds of CPU time between samples")
+    arg_parser.add_argument("--trace", metavar="FILE",
+                            help="file for the execution trace")
+    arg_parser.add_argument("--trace-chunk", type=int, default=1 << 16,
+                            metavar="N", help="steps between the snapshots "
+                            "of the trace")
+    arg_parser.add_argument("--metrics", metavar="FILE",
+                            help="file for the runtime metrics")
+    arg_parser.add_argument("--metrics-format",
+                            choices=("json", "prometheus"),
+                            help="format of the metrics file")
+    arg_parser.add_argument("--compact-env", action="store_true",
+                            help="store variables in typed arrays")
+    arg_parser.add_argument("--memory", action="store_true",
+                            help="account the memory of every phase")
+    args = arg_parser.parse_args()
+    check_options(arg_parser, args)
+    metrics = None
+    phase = NoPhase
+    if args.metrics:
+        # imported here as programs run without metrics do not need it
+        import basic_metrics
+        import basic_hooks
+        metrics = basic_metrics.Metrics()
+        phase = metrics.phase
+    memory = None
+    environment = dict
+    if args.memory or args.compact_env:
+        # imported here as programs run without it do not need it
+        import basic_memory
+        if args.compact_env:
+            environment = basic_memory.Environment
     # use with context manager to open/close file and use
     # exception handling
-    with open(filename, "r") as f:
-        scanner = Scanner(f)  # create a scanner object with a source file
+    with open(args.filename, "r") as f:
+        source = f.read()
+        # create a scanner object with the lines of the source file
+        scanner = Scanner(source.splitlines(keepends=True))
         # make the generator global to be used with parser functions
         # initialize parser with scanner
         parser = Parser(scanner)
-        # initialize interpreter with parser
-        interpreter = Interpreter(parser)
+        if args.memory:
+            # the source is read before the allocations are traced, so it
+            # is not accounted
+            memory = basic_memory.MemoryAccount()
+            phase = memory.wrap(phase)
         # try catch to catch any parser errors
         try:
             # start interpreting the program
-            interpreter.interpret()
+            if args.parse_jobs:
+                # imported here as it is only needed for huge programs
+                from basic_parallel import parse_parallel
+                with phase("parse"):
+                    program = parse_parallel(scanner.source,
+                                             args.parse_jobs)
+            else:
+                if metrics or memory:
+                    # scan before parsing to measure the phases apart
+                    with memory.phase("scan") if memory else \
+                            NoPhase("scan"):
+                        parser.load(metrics.scan(scanner) if metrics
+                                    else token_buffer(scanner))
+                with phase("parse"):
+                    program = parser.program()
+            if metrics:
+                metrics.parsed(program)
+            with phase("optimize"):
+                if args.eliminate_dead_code:
+                    eliminator = DeadCodeEliminator()
+                    program = eliminator.transform(program)
+                    print(eliminator.report(), file=sys.stderr)
+                if args.fuse:
+                    fuser = Fuser()
+                    program = fuser.transform(program)
+                    print(fuser.report(), file=sys.stderr)
+                if args.hoist_bounds_checks:
+                    hoister = BoundsCheckHoister()
+                    program = hoister.transform(program)
+                    print(hoister.report(), file=sys.stderr)
+            inputs = open_inputs(args.input, args.mmap)
+            with phase("execute"):
+                if args.dump_ir or args.vm:
+                    # imported here as the tree interpreter does not need it
+                    import basic_ir
+                    code = basic_ir.Lowering().lower(program)
+                    optimized = basic_ir.peephole(code)
+                    if args.dump_ir:
+                        print("; before peephole optimization ({} "
+                              "instructions)".format(
+                                  basic_ir.count_instructions(code)))
+                        print(basic_ir.format_code(code))
+                        print("; after peephole optimization ({} "
+                              "instructions)".format(
+                                  basic_ir.count_instructions(optimized)))
+                        print(basic_ir.format_code(optimized))
+                    if args.vm:
+                        vm = basic_ir.VirtualMachine(inputs)
+                        vm.environment = environment
+                        vm.run(basic_ir.assemble(optimized))
+                elif args.checkpoint:
+                    # imported here as basic_checkpoint depends on this
+                    # module
+                    import basic_checkpoint
+                    # every option which changes the parse tree, and
+                    # with it the saved path of statement indices
+                    program_id = basic_checkpoint.fingerprint(
+                        source, args.fuse, args.eliminate_dead_code,
+                        args.hoist_bounds_checks)
+                    interpreter = basic_checkpoint.CheckpointInterpreter(
+                        parser, args.checkpoint, program_id,
+                        args.checkpoint_interval)
+                    interpreter.inputs = inputs
+                    interpreter.environment = environment
+                    if metrics:
+                        basic_hooks.attach(interpreter, metrics.hooks())
+                    state = None
+                    if args.resume and os.path.exists(args.checkpoint):
+                        state = basic_checkpoint.load_checkpoint(
+                            args.checkpoint)
+                    try:
+                        interpreter.run(program, state)
+                    except basic_checkpoint.CheckpointExit as e:
+                        print(e, file=sys.stderr)
+                        sys.exit(3)
+                else:
+                    if args.memoize:
+                        # imported here as basic_memo depends on this module
+                        import basic_memo
+                        interpreter = basic_memo.MemoizingInterpreter(
+                            parser, args.memo_size)
+                    elif args.jobs:
+                        # imported here as basic_scheduler depends on this
+                        # module
+                        import basic_scheduler
+                        interpreter = basic_scheduler.ParallelInterpreter(
+                            parser, args.jobs)
+                    elif args.trace:
+                        # imported here as basic_trace depends on this module
+                        import basic_trace
+                        interpreter = basic_trace.TraceInterpreter(
+                            parser, args.trace, args.trace_chunk)
+                    else:
+                        # initialize interpreter with parser
+                        interpreter = Interpreter(parser)
+                    interpreter.inputs = inputs
+                    interpreter.environment = environment
+                    if metrics:
+                        basic_hooks.attach(interpreter, metrics.hooks())
+                    if args.profile:
+                        # imported here as basic_profiler depends on this
+                        # module
+                        import basic_profiler
+                        with basic_profiler.SamplingProfiler(
+                                interpreter,
+                                args.profile_interval) as profiler:
+                            interpreter.run(program)
+                        with open(args.profile, "w") as profile:
+                            print(profiler.collapsed(), file=profile)
+                        print(profiler.report(), file=sys.stderr)
+                    else:
+                        interpreter.run(program)
+                    if args.memoize or args.jobs:
+                        print(interpreter.report(), file=sys.stderr)
         except ParserError as e:
             # if a parsing error occurred, alert the user
             print(e)
         except ScannerError as e:
             # if a scanning error occurred, alert the user
             print(e)
+        except InterpreterError as e:
+            # if an interpreter error occurred, alert the user
+            print(e)
         except Exception as e:
             # print any other errors
             print("Uknown Error Occured!")
             print(e)
+        finally:
+            if metrics:
+                metrics.write(args.metrics, args.metrics_format)
+            if memory:
+                print(memory.report(), file=sys.stderr)
 
 
 if __name__ == "__main__":
-    main()
+    # run main from the basic_interpreter module, which the other modules
+    # import, so errors raised by them are instances of the classes caught
+    import basic_interpreter
+    basic_interpreter.main()
@@ -0,0 +1,653 @@
+"""
+Python Implementation of a Linear Instruction Form for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+from enum import Enum, auto
+import operator
+from basic_program import ExpressionVisitor, Expression, StatementVisitor
+from basic_program import Statement, Program
+from basic_tokens import Operators, Keywords
+from basic_interpreter import make_array, get_array, subscript
+from basic_interpreter import store_element, InterpreterError
+from basic_interpreter import jump_table, RETURN_STACK_SIZE
+from basic_interpreter import resolve_functions, input_channel, next_input
+from basic_optimizer import definitions
+
+"""
+This file includes the lowering of a parse tree to a linear instruction
+form for a stack machine, a peephole optimizer for the instructions and
+a virtual machine executing them. DO WHILE and IF statements are lowered
+to conditional and unconditional jumps to labels. Their conditions are
+lowered to branches, AND, OR and NOT jump past the operands which do not
+decide the condition instead of computing their values, and only a
+logical expression used as a value pushes a bool. Numbered top-level
+statements are preceded by a label which GOTO jumps to and GOSUB calls,
+pushing the position after it on a bounded return stack. The bodies of
+the functions defined by DEF follow the program, a CALL pops the
+arguments into a frame read by LOAD_ARG until RETURN_VALUE. The peephole
+optimizer rewrites short instruction sequences until none of its patterns
+match:
+
+    NOP                             removed
+    LOAD x, STORE x                 removed
+    STORE x, LOAD x                 DUP, STORE x
+    LOAD x, CONST c, ADD, STORE x   INCREMENT x c
+    COMPARE op, JUMP_IF_FALSE L     COMPARE_JUMP op L
+    COMPARE op, JUMP_IF_TRUE L      COMPARE_JUMP_TRUE op L
+    JUMP L, where L: JUMP M         JUMP M (also for conditional jumps
+                                    and GOSUB)
+    JUMP L, L:                      L:
+"""
+
+
+class Opcodes(Enum):
+    """Opcodes of the instructions."""
+    NOP = auto()
+    CONST = auto()
+    LOAD = auto()
+    STORE = auto()
+    DUP = auto()
+    NEG = auto()
+    BINARY = auto()
+    COMPARE = auto()
+    INCREMENT = auto()
+    JUMP = auto()
+    JUMP_IF_FALSE = auto()
+    JUMP_IF_TRUE = auto()
+    COMPARE_JUMP = auto()
+    COMPARE_JUMP_TRUE = auto()
+    PRINT = auto()
+    HALT = auto()
+    LABEL = auto()
+    DIM = auto()
+    LOAD_ELEMENT = auto()
+    STORE_ELEMENT = auto()
+    DATA = auto()
+    READ = auto()
+    INPUT = auto()
+    GOSUB = auto()
+    RETURN = auto()
+    CALL = auto()
+    LOAD_ARG = auto()
+    RETURN_VALUE = auto()
+
+
+# arithmetic operators of BINARY instructions
+ARITHMETIC = {
+    Operators.ADD_OP: operator.add,
+    Operators.SUB_OP: operator.sub,
+    Operators.MULT_OP: operator.mul,
+    Operators.DIV_OP: operator.truediv,
+}
+# comparison operators of COMPARE and COMPARE_JUMP instructions
+COMPARISONS = {
+    Operators.EQUAL_OP: operator.eq,
+    Operators.LESS_THAN: operator.lt,
+    Operators.GREATER_THAN: operator.gt,
+    Operators.NOT_GREATER: operator.le,
+    Operators.NOT_LESS: operator.ge,
+}
+# instructions whose argument is a label
+JUMPS = (Opcodes.JUMP, Opcodes.JUMP_IF_FALSE, Opcodes.JUMP_IF_TRUE,
+         Opcodes.COMPARE_JUMP, Opcodes.COMPARE_JUMP_TRUE, Opcodes.GOSUB,
+         Opcodes.CALL)
+# instructions whose argument is an operator and a label
+OPERATOR_JUMPS = (Opcodes.COMPARE_JUMP, Opcodes.COMPARE_JUMP_TRUE,
+                  Opcodes.CALL)
+
+
+class Label:
+    """
+    Target of jumps, placed in the instructions by a LABEL instruction
+    until the instructions are assembled.
+    """
+
+    def __init__(self, number: int):
+        self.number = number
+
+    def __repr__(self):
+        return "L{}".format(self.number)
+
+
+class Lowering(StatementVisitor, ExpressionVisitor):
+    """
+    Visitor which lowers a program to a list of (opcode, argument)
+    instructions.
+    """
+
+    def __init__(self):
+        self.code = []
+        self.labels = 0
+        # label of each line number
+        self.lines = {}
+        # label of the body of each function definition
+        self.functions = {}
+
+    def lower(self, program: Program) -> list:
+        """
+        Lowers a program.
+
+        Arguments:
+            program {Program} -- The program to lower.
+
+        Returns:
+            list -- The instructions, with jumps to Label objects.
+        """
+        self.code = []
+        program = resolve_functions(program)
+        self.lines = {number: self.label()
+                      for number in jump_table(program.statements)}
+        self.functions = {def_stmnt: self.label()
+                          for def_stmnt in definitions(program.statements)}
+        for statement in program.statements:
+            if hasattr(statement, "label"):
+                self.emit(Opcodes.LABEL, self.lines[statement.label])
+            statement.accept(self)
+        if self.functions:
+            # the function bodies are only entered by CALL
+            self.emit(Opcodes.HALT)
+        for def_stmnt, label in self.functions.items():
+            self.emit(Opcodes.LABEL, label)
+            def_stmnt.expr.accept(self)
+            self.emit(Opcodes.RETURN_VALUE)
+        return self.code
+
+    def emit(self, opcode: Opcodes, arg=None):
+        self.code.append((opcode, arg))
+
+    def label(self) -> Label:
+        self.labels += 1
+        return Label(self.labels)
+
+    def visit_binary(self, binary_exp: Expression.Binary):
+        binary_exp.l_expr.accept(self)
+        binary_exp.r_expr.accept(self)
+        if binary_exp.operator in COMPARISONS:
+            self.emit(Opcodes.COMPARE, binary_exp.operator)
+        else:
+            self.emit(Opcodes.BINARY, binary_exp.operator)
+
+    def visit_unary(self, unary_exp: Expression.Unary):
+        unary_exp.expr.accept(self)
+        if unary_exp.operator == Operators.SUB_OP:
+            self.emit(Opcodes.NEG)
+
+    def visit_literal(self, literal_exp: Expression.Literal):
+        self.emit(Opcodes.CONST, literal_exp.value)
+
+    def visit_grouping(self, grouping_exp: Expression.Grouping):
+        grouping_exp.expr.accept(self)
+
+    def visit_variable(self, variable_exp: Expression.Variable):
+        self.emit(Opcodes.LOAD, variable_exp.identifier)
+
+    def visit_compare(self, compare_exp: Expression.Compare):
+        self.emit(Opcodes.LOAD, compare_exp.identifier)
+        self.emit(Opcodes.CONST, compare_exp.value)
+        self.emit(Opcodes.COMPARE, compare_exp.operator)
+
+    def visit_logical(self, logical_exp: Expression.Logical):
+        self.materialize(logical_exp)
+
+    def visit_not(self, not_exp: Expression.Not):
+        self.materialize(not_exp)
+
+    def materialize(self, exp: Expression):
+        """
+        Emits the instructions pushing the bool value of a condition.
+        """
+        false, end = self.label(), self.label()
+        self.branch(exp, false, False)
+        self.emit(Opcodes.CONST, True)
+        self.emit(Opcodes.JUMP, end)
+        self.emit(Opcodes.LABEL, false)
+        self.emit(Opcodes.CONST, False)
+        self.emit(Opcodes.LABEL, end)
+
+    def branch(self, exp: Expression, target: Label, when: bool):
+        """
+        Emits the instructions of a condition which jump to a label if the
+        condition is when, and continue after them otherwise. The operands
+        of AND and OR become branches of their own, so the right operand is
+        skipped when the left one decides the condition.
+
+        Arguments:
+            exp {Expression} -- The condition.
+            target {Label} -- The label to jump to.
+            when {bool} -- Jump if the condition is true, or if it is false.
+        """
+        if isinstance(exp, Expression.Grouping):
+            self.branch(exp.expr, target, when)
+        elif isinstance(exp, Expression.Not):
+            self.branch(exp.expr, target, not when)
+        elif isinstance(exp, Expression.Logical):
+            # the value AND jumps on if false, and OR if true
+            decides = exp.operator == Keywords.OR
+            if when == decides:
+                self.branch(exp.l_expr, target, when)
+                self.branch(exp.r_expr, target, when)
+            else:
+                skip = self.label()
+                self.branch(exp.l_expr, skip, decides)
+                self.branch(exp.r_expr, target, when)
+                self.emit(Opcodes.LABEL, skip)
+        else:
+            exp.accept(self)
+            self.emit(Opcodes.JUMP_IF_TRUE if when else Opcodes.JUMP_IF_FALSE,
+                      target)
+
+    def visit_index(self, index_exp: Expression.Index):
+        index_exp.index.accept(self)
+        self.emit(Opcodes.LOAD_ELEMENT, index_exp.identifier)
+
+    def visit_call(self, call_exp: Expression.Call):
+        for arg in call_exp.args:
+            arg.accept(self)
+        self.emit(Opcodes.CALL, (len(call_exp.args),
+                                 self.functions[call_exp.function]))
+
+    def visit_parameter(self, parameter_exp: Expression.Parameter):
+        self.emit(Opcodes.LOAD_ARG, parameter_exp.index)
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        assign_stmnt.expr.accept(self)
+        self.emit(Opcodes.STORE, assign_stmnt.identifier)
+
+    def visit_print(self, print_stmnt: Statement.Print):
+        print_stmnt.expr.accept(self)
+        self.emit(Opcodes.PRINT)
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        start, end = self.label(), self.label()
+        self.emit(Opcodes.LABEL, start)
+        self.branch(dowhile_stmnt.rel_expr, end, False)
+        for statement in dowhile_stmnt.body:
+            statement.accept(self)
+        self.emit(Opcodes.JUMP, start)
+        self.emit(Opcodes.LABEL, end)
+
+    def visit_if(self, if_stmnt: Statement.If):
+        end = self.label()
+        self.branch(if_stmnt.rel_expr, end, False)
+        for statement in if_stmnt.body:
+            statement.accept(self)
+        self.emit(Opcodes.LABEL, end)
+
+    def visit_end(self, end_stmnt: Statement.End):
+        self.emit(Opcodes.NOP if end_stmnt.placeholder else Opcodes.HALT)
+
+    def visit_increment(self, increment_stmnt: Statement.Increment):
+        self.emit(Opcodes.INCREMENT,
+                  (increment_stmnt.identifier, increment_stmnt.step))
+
+    def visit_print_variable(self, print_stmnt: Statement.PrintVariable):
+        self.emit(Opcodes.LOAD, print_stmnt.identifier)
+        self.emit(Opcodes.PRINT)
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        dim_stmnt.bound.accept(self)
+        self.emit(Opcodes.DIM, dim_stmnt.identifier)
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        assign_stmnt.index.accept(self)
+        assign_stmnt.expr.accept(self)
+        self.emit(Opcodes.STORE_ELEMENT, assign_stmnt.identifier)
+
+    def visit_guarded(self, guarded_stmnt: Statement.Guarded):
+        # the virtual machine always checks subscripts
+        guarded_stmnt.fallback.accept(self)
+
+    def visit_data(self, data_stmnt: Statement.Data):
+        # collected by the virtual machine before the program starts
+        self.emit(Opcodes.DATA, tuple(data_stmnt.values))
+
+    def visit_read(self, read_stmnt: Statement.Read):
+        for target in read_stmnt.targets:
+            self.store_target(target, Opcodes.READ)
+
+    def visit_input(self, input_stmnt: Statement.Input):
+        for target in input_stmnt.targets:
+            self.store_target(target, Opcodes.INPUT, input_stmnt.channel)
+
+    def visit_goto(self, goto_stmnt: Statement.Goto):
+        self.emit(Opcodes.JUMP, self.lines[goto_stmnt.target])
+
+    def visit_gosub(self, gosub_stmnt: Statement.Gosub):
+        self.emit(Opcodes.GOSUB, self.lines[gosub_stmnt.target])
+
+    def visit_return(self, return_stmnt: Statement.Return):
+        self.emit(Opcodes.RETURN)
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        # the body is lowered after the program
+        pass
+
+    def store_target(self, target: Expression, opcode: Opcodes, arg=None):
+        """
+        Emits an instruction pushing a value and the instructions storing
+        it in a variable or array element.
+        """
+        if isinstance(target, Expression.Index):
+            target.index.accept(self)
+            self.emit(opcode, arg)
+            self.emit(Opcodes.STORE_ELEMENT, target.identifier)
+        else:
+            self.emit(opcode, arg)
+            self.emit(Opcodes.STORE, target.identifier)
+
+
+def jump_target(instruction: tuple) -> Label:
+    """
+    Returns the label a jump instruction jumps to.
+    """
+    opcode, arg = instruction
+    if opcode in OPERATOR_JUMPS:
+        return arg[1]
+    return arg
+
+
+def retarget(instruction: tuple, label: Label) -> tuple:
+    """
+    Returns a jump instruction with a different target.
+    """
+    opcode, arg = instruction
+    if opcode in OPERATOR_JUMPS:
+        return (opcode, (arg[0], label))
+    return (opcode, label)
+
+
+def peephole(code: list) -> list:
+    """
+    Optimizes instructions by rewriting short sequences until no pattern
+    matches.
+
+    Arguments:
+        code {list} -- Instructions with jumps to labels.
+
+    Returns:
+        list -- The optimized instructions.
+    """
+    changed = True
+    while changed:
+        changed = False
+        # position of each label to follow jumps to jumps
+        labels = {arg: index for index, (opcode, arg) in enumerate(code)
+                  if opcode == Opcodes.LABEL}
+        result = []
+        index = 0
+        while index < len(code):
+            instruction = code[index]
+            opcode, arg = instruction
+            following = code[index + 1:index + 4]
+            if opcode == Opcodes.NOP:
+                index += 1
+                changed = True
+                continue
+            if following and opcode == Opcodes.LOAD \
+                    and following[0] == (Opcodes.STORE, arg):
+                index += 2
+                changed = True
+                continue
+            if following and opcode == Opcodes.STORE \
+                    and following[0] == (Opcodes.LOAD, arg):
+                result += [(Opcodes.DUP, None), instruction]
+                index += 2
+                changed = True
+                continue
+            if len(following) == 3 and opcode == Opcodes.LOAD \
+                    and following[0][0] == Opcodes.CONST \
+                    and following[1][0] == Opcodes.BINARY \
+                    and following[1][1] in (Operators.ADD_OP,
+                                            Operators.SUB_OP) \
+                    and following[2] == (Opcodes.STORE, arg):
+                step = following[0][1]
+                if following[1][1] == Operators.SUB_OP:
+                    step = -step
+                result.append((Opcodes.INCREMENT, (arg, step)))
+                index += 4
+                changed = True
+                continue
+            if following and opcode == Opcodes.COMPARE \
+                    and following[0][0] in (Opcodes.JUMP_IF_FALSE,
+                                            Opcodes.JUMP_IF_TRUE):
+                result.append((Opcodes.COMPARE_JUMP
+                               if following[0][0] == Opcodes.JUMP_IF_FALSE
+                               else Opcodes.COMPARE_JUMP_TRUE,
+                               (arg, following[0][1])))
+                index += 2
+                changed = True
+                continue
+            if opcode in JUMPS:
+                target = jump_target(instruction)
+                destination = code[labels[target] + 1] \
+                    if labels[target] + 1 < len(code) else None
+                if destination is not None and \
+                        destination[0] == Opcodes.JUMP and \
+                        destination[1] is not target:
+                    result.append(retarget(instruction, destination[1]))
+                    index += 1
+                    changed = True
+                    continue
+                if opcode == Opcodes.JUMP and \
+                        following and following[0] == (Opcodes.LABEL,
+                                                       target):
+                    index += 1
+                    changed = True
+                    continue
+            result.append(instruction)
+            index += 1
+        code = result
+    return code
+
+
+def assemble(code: list) -> list:
+    """
+    Removes the LABEL instructions and replaces jump targets with the
+    index of the instruction to jump to.
+
+    Arguments:
+        code {list} -- Instructions with jumps to labels.
+
+    Returns:
+        list -- Instructions ready to be executed.
+    """
+    positions, index = {}, 0
+    for opcode, arg in code:
+        if opcode == Opcodes.LABEL:
+            positions[arg] = index
+        else:
+            index += 1
+    assembled = []
+    for instruction in code:
+        if instruction[0] == Opcodes.LABEL:
+            continue
+        if instruction[0] in JUMPS:
+            instruction = retarget(instruction,
+                                   positions[jump_target(instruction)])
+        assembled.append(instruction)
+    return assembled
+
+
+def count_instructions(code: list) -> int:
+    """
+    Returns the number of instructions, not counting labels.
+    """
+    return sum(opcode != Opcodes.LABEL for opcode, _ in code)
+
+
+def format_code(code: list) -> str:
+    """
+    Returns a readable listing of instructions.
+    """
+    lines = []
+    for opcode, arg in code:
+        if opcode == Opcodes.LABEL:
+            lines.append("{!r}:".format(arg))
+        elif opcode in (Opcodes.BINARY, Opcodes.COMPARE):
+            lines.append("    {:<16}{}".format(opcode.name, arg.name))
+        elif opcode in (Opcodes.COMPARE_JUMP, Opcodes.COMPARE_JUMP_TRUE):
+            lines.append("    {:<16}{} {!r}".format(opcode.name, arg[0].name,
+                                                    arg[1]))
+        elif opcode == Opcodes.CALL:
+            lines.append("    {:<16}{} {!r}".format(opcode.name, *arg))
+        elif opcode == Opcodes.INCREMENT:
+            lines.append("    {:<16}{!r} {!r}".format(opcode.name, *arg))
+        else:
+            lines.append("    {:<16}{}".format(
+                opcode.name, "" if arg is None else repr(arg)))
+    return "\n".join(lines)
+
+
+class VirtualMachine:
+    """
+    Stack machine executing assembled instructions.
+    """
+    # the mapping type of the enviornment, see basic_memory.Environment
+    environment = dict
+
+    def __init__(self, inputs: dict = None):
+        """
+        Arguments:
+            inputs {dict} -- The NumberReader of each open INPUT channel.
+        """
+        self.inputs = {} if inputs is None else inputs
+
+    def run(self, code: list):
+        """
+        Executes instructions in a fresh enviornment.
+
+        Arguments:
+            code {list} -- Assembled instructions.
+        """
+        self.env = env = self.environment()
+        self.arrays = arrays = {}
+        # the DATA constants in the order of the instructions
+        data = [value for opcode, arg in code if opcode == Opcodes.DATA
+                for value in arg]
+        data_pointer = 0
+        # positions following the active GOSUB instructions
+        returns = []
+        # positions following the active CALL instructions and the
+        # arguments of their callers
+        calls = []
+        args = ()
+        stack = []
+        push, pop = stack.append, stack.pop
+        # local names of the opcodes, which are faster to look up
+        LOAD, CONST, STORE = Opcodes.LOAD, Opcodes.CONST, Opcodes.STORE
+        INCREMENT, COMPARE_JUMP = Opcodes.INCREMENT, Opcodes.COMPARE_JUMP
+        JUMP, BINARY, COMPARE = Opcodes.JUMP, Opcodes.BINARY, Opcodes.COMPARE
+        JUMP_IF_FALSE, DUP = Opcodes.JUMP_IF_FALSE, Opcodes.DUP
+        JUMP_IF_TRUE = Opcodes.JUMP_IF_TRUE
+        COMPARE_JUMP_TRUE = Opcodes.COMPARE_JUMP_TRUE
+        NEG, PRINT = Opcodes.NEG, Opcodes.PRINT
+        LOAD_ELEMENT, DIM = Opcodes.LOAD_ELEMENT, Opcodes.DIM
+        STORE_ELEMENT = Opcodes.STORE_ELEMENT
+        READ, INPUT = Opcodes.READ, Opcodes.INPUT
+        CALL, LOAD_ARG = Opcodes.CALL, Opcodes.LOAD_ARG
+        RETURN_VALUE = Opcodes.RETURN_VALUE
+        # replace operators by their functions
+        code = [(opcode, ARITHMETIC[arg]) if opcode is BINARY else
+                (opcode, COMPARISONS[arg]) if opcode is COMPARE else
+                (opcode, (COMPARISONS[arg[0]], arg[1]))
+                if opcode is COMPARE_JUMP or opcode is COMPARE_JUMP_TRUE
+                else (opcode, arg)
+                for opcode, arg in code]
+        pc, end = 0, len(code)
+        while pc < end:
+            opcode, arg = code[pc]
+            pc += 1
+            if opcode is LOAD:
+                push(env[arg])
+            elif opcode is CONST:
+                push(arg)
+            elif opcode is LOAD_ARG:
+                push(args[arg])
+            elif opcode is STORE:
+                env[arg] = pop()
+            elif opcode is INCREMENT:
+                name, step = arg
+                env[name] = env[name] + step
+            elif opcode is COMPARE_JUMP:
+                right = pop()
+                if not arg[0](pop(), right):
+                    pc = arg[1]
+            elif opcode is JUMP:
+                pc = arg
+            elif opcode is BINARY:
+                right = pop()
+                push(arg(pop(), right))
+            elif opcode is CALL:
+                count, target = arg
+                calls.append((pc, args))
+                if count:
+                    args = tuple(stack[-count:])
+                    del stack[-count:]
+                else:
+                    args = ()
+                pc = target
+            elif opcode is RETURN_VALUE:
+                pc, args = calls.pop()
+            elif opcode is COMPARE:
+                right = pop()
+                push(arg(pop(), right))
+            elif opcode is JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif opcode is COMPARE_JUMP_TRUE:
+                right = pop()
+                if arg[0](pop(), right):
+                    pc = arg[1]
+            elif opcode is JUMP_IF_TRUE:
+                if pop():
+                    pc = arg
+            elif opcode is DUP:
+                push(stack[-1])
+            elif opcode is NEG:
+                push(-pop())
+            elif opcode is LOAD_ELEMENT:
+                values = get_array(arrays, arg)
+                push(values[subscript(values, pop())])
+            elif opcode is STORE_ELEMENT:
+                value = pop()
+                values = get_array(arrays, arg)
+                store_element(arrays, arg, subscript(values, pop()), value)
+            elif opcode is PRINT:
+                print(pop())
+            elif opcode is DIM:
+                arrays[arg] = make_array(pop())
+            elif opcode is READ:
+                if data_pointer == len(data):
+                    raise InterpreterError("Out of DATA")
+                push(data[data_pointer])
+                data_pointer += 1
+            elif opcode is INPUT:
+                push(self.read_input(arg))
+            elif opcode is Opcodes.GOSUB:
+                if len(returns) == RETURN_STACK_SIZE:
+                    raise InterpreterError(
+                        "GOSUB nested deeper than {}".format(
+                            RETURN_STACK_SIZE))
+                returns.append(pc)
+                pc = arg
+            elif opcode is Opcodes.RETURN:
+                if not returns:
+                    raise InterpreterError("RETURN without GOSUB")
+                pc = returns.pop()
+            elif opcode is Opcodes.DATA:
+                pass
+            else:
+                # HALT
+                break
+
+    def read_input(self, channel: int):
+        """
+        Returns the next number of an INPUT channel, channel 0 reads from
+        STDIN.
+
+        Raises:
+            InterpreterError: If the channel is not open, at the end of the
+            input or if the input is not a number.
+        """
+        return next_input(input_channel(self.inputs, channel), channel)
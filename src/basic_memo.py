@@ -0,0 +1,299 @@
+"""
+Python Implementation of Expression Memoization for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+from collections import OrderedDict
+from basic_interpreter import Interpreter
+from basic_parser import Parser
+from basic_program import Expression, ExpressionVisitor, Statement, Program
+
+"""
+This file includes an opt-in memo layer for the interpreter. Expressions
+in the subset have no side effects, so the value of an expression only
+depends on its free variables. Every variable carries a version counter
+which is bumped whenever the variable is assigned. The value of an
+expensive expression is cached together with the versions of its free
+variables, and reused as long as none of them was assigned since. The
+cache is bounded and evicts the least recently used entry.
+
+Functions defined by DEF whose body only depends on their parameters are
+pure, and their values are cached in a second bounded cache keyed by the
+argument values.
+"""
+
+# smallest number of operators of an expression worth caching, cheaper
+# expressions are evaluated faster than their cache entry is checked
+MIN_COST = 3
+# name standing for the arguments of the call being evaluated, expressions
+# in function bodies which depend on them are not cached by node
+ARGUMENTS = "#"
+
+
+class LRUCache:
+    """
+    Mapping of bounded size which evicts its least recently used entry.
+    Counts hits, misses and evictions.
+    """
+
+    def __init__(self, size: int):
+        """
+        Arguments:
+            size {int} -- The maximum number of entries.
+        """
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of a key and marks it as recently used. Hits and
+        misses are counted by the caller, which knows if a value is stale.
+        """
+        try:
+            value = self.entries[key]
+        except KeyError:
+            return default
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """
+        Stores the value of a key, evicting the least recently used entry
+        if the cache is full.
+        """
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+class FreeVariables(ExpressionVisitor):
+    """
+    Expression visitor which returns the set of variables an expression
+    depends on and the number of operators in it.
+    """
+
+    def analyse(self, exp: Expression) -> tuple:
+        return exp.accept(self)
+
+    def visit_binary(self, binary_exp: Expression.Binary):
+        l_vars, l_cost = self.analyse(binary_exp.l_expr)
+        r_vars, r_cost = self.analyse(binary_exp.r_expr)
+        return l_vars | r_vars, l_cost + r_cost + 1
+
+    def visit_unary(self, unary_exp: Expression.Unary):
+        variables, cost = self.analyse(unary_exp.expr)
+        return variables, cost + 1
+
+    def visit_literal(self, literal_exp: Expression.Literal):
+        return frozenset(), 0
+
+    def visit_grouping(self, grouping_exp: Expression.Grouping):
+        return self.analyse(grouping_exp.expr)
+
+    def visit_variable(self, variable_exp: Expression.Variable):
+        return frozenset((variable_exp.identifier,)), 0
+
+    def visit_compare(self, compare_exp: Expression.Compare):
+        return frozenset((compare_exp.identifier,)), 1
+
+    def visit_logical(self, logical_exp: Expression.Logical):
+        l_vars, l_cost = self.analyse(logical_exp.l_expr)
+        r_vars, r_cost = self.analyse(logical_exp.r_expr)
+        return l_vars | r_vars, l_cost + r_cost + 1
+
+    def visit_not(self, not_exp: Expression.Not):
+        variables, cost = self.analyse(not_exp.expr)
+        return variables, cost + 1
+
+    def visit_index(self, index_exp: Expression.Index):
+        variables, cost = self.analyse(index_exp.index)
+        return variables | {array_version(index_exp.identifier)}, cost + 1
+
+    def visit_call(self, call_exp: Expression.Call):
+        variables, cost = self.analyse(call_exp.function.expr)
+        # the parameters of the body are bound to the arguments
+        variables = variables - {ARGUMENTS}
+        for arg in call_exp.args:
+            arg_vars, arg_cost = self.analyse(arg)
+            variables, cost = variables | arg_vars, cost + arg_cost
+        return variables, cost + 1
+
+    def visit_parameter(self, parameter_exp: Expression.Parameter):
+        return frozenset((ARGUMENTS,)), 0
+
+
+def array_version(identifier: str) -> str:
+    """
+    Returns the name under which the version of an array is counted, which
+    can not clash with a variable.
+    """
+    return identifier + "()"
+
+
+class MemoizingInterpreter(Interpreter):
+    """
+    Interpreter which caches the values of expensive expressions keyed by
+    the expression node and reuses them while the versions of their free
+    variables are unchanged.
+    """
+
+    def __init__(self, parser: Parser, size: int = 1024,
+                 min_cost: int = MIN_COST):
+        """
+        Arguments:
+            parser {Parser} -- The parser of the program.
+            size {int} -- The maximum number of cached values.
+            min_cost {int} -- The smallest number of operators of a cached
+            expression.
+        """
+        super().__init__(parser)
+        self.cache = LRUCache(size)
+        # values of pure functions by function and arguments
+        self.calls = LRUCache(size)
+        # whether each function is pure and worth caching
+        self.pure = {}
+        self.min_cost = min_cost
+        self.analyser = FreeVariables()
+        # free variables of every expression seen, None if not cached
+        self.free = {}
+        self.versions = {}
+
+    def run(self, program: Program):
+        """
+        Executes a program with an empty cache.
+
+        Arguments:
+            program {Program} -- The program to execute.
+        """
+        self.cache.clear()
+        self.calls.clear()
+        self.pure = {}
+        self.versions = {}
+        super().run(program)
+
+    def evaluate(self, exp: Expression):
+        """
+        Evaluates an expression, using the cached value if none of its free
+        variables was assigned since it was cached.
+
+        Arguments:
+            exp {Expression} -- The expression to evaluate.
+
+        Returns:
+            Union[float, int] -- the value of the expression.
+        """
+        try:
+            variables = self.free[exp]
+        except KeyError:
+            variables = self.free[exp] = self.cacheable(exp)
+        if variables is None:
+            return exp.accept(self)
+        versions = self.versions
+        key = tuple([versions.get(name, 0) for name in variables])
+        entry = self.cache.get(exp)
+        if entry is not None and entry[0] == key:
+            self.cache.hits += 1
+            return entry[1]
+        self.cache.misses += 1
+        value = exp.accept(self)
+        self.cache.put(exp, (key, value))
+        return value
+
+    def cacheable(self, exp: Expression):
+        """
+        Returns the free variables of an expression in a fixed order, or
+        None if the expression is too cheap to be worth caching.
+        """
+        variables, cost = self.analyser.analyse(exp)
+        if cost < self.min_cost or ARGUMENTS in variables:
+            return None
+        return tuple(sorted(variables))
+
+    def visit_call(self, call_exp: Expression.Call):
+        """
+        Evaluates a call, using the cached value of a pure function if it
+        was called with the same arguments before.
+        """
+        function = call_exp.function
+        pure = self.pure.get(function)
+        if pure is None:
+            variables, cost = self.analyser.analyse(function.expr)
+            pure = self.pure[function] = variables <= {ARGUMENTS} \
+                and cost >= self.min_cost
+        if not pure:
+            return super().visit_call(call_exp)
+        args = tuple([self.evaluate(arg) for arg in call_exp.args])
+        # 1 and 1.0 are equal keys but may give values of another type
+        key = (function, args, tuple([type(arg) for arg in args]))
+        value = self.calls.get(key)
+        if value is not None:
+            self.calls.hits += 1
+            return value
+        self.calls.misses += 1
+        arguments = self.arguments
+        self.arguments = args
+        try:
+            value = self.evaluate(function.expr)
+        finally:
+            self.arguments = arguments
+        self.calls.put(key, value)
+        return value
+
+    def assigned(self, identifier: str):
+        """
+        Bumps the version of a variable, invalidating cached values which
+        depend on it.
+        """
+        self.versions[identifier] = self.versions.get(identifier, 0) + 1
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        super().visit_assignment(assign_stmnt)
+        self.assigned(assign_stmnt.identifier)
+
+    def visit_increment(self, increment_stmnt: Statement.Increment):
+        super().visit_increment(increment_stmnt)
+        self.assigned(increment_stmnt.identifier)
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        super().visit_dim(dim_stmnt)
+        self.assigned(array_version(dim_stmnt.identifier))
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        super().visit_element_assignment(assign_stmnt)
+        self.assigned(array_version(assign_stmnt.identifier))
+
+    def assign(self, target: Expression, value):
+        super().assign(target, value)
+        if isinstance(target, Expression.Index):
+            self.assigned(array_version(target.identifier))
+        else:
+            self.assigned(target.identifier)
+
+    def report(self) -> str:
+        """
+        Returns a human readable report of the cache statistics.
+        """
+        lines = []
+        for title, cache in (("Memoized expressions:", self.cache),
+                             ("Memoized function calls:", self.calls)):
+            lookups = cache.hits + cache.misses
+            lines.append(title)
+            for name, value in (("hits", cache.hits),
+                                ("misses", cache.misses),
+                                ("evictions", cache.evictions),
+                                ("entries", len(cache))):
+                lines.append("  {:<20}{:>8}".format(name, value))
+            lines.append("  {:<20}{:>7.1f}%".format(
+                "hit rate", 100 * cache.hits / lookups if lookups else 0))
+        return "\n".join(lines)
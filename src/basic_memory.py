@@ -0,0 +1,276 @@
+"""
+Python Implementation of Memory Accounting for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import contextlib
+import os
+import tracemalloc
+from array import array
+from collections.abc import MutableMapping
+
+"""
+This file includes a compact enviornment for programs with huge numbers
+of variables and an account of the memory a program takes in each phase.
+
+A dict enviornment holds an entry and a Python object for the value of
+every variable, 70 to 100 bytes a variable. Environment stores the values
+in one typed array, 64 bit integers and floats are the same 8 bytes seen
+through two memoryviews, and finds the slot of a name in an open
+addressing table of 32 bit slot numbers. With the list of names and the
+kind of every value it takes 25 to 40 bytes a variable. The names are
+the identifier strings of the parse tree, which the scanner interns in
+its symbol table, so they take no memory of their own and are mostly
+found by identity rather than compared. Values which are neither 64 bit
+integers nor floats, like the results of comparisons, are kept as
+objects.
+
+MemoryAccount traces the allocations with tracemalloc and attributes the
+bytes still allocated after every phase to the module which allocated
+them:
+
+    tokens       the scanner, the token buffer and its lexemes
+    ast          the parser, the parse tree and the optimizers
+    environment  the interpreter and the runtime, the values of variables
+                 and arrays and the enviornment holding them
+    other        everything else, like the instructions and the values
+                 of the virtual machine
+
+The interpreter reads the source before it creates the account, so the
+source is not accounted. Tracing slows a program down by a factor of two
+to three, and every phase ends with a snapshot of all allocations.
+"""
+
+# kinds of the value of a slot of an Environment
+UNSET, INT, FLOAT, OBJECT = range(4)
+# range of the integers stored in the typed array
+INT_MIN, INT_MAX = -1 << 63, (1 << 63) - 1
+# slots of a new Environment
+INITIAL_SLOTS = 8
+
+# the category of the memory allocated by each module
+CATEGORIES = {
+    "basic_scanner.py": "tokens",
+    "basic_tokenstream.py": "tokens",
+    "basic_parser.py": "ast",
+    "basic_program.py": "ast",
+    "basic_optimizer.py": "ast",
+    "basic_parallel.py": "ast",
+    "basic_interpreter.py": "environment",
+    "basic_runtime.py": "environment",
+    "basic_memory.py": "environment",
+}
+# columns of the report
+COLUMNS = ("tokens", "ast", "environment", "other")
+
+
+class Environment(MutableMapping):
+    """
+    Enviornment of variables stored in typed arrays, a drop-in replacement
+    of the dict enviornment of Interpreter and VirtualMachine.
+    """
+
+    def __init__(self):
+        # the name of every slot, in the order they were added
+        self.names = []
+        # the slot of each name by the hash of the name, -1 where free
+        self.table = array("i", [-1]) * (INITIAL_SLOTS * 2)
+        self.mask = INITIAL_SLOTS * 2 - 1
+        # the kind of the value of every slot
+        self.kinds = bytearray()
+        # the values of the slots, viewed as integers and as floats
+        self.data = bytearray(8 * INITIAL_SLOTS)
+        self.ints = memoryview(self.data).cast("q")
+        self.floats = memoryview(self.data).cast("d")
+        # the values which are neither 64 bit integers nor floats by slot
+        self.objects = {}
+        # the number of slots holding a value
+        self.size = 0
+
+    def find(self, name: str) -> int:
+        """
+        Returns the slot of a name, or -1 if it has none.
+        """
+        table, names, mask = self.table, self.names, self.mask
+        index = hash(name) & mask
+        while True:
+            slot = table[index]
+            if slot < 0 or names[slot] is name or names[slot] == name:
+                return slot
+            index = (index + 1) & mask
+
+    def add(self, name: str) -> int:
+        """
+        Adds a slot for a name, growing the arrays when they are full.
+
+        Returns:
+            int -- The slot.
+        """
+        slot = len(self.names)
+        self.names.append(name)
+        self.kinds.append(UNSET)
+        if 8 * len(self.names) > len(self.data):
+            # the views export the buffer, which can not grow while they
+            # are alive
+            self.ints.release()
+            self.floats.release()
+            self.data.extend(bytes(len(self.data)))
+            self.ints = memoryview(self.data).cast("q")
+            self.floats = memoryview(self.data).cast("d")
+        if 3 * len(self.names) > 2 * len(self.table):
+            self.rehash(2 * len(self.table))
+        else:
+            self.place(slot)
+        return slot
+
+    def place(self, slot: int):
+        """
+        Enters a slot into the first free entry of the table for its name.
+        """
+        table, mask = self.table, self.mask
+        index = hash(self.names[slot]) & mask
+        while table[index] >= 0:
+            index = (index + 1) & mask
+        table[index] = slot
+
+    def rehash(self, size: int):
+        """
+        Rebuilds the table with a number of entries, a power of two.
+        """
+        self.table = array("i", [-1]) * size
+        self.mask = size - 1
+        for slot in range(len(self.names)):
+            self.place(slot)
+
+    def __getitem__(self, name: str):
+        slot = self.find(name)
+        kind = self.kinds[slot] if slot >= 0 else UNSET
+        if kind == INT:
+            return self.ints[slot]
+        if kind == FLOAT:
+            return self.floats[slot]
+        if kind == OBJECT:
+            return self.objects[slot]
+        raise KeyError(name)
+
+    def __setitem__(self, name: str, value):
+        slot = self.find(name)
+        if slot < 0:
+            slot = self.add(name)
+        kinds = self.kinds
+        kind = kinds[slot]
+        if kind == UNSET:
+            self.size += 1
+        elif kind == OBJECT:
+            del self.objects[slot]
+        if type(value) is float:
+            self.floats[slot] = value
+            kinds[slot] = FLOAT
+        elif type(value) is int and INT_MIN <= value <= INT_MAX:
+            self.ints[slot] = value
+            kinds[slot] = INT
+        else:
+            self.objects[slot] = value
+            kinds[slot] = OBJECT
+
+    def __delitem__(self, name: str):
+        # the slot is kept for the name, it is only marked unset
+        slot = self.find(name)
+        if slot < 0 or self.kinds[slot] == UNSET:
+            raise KeyError(name)
+        self.objects.pop(slot, None)
+        self.kinds[slot] = UNSET
+        self.size -= 1
+
+    def __iter__(self):
+        kinds = self.kinds
+        for slot, name in enumerate(self.names):
+            if kinds[slot] != UNSET:
+                yield name
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return "Environment({!r})".format(dict(self.items()))
+
+    def __reduce__(self):
+        # memoryviews can not be pickled, the enviornment is pickled (and
+        # deep copied) as its items like a dict
+        return (type(self), (), None, None, iter(self.items()))
+
+
+def category(filename: str) -> str:
+    """
+    Returns the category of the memory allocated by a source file.
+    """
+    return CATEGORIES.get(os.path.basename(filename), "other")
+
+
+class MemoryAccount:
+    """
+    Account of the memory allocated in the phases of running a program,
+    by the category of the module which allocated it.
+    """
+
+    def __init__(self):
+        # the bytes of each category after each phase and the peak of the
+        # phase, in the order the phases ended
+        self.phases = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def current(self) -> dict:
+        """
+        Returns the bytes allocated by each category that are still
+        allocated.
+        """
+        sizes = dict.fromkeys(COLUMNS, 0)
+        for statistic in tracemalloc.take_snapshot().statistics("filename"):
+            filename = statistic.traceback[0].filename
+            # the snapshots taken by the account are not accounted
+            if filename != tracemalloc.__file__:
+                sizes[category(filename)] += statistic.size
+        return sizes
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Context manager accounting the memory of a phase, also when the
+        phase fails. Before Python 3.9 the peak can not be reset, it is
+        the peak since the account was created.
+        """
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.phases.append((name, self.current(), peak))
+
+    def wrap(self, phase):
+        """
+        Returns a context manager function accounting the memory of a
+        phase around another phase context manager, like the phases of
+        basic_metrics.Metrics.
+        """
+        @contextlib.contextmanager
+        def accounted(name: str):
+            with self.phase(name), phase(name):
+                yield
+        return accounted
+
+    def report(self) -> str:
+        """
+        Returns a human readable table of the bytes allocated by each
+        category after every phase, their total and the peak during the
+        phase.
+        """
+        lines = ["Memory (bytes){}{:>14}{:>14}".format(
+            "".join("{:>14}".format(column) for column in COLUMNS),
+            "total", "peak")]
+        for name, sizes, peak in self.phases:
+            lines.append("  {:<12}{}{:>14,}{:>14,}".format(
+                name, "".join("{:>14,}".format(sizes[column])
+                              for column in COLUMNS),
+                sum(sizes.values()), peak))
+        return "\n".join(lines)
@@ -0,0 +1,245 @@
+"""
+Python Implementation of Runtime Metrics for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import contextlib
+import json
+import math
+import os
+import time
+from basic_hooks import Hooks
+from basic_program import Program
+from basic_scanner import TokenBuffer, token_buffer
+
+"""
+This file includes a collector of the metrics of running programs:
+
+    tokens_scanned       counter, tokens of the scanned source
+    tokens_per_second    gauge, tokens scanned per second of scanning
+    nodes_parsed         counter, statement and expression nodes parsed
+    statements_executed  counter, statements executed including nested ones
+    assignments          counter, variables and array elements assigned
+    errors               counter, errors which stopped a program
+    peak_env_size        gauge, most variables in the enviornment at once
+    phase_seconds        histogram of the seconds of each phase (scan,
+                         parse, optimize, execute) by phase
+
+The execution metrics are collected by hooks, see basic_hooks, so a
+program runs at full speed unless metrics are collected. The metrics are
+written as JSON or in the Prometheus text format, which the textfile
+collector of the node exporter reads.
+"""
+
+# upper bounds of the buckets of the phase histogram in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0,
+           math.inf)
+# prefix of the Prometheus metric names
+PREFIX = "basic_"
+# help text and type of every metric
+DESCRIPTIONS = {
+    "tokens_scanned": ("Tokens of the scanned source.", "counter"),
+    "nodes_parsed": ("Statement and expression nodes parsed.", "counter"),
+    "statements_executed": ("Statements executed including nested ones.",
+                            "counter"),
+    "assignments": ("Variables and array elements assigned.", "counter"),
+    "errors": ("Errors which stopped a program.", "counter"),
+    "tokens_per_second": ("Tokens scanned per second of scanning.",
+                          "gauge"),
+    "peak_env_size": ("Most variables in the enviornment at once.", "gauge"),
+}
+
+
+def count_nodes(node) -> int:
+    """
+    Returns the number of statement and expression nodes of a parse tree,
+    a node is any object with an accept method.
+
+    Arguments:
+        node {object} -- A node, Program or list of nodes.
+    """
+    if isinstance(node, (list, tuple)):
+        return sum(count_nodes(child) for child in node)
+    if isinstance(node, Program):
+        return count_nodes(node.statements)
+    if not hasattr(node, "accept"):
+        return 0
+    return 1 + sum(count_nodes(child) for child in vars(node).values())
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed values in the Prometheus style, every
+    bucket counts the values up to its bound.
+    """
+
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+        Adds a value to the buckets it falls into.
+        """
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict:
+        return {"buckets": {format_bound(bound): count for bound, count in
+                            zip(self.buckets, self.counts)},
+                "count": self.count, "sum": self.sum}
+
+
+def format_bound(bound: float) -> str:
+    """
+    Returns the label of a bucket bound, +Inf for the last one.
+    """
+    return "+Inf" if bound == math.inf else repr(bound)
+
+
+class Metrics:
+    """
+    Collector of the metrics of scanning, parsing and executing programs.
+    """
+
+    def __init__(self):
+        self.counters = {name: 0 for name, (_, kind) in DESCRIPTIONS.items()
+                         if kind == "counter"}
+        self.gauges = {name: 0 for name, (_, kind) in DESCRIPTIONS.items()
+                       if kind == "gauge"}
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Context manager timing a phase into its histogram, also when the
+        phase fails.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name: str, seconds: float):
+        """
+        Adds the seconds a phase took to its histogram.
+        """
+        if name not in self.phases:
+            self.phases[name] = Histogram()
+        self.phases[name].observe(seconds)
+
+    def scan(self, scanner) -> TokenBuffer:
+        """
+        Scans the tokens of a source for a parser, timing the scan phase.
+
+        Arguments:
+            scanner {Scanner} -- The scanner of the source.
+
+        Returns:
+            TokenBuffer -- The tokens, for Parser.load.
+        """
+        start = time.perf_counter()
+        try:
+            buffer = token_buffer(scanner)
+        finally:
+            seconds = time.perf_counter() - start
+            self.observe("scan", seconds)
+        self.scanned(len(buffer), seconds)
+        return buffer
+
+    def scanned(self, tokens: int, seconds: float):
+        """
+        Counts the tokens of a scanned source and the rate they were
+        scanned at.
+        """
+        self.counters["tokens_scanned"] += tokens
+        if seconds > 0:
+            self.gauges["tokens_per_second"] = tokens / seconds
+
+    def parsed(self, program):
+        """
+        Counts the nodes of a parsed program.
+        """
+        self.counters["nodes_parsed"] += count_nodes(program)
+
+    def hooks(self) -> Hooks:
+        """
+        Returns the hooks collecting the execution metrics, for
+        basic_hooks.instrument or attach.
+        """
+        hooks = Hooks()
+        counters, gauges = self.counters, self.gauges
+
+        def statement(interpreter, statement):
+            counters["statements_executed"] += 1
+            if len(interpreter.env) > gauges["peak_env_size"]:
+                gauges["peak_env_size"] = len(interpreter.env)
+
+        def assignment(interpreter, identifier, index, value):
+            counters["assignments"] += 1
+
+        def error(interpreter, error, statement):
+            counters["errors"] += 1
+        hooks.register("statement", statement)
+        hooks.register("assignment", assignment)
+        hooks.register("error", error)
+        return hooks
+
+    def to_json(self) -> str:
+        """
+        Returns the metrics as a JSON object.
+        """
+        return json.dumps({
+            "counters": self.counters,
+            "gauges": self.gauges,
+            "phase_seconds": {name: histogram.to_dict() for name, histogram
+                              in self.phases.items()}}, indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for name, value in list(self.counters.items()) + \
+                list(self.gauges.items()):
+            description, kind = DESCRIPTIONS[name]
+            metric = PREFIX + name + ("_total" if kind == "counter" else "")
+            lines.append("# HELP {} {}".format(metric, description))
+            lines.append("# TYPE {} {}".format(metric, kind))
+            lines.append("{} {}".format(metric, value))
+        metric = PREFIX + "phase_seconds"
+        lines.append("# HELP {} Seconds taken by each phase.".format(metric))
+        lines.append("# TYPE {} histogram".format(metric))
+        for name, histogram in self.phases.items():
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                lines.append('{}_bucket{{phase="{}",le="{}"}} {}'.format(
+                    metric, name, format_bound(bound), count))
+            lines.append('{}_sum{{phase="{}"}} {}'.format(metric, name,
+                                                          histogram.sum))
+            lines.append('{}_count{{phase="{}"}} {}'.format(metric, name,
+                                                            histogram.count))
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, format: str = None):
+        """
+        Writes the metrics to a file, replacing it at once so a collector
+        never reads half a file.
+
+        Arguments:
+            path {str} -- The file to write.
+            format {str} -- json or prometheus, by default json for files
+            ending with .json and prometheus otherwise.
+        """
+        if format is None:
+            format = "json" if path.endswith(".json") else "prometheus"
+        text = self.to_json() + "\n" if format == "json" else \
+            self.to_prometheus()
+        temporary = path + ".tmp"
+        with open(temporary, "w") as f:
+            f.write(text)
+        os.replace(temporary, path)
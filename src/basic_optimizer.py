@@ -0,0 +1,798 @@
+"""
+Python Implementation of an Optimizer for a Subset of BASIC (ECMA 116 Standard)
+"""
+from collections import Counter
+import copy
+from basic_program import Expression, ExpressionVisitor, StatementVisitor
+from basic_program import Statement, Program
+from basic_tokens import Operators, Keywords
+import operator
+
+"""
+This file includes passes which rewrite a parsed program before it is
+handed to the interpreter. Each pass is a statement visitor which returns
+the statement to keep in place of the visited one (or None to drop it),
+so a pass only has to override the visit methods for the shapes it
+rewrites. Passes copy the nodes they change instead of modifying them, as
+parse trees may be shared (see basic_incremental.py).
+"""
+
+# comparison operators which can be fused into an Expression.Compare
+COMPARISONS = (Operators.EQUAL_OP, Operators.LESS_THAN,
+               Operators.GREATER_THAN, Operators.NOT_GREATER,
+               Operators.NOT_LESS)
+
+# operator to use when the operands of a comparison are swapped
+SWAPPED = {
+    Operators.EQUAL_OP: Operators.EQUAL_OP,
+    Operators.LESS_THAN: Operators.GREATER_THAN,
+    Operators.GREATER_THAN: Operators.LESS_THAN,
+    Operators.NOT_GREATER: Operators.NOT_LESS,
+    Operators.NOT_LESS: Operators.NOT_GREATER,
+}
+
+# functions used to fold binary expressions of constants
+FOLD = {
+    Operators.ADD_OP: operator.add,
+    Operators.SUB_OP: operator.sub,
+    Operators.MULT_OP: operator.mul,
+    Operators.DIV_OP: operator.truediv,
+    Operators.EQUAL_OP: operator.eq,
+    Operators.LESS_THAN: operator.lt,
+    Operators.GREATER_THAN: operator.gt,
+    Operators.NOT_GREATER: operator.le,
+    Operators.NOT_LESS: operator.ge,
+}
+
+
+class NotConstant(Exception):
+    """
+    Raised when an expression can not be evaluated without an enviornment.
+    """
+    pass
+
+
+class ConstantFolder(ExpressionVisitor):
+    """
+    Expression visitor which evaluates expressions made only of literals.
+
+    Raises:
+        NotConstant: If the expression depends on a variable or its
+        evaluation fails (for example a division by zero), which is left
+        to be reported at run time.
+    """
+
+    def evaluate(self, exp: Expression):
+        return exp.accept(self)
+
+    def visit_binary(self, binary_exp: Expression.Binary):
+        l_expr = self.evaluate(binary_exp.l_expr)
+        r_expr = self.evaluate(binary_exp.r_expr)
+        try:
+            return FOLD[binary_exp.operator](l_expr, r_expr)
+        except (KeyError, ArithmeticError):
+            raise NotConstant()
+
+    def visit_unary(self, unary_exp: Expression.Unary):
+        if unary_exp.operator == Operators.SUB_OP:
+            return -self.evaluate(unary_exp.expr)
+        return self.evaluate(unary_exp.expr)
+
+    def visit_literal(self, literal_exp: Expression.Literal):
+        return literal_exp.value
+
+    def visit_grouping(self, grouping_exp: Expression.Grouping):
+        return self.evaluate(grouping_exp.expr)
+
+    def visit_variable(self, variable_exp: Expression.Variable):
+        raise NotConstant()
+
+    def visit_compare(self, compare_exp: Expression.Compare):
+        raise NotConstant()
+
+    def visit_logical(self, logical_exp: Expression.Logical):
+        # a constant left operand which decides the value folds the
+        # expression, even if the right operand is not constant
+        l_expr = self.evaluate(logical_exp.l_expr)
+        if logical_exp.operator == Keywords.AND and not l_expr:
+            return False
+        if logical_exp.operator == Keywords.OR and l_expr:
+            return True
+        return bool(self.evaluate(logical_exp.r_expr))
+
+    def visit_not(self, not_exp: Expression.Not):
+        return not self.evaluate(not_exp.expr)
+
+    def visit_index(self, index_exp: Expression.Index):
+        raise NotConstant()
+
+    def visit_call(self, call_exp: Expression.Call):
+        raise NotConstant()
+
+    def visit_parameter(self, parameter_exp: Expression.Parameter):
+        raise NotConstant()
+
+
+class Transformer(StatementVisitor):
+    """
+    Base class for optimizer passes. By default every statement is kept
+    as is and the bodies of loops and if statements are transformed
+    recursively.
+    """
+
+    def transform(self, program: Program) -> Program:
+        """
+        Applies the pass to a whole program.
+
+        Arguments:
+            program {Program} -- The program to transform.
+
+        Returns:
+            Program -- The transformed program.
+        """
+        return Program(self.transform_body(program.statements))
+
+    def transform_body(self, statements: list) -> list:
+        """
+        Applies the pass to a list of statements, dropping any statement
+        for which the visit method returned None.
+
+        Arguments:
+            statements {list} -- The statements to transform.
+
+        Returns:
+            list -- The transformed statements.
+        """
+        body = []
+        for statement in statements:
+            statement = statement.accept(self)
+            if statement is not None:
+                body.append(statement)
+        return body
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        return assign_stmnt
+
+    def visit_print(self, print_stmnt: Statement.Print):
+        return print_stmnt
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        dowhile_stmnt = copy.copy(dowhile_stmnt)
+        dowhile_stmnt.body = self.transform_body(dowhile_stmnt.body)
+        return dowhile_stmnt
+
+    def visit_if(self, if_stmnt: Statement.If):
+        if_stmnt = copy.copy(if_stmnt)
+        if_stmnt.body = self.transform_body(if_stmnt.body)
+        return if_stmnt
+
+    def visit_end(self, end_stmnt: Statement.End):
+        return end_stmnt
+
+    def visit_increment(self, increment_stmnt: Statement.Increment):
+        return increment_stmnt
+
+    def visit_print_variable(self, print_stmnt: Statement.PrintVariable):
+        return print_stmnt
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        return dim_stmnt
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        return assign_stmnt
+
+    def visit_data(self, data_stmnt: Statement.Data):
+        return data_stmnt
+
+    def visit_read(self, read_stmnt: Statement.Read):
+        return read_stmnt
+
+    def visit_input(self, input_stmnt: Statement.Input):
+        return input_stmnt
+
+    def visit_goto(self, goto_stmnt: Statement.Goto):
+        return goto_stmnt
+
+    def visit_gosub(self, gosub_stmnt: Statement.Gosub):
+        return gosub_stmnt
+
+    def visit_return(self, return_stmnt: Statement.Return):
+        return return_stmnt
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        return def_stmnt
+
+    def visit_guarded(self, guarded_stmnt: Statement.Guarded):
+        loop = guarded_stmnt.loop.accept(self)
+        fallback = guarded_stmnt.fallback.accept(self)
+        if loop is None or fallback is None:
+            # both loops have the same condition and are dropped together
+            return None
+        guarded_stmnt = copy.copy(guarded_stmnt)
+        guarded_stmnt.loop, guarded_stmnt.fallback = loop, fallback
+        return guarded_stmnt
+
+
+class Fuser(Transformer):
+    """
+    Pattern recognition pass which rewrites the most common statement
+    shapes into fused nodes that the interpreter executes in a single
+    dispatch:
+
+        LET v = v + c, LET v = v - c  ->  Statement.Increment
+        PRINT v                       ->  Statement.PrintVariable
+        v <op> c as a loop/if test    ->  Expression.Compare
+        (also as an operand of AND, OR and NOT in the test)
+
+    The number of places each pattern rewrote is kept in counts, a fused
+    node in a loop is counted once however often it is executed.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        """
+        Rewrites LET v = v + c, LET v = c + v and LET v = v - c into an
+        increment of v.
+        """
+        step = increment_step(assign_stmnt)
+        if step is not None:
+            self.counts["increment"] += 1
+            return located(Statement.Increment(
+                assign_stmnt.identifier, step), assign_stmnt)
+        return assign_stmnt
+
+    def visit_print(self, print_stmnt: Statement.Print):
+        """
+        Rewrites PRINT v into a print of the variable.
+        """
+        if isinstance(print_stmnt.expr, Expression.Variable):
+            self.counts["print_variable"] += 1
+            return located(Statement.PrintVariable(
+                print_stmnt.expr.identifier), print_stmnt)
+        return print_stmnt
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        dowhile_stmnt = super().visit_dowhile(dowhile_stmnt)
+        dowhile_stmnt.rel_expr = self.fuse_condition(dowhile_stmnt.rel_expr)
+        return dowhile_stmnt
+
+    def visit_if(self, if_stmnt: Statement.If):
+        if_stmnt = super().visit_if(if_stmnt)
+        if_stmnt.rel_expr = self.fuse_condition(if_stmnt.rel_expr)
+        return if_stmnt
+
+    def fuse_condition(self, rel_expr):
+        """
+        Rewrites a comparison of a variable with a literal (in either
+        order) into a single comparison node, also the comparisons
+        combined by AND, OR and NOT.
+
+        Arguments:
+            rel_expr {Expression} -- The condition of a loop or if statement.
+
+        Returns:
+            Expression -- The fused condition, or rel_expr if it does not
+            match.
+        """
+        if isinstance(rel_expr, Expression.Logical):
+            return Expression.Logical(self.fuse_condition(rel_expr.l_expr),
+                                      rel_expr.operator,
+                                      self.fuse_condition(rel_expr.r_expr))
+        if isinstance(rel_expr, Expression.Not):
+            return Expression.Not(self.fuse_condition(rel_expr.expr))
+        if isinstance(rel_expr, Expression.Grouping):
+            return Expression.Grouping(self.fuse_condition(rel_expr.expr))
+        if (not isinstance(rel_expr, Expression.Binary)
+                or rel_expr.operator not in COMPARISONS):
+            return rel_expr
+        l_expr, r_expr = rel_expr.l_expr, rel_expr.r_expr
+        if (isinstance(l_expr, Expression.Variable)
+                and isinstance(r_expr, Expression.Literal)):
+            self.counts["compare_var_const"] += 1
+            return Expression.Compare(l_expr.identifier, rel_expr.operator,
+                                      r_expr.value)
+        if (isinstance(l_expr, Expression.Literal)
+                and isinstance(r_expr, Expression.Variable)):
+            self.counts["compare_var_const"] += 1
+            return Expression.Compare(r_expr.identifier,
+                                      SWAPPED[rel_expr.operator],
+                                      l_expr.value)
+        return rel_expr
+
+    def report(self) -> str:
+        """
+        Returns a human readable report of the number of places each
+        pattern rewrote in the program.
+        """
+        lines = ["Fused rewrites in the program:"]
+        for name in ("increment", "print_variable", "compare_var_const"):
+            lines.append("  {:<20}{:>8}".format(name, self.counts[name]))
+        return "\n".join(lines)
+
+
+class DeadCodeEliminator(Transformer):
+    """
+    Cleanup pass which removes statements that never have an effect:
+
+        empty lines          the End placeholders of empty lines
+        unreachable          statements following an END, GOTO or RETURN
+                             in the same body, up to the next numbered
+                             statement
+        constant false       IF and DO WHILE blocks whose condition is a
+                             constant expression which is false
+
+    DATA statements are never removed, as READ takes their constants
+    wherever they are placed, and neither are DEF statements or the blocks
+    holding them, as their functions can be called anywhere. Line numbers
+    are never removed either, as they may be jumped to. The number of
+    statements eliminated for each reason (including the statements nested
+    in removed blocks) is kept in counts.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.folder = ConstantFolder()
+
+    def transform_body(self, statements: list) -> list:
+        """
+        Transforms a body and drops the statements which follow an END,
+        GOTO or RETURN and can not be jumped to.
+        """
+        body = super().transform_body(statements)
+        result = []
+        index = 0
+        while index < len(body):
+            statement = body[index]
+            result.append(statement)
+            index += 1
+            if isinstance(statement, (Statement.Goto, Statement.Return)) \
+                    or (isinstance(statement, Statement.End)
+                        and not statement.placeholder):
+                # the next numbered statement can be reached by a jump
+                end = index
+                while end < len(body) and not hasattr(body[end], "label"):
+                    end += 1
+                kept = declarations(body[index:end])
+                self.counts["unreachable"] += count_statements(
+                    body[index:end]) - len(kept)
+                result.extend(kept)
+                index = end
+        return result
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        if self.is_false(dowhile_stmnt.rel_expr) \
+                and not definitions([dowhile_stmnt]):
+            return self.remove_block(dowhile_stmnt)
+        return super().visit_dowhile(dowhile_stmnt)
+
+    def visit_if(self, if_stmnt: Statement.If):
+        if self.is_false(if_stmnt.rel_expr) and not definitions([if_stmnt]):
+            return self.remove_block(if_stmnt)
+        return super().visit_if(if_stmnt)
+
+    def remove_block(self, statement):
+        """
+        Removes a block which is never executed, keeping the constants of
+        the DATA statements in it and its line number.
+
+        Returns:
+            Statement -- The DATA constants of the block, an empty line
+            with the line number of the block, or None.
+        """
+        kept = data_statements([statement])
+        self.counts["constant_false"] += count_statements(
+            [statement]) - len(kept)
+        if kept:
+            replacement = located(Statement.Data(
+                [value for data_stmnt in kept
+                 for value in data_stmnt.values]), kept[0])
+        elif hasattr(statement, "label"):
+            replacement = Statement.End(placeholder=True)
+        else:
+            return None
+        if hasattr(statement, "label"):
+            replacement.label = statement.label
+        return replacement
+
+    def visit_end(self, end_stmnt: Statement.End):
+        if end_stmnt.placeholder and not hasattr(end_stmnt, "label"):
+            self.counts["empty_lines"] += 1
+            return None
+        return end_stmnt
+
+    def is_false(self, rel_expr) -> bool:
+        """
+        Checks if a condition is a constant expression which is false.
+        """
+        try:
+            return not self.folder.evaluate(rel_expr)
+        except NotConstant:
+            return False
+
+    def report(self) -> str:
+        """
+        Returns a human readable report of the eliminated statements.
+        """
+        lines = ["Eliminated statements:"]
+        for name in ("empty_lines", "unreachable", "constant_false"):
+            lines.append("  {:<20}{:>8}".format(name, self.counts[name]))
+        return "\n".join(lines)
+
+
+class BoundsCheckHoister(Transformer):
+    """
+    Pass which moves the bounds checks of array subscripts out of counting
+    loops. In a loop of the form
+
+        DO WHILE i < n  (or i <= n)
+            ... a(i) ...
+        LOOP
+
+    where n is an integer constant, i is only changed by positive integer
+    steps outside of nested loops, no array is declared and no subroutine
+    is called, i is never
+    larger than n - 1 (or n) plus the sum of the steps. The loop is
+    replaced by a Statement.Guarded which checks once on entry that i is a
+    non negative integer and that the arrays have an element at that
+    limit, and then runs a copy of the loop with the subscripts a(i)
+    unchecked. The original loop is kept for when the check fails.
+
+    The number of loops and subscripts rewritten is kept in counts.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        dowhile_stmnt = super().visit_dowhile(dowhile_stmnt)
+        bound = loop_bound(dowhile_stmnt.rel_expr)
+        if bound is None:
+            return dowhile_stmnt
+        variable, limit = bound
+        steps = variable_steps(dowhile_stmnt.body, variable)
+        if steps is None:
+            return dowhile_stmnt
+        unchecker = Unchecker(variable)
+        loop = copy.copy(dowhile_stmnt)
+        loop.body = unchecker.transform_body(dowhile_stmnt.body)
+        if not unchecker.arrays:
+            return dowhile_stmnt
+        self.counts["hoisted_loops"] += 1
+        self.counts["unchecked_subscripts"] += unchecker.count
+        return located(Statement.Guarded(
+            variable, limit + steps, tuple(sorted(unchecker.arrays)), loop,
+            dowhile_stmnt), dowhile_stmnt)
+
+    def report(self) -> str:
+        """
+        Returns a human readable report of the hoisted checks.
+        """
+        lines = ["Hoisted bounds checks:"]
+        for name in ("hoisted_loops", "unchecked_subscripts"):
+            lines.append("  {:<20}{:>8}".format(name, self.counts[name]))
+        return "\n".join(lines)
+
+
+class ExpressionRewriter(Transformer, ExpressionVisitor):
+    """
+    Base class for passes which rewrite expressions. By default every
+    expression is kept as is, and statements and expressions are only
+    copied if one of their expressions was rewritten.
+    """
+
+    def rewrite(self, exp: Expression) -> Expression:
+        return exp.accept(self)
+
+    def replace(self, node, **fields):
+        """
+        Returns a node with some of its fields rewritten, which is the node
+        itself if none of them changed or a copy otherwise.
+        """
+        if all(unchanged(getattr(node, name), value)
+               for name, value in fields.items()):
+            return node
+        node = copy.copy(node)
+        for name, value in fields.items():
+            setattr(node, name, value)
+        return node
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        return self.replace(assign_stmnt,
+                            expr=self.rewrite(assign_stmnt.expr))
+
+    def visit_print(self, print_stmnt: Statement.Print):
+        return self.replace(print_stmnt, expr=self.rewrite(print_stmnt.expr))
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        dowhile_stmnt = super().visit_dowhile(dowhile_stmnt)
+        dowhile_stmnt.rel_expr = self.rewrite(dowhile_stmnt.rel_expr)
+        return dowhile_stmnt
+
+    def visit_if(self, if_stmnt: Statement.If):
+        if_stmnt = super().visit_if(if_stmnt)
+        if_stmnt.rel_expr = self.rewrite(if_stmnt.rel_expr)
+        return if_stmnt
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        return self.replace(dim_stmnt, bound=self.rewrite(dim_stmnt.bound))
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        return self.replace(assign_stmnt,
+                            index=self.rewrite(assign_stmnt.index),
+                            expr=self.rewrite(assign_stmnt.expr))
+
+    def visit_read(self, read_stmnt: Statement.Read):
+        return self.replace(read_stmnt, targets=[
+            self.rewrite(target) for target in read_stmnt.targets])
+
+    def visit_input(self, input_stmnt: Statement.Input):
+        return self.replace(input_stmnt, targets=[
+            self.rewrite(target) for target in input_stmnt.targets])
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        return self.replace(def_stmnt, expr=self.rewrite(def_stmnt.expr))
+
+    def visit_binary(self, binary_exp: Expression.Binary):
+        return self.replace(binary_exp,
+                            l_expr=self.rewrite(binary_exp.l_expr),
+                            r_expr=self.rewrite(binary_exp.r_expr))
+
+    def visit_unary(self, unary_exp: Expression.Unary):
+        return self.replace(unary_exp, expr=self.rewrite(unary_exp.expr))
+
+    def visit_literal(self, literal_exp: Expression.Literal):
+        return literal_exp
+
+    def visit_grouping(self, grouping_exp: Expression.Grouping):
+        return self.replace(grouping_exp,
+                            expr=self.rewrite(grouping_exp.expr))
+
+    def visit_variable(self, variable_exp: Expression.Variable):
+        return variable_exp
+
+    def visit_compare(self, compare_exp: Expression.Compare):
+        return compare_exp
+
+    def visit_logical(self, logical_exp: Expression.Logical):
+        return self.replace(logical_exp,
+                            l_expr=self.rewrite(logical_exp.l_expr),
+                            r_expr=self.rewrite(logical_exp.r_expr))
+
+    def visit_not(self, not_exp: Expression.Not):
+        return self.replace(not_exp, expr=self.rewrite(not_exp.expr))
+
+    def visit_index(self, index_exp: Expression.Index):
+        return self.replace(index_exp, index=self.rewrite(index_exp.index))
+
+    def visit_call(self, call_exp: Expression.Call):
+        return self.replace(call_exp, args=[self.rewrite(arg)
+                                            for arg in call_exp.args])
+
+    def visit_parameter(self, parameter_exp: Expression.Parameter):
+        return parameter_exp
+
+
+class Unchecker(ExpressionRewriter):
+    """
+    Copies statements clearing the bounds checks of the subscripts which
+    are exactly the given variable, and collects the arrays they index.
+    """
+
+    def __init__(self, variable: str):
+        self.variable = variable
+        self.arrays = set()
+        self.count = 0
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        assign_stmnt = super().visit_element_assignment(assign_stmnt)
+        if is_variable(assign_stmnt.index, self.variable):
+            assign_stmnt = copy.copy(assign_stmnt)
+            assign_stmnt.checked = False
+            self.unchecked(assign_stmnt.identifier)
+        return assign_stmnt
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        # the function can be called outside of the loop
+        return def_stmnt
+
+    def visit_index(self, index_exp: Expression.Index):
+        index = self.rewrite(index_exp.index)
+        if is_variable(index, self.variable):
+            self.unchecked(index_exp.identifier)
+            return Expression.Index(index_exp.identifier, index, False)
+        return Expression.Index(index_exp.identifier, index,
+                                index_exp.checked)
+
+    def unchecked(self, identifier: str):
+        self.arrays.add(identifier)
+        self.count += 1
+
+
+def loop_bound(rel_expr):
+    """
+    Returns the variable and its largest value at the start of the body
+    of a loop with a condition of the form v < n or v <= n, where n is an
+    integer constant, or None for any other condition.
+    """
+    if isinstance(rel_expr, Expression.Compare):
+        identifier, operator, value = (rel_expr.identifier,
+                                       rel_expr.operator, rel_expr.value)
+    elif (isinstance(rel_expr, Expression.Binary)
+          and isinstance(rel_expr.l_expr, Expression.Variable)
+          and isinstance(rel_expr.r_expr, Expression.Literal)):
+        identifier, operator, value = (rel_expr.l_expr.identifier,
+                                       rel_expr.operator,
+                                       rel_expr.r_expr.value)
+    else:
+        return None
+    if type(value) is not int:
+        return None
+    if operator == Operators.LESS_THAN:
+        return identifier, value - 1
+    if operator == Operators.NOT_GREATER:
+        return identifier, value
+    return None
+
+
+def variable_steps(statements: list, variable: str):
+    """
+    Returns the sum of the steps by which a body can increase a variable
+    in one pass, or None if the body changes it in any other way, declares
+    an array or calls a subroutine (which may do either).
+    """
+    total = 0
+    for statement in statements:
+        if isinstance(statement, (Statement.Dim, Statement.Gosub)):
+            return None
+        if assigns(statement, variable):
+            if isinstance(statement, Statement.Increment):
+                step = statement.step
+            elif isinstance(statement, Statement.Assignment):
+                step = increment_step(statement)
+            else:
+                return None
+            if type(step) is not int or step <= 0:
+                return None
+            total += step
+        elif isinstance(statement, Statement.If):
+            steps = variable_steps(statement.body, variable)
+            if steps is None:
+                return None
+            total += steps
+        elif isinstance(statement, (Statement.DoWhile, Statement.Guarded)):
+            # a nested loop may repeat its steps any number of times
+            for inner in walk([statement]):
+                if isinstance(inner, (Statement.Dim, Statement.Gosub)) \
+                        or assigns(inner, variable):
+                    return None
+    return total
+
+
+def assigns(statement, variable: str) -> bool:
+    """
+    Checks if a statement (not counting nested ones) assigns a variable.
+    """
+    if isinstance(statement, (Statement.Assignment, Statement.Increment)):
+        return statement.identifier == variable
+    if isinstance(statement, (Statement.Read, Statement.Input)):
+        return any(is_variable(target, variable)
+                   for target in statement.targets)
+    return False
+
+
+def walk(statements: list):
+    """
+    Generates statements and all statements nested in them.
+    """
+    for statement in statements:
+        yield statement
+        if isinstance(statement, Statement.Guarded):
+            yield from walk([statement.loop, statement.fallback])
+        else:
+            yield from walk(getattr(statement, "body", ()))
+
+
+def declarations(statements: list) -> list:
+    """
+    Returns the DATA and DEF statements among statements and the statements
+    nested in them, in source order. Only the original loop of a
+    Statement.Guarded is searched, as its copy holds the same statements.
+    """
+    found = []
+    for statement in statements:
+        if isinstance(statement, (Statement.Data, Statement.Def)):
+            found.append(statement)
+        elif isinstance(statement, Statement.Guarded):
+            found.extend(declarations([statement.fallback]))
+        else:
+            found.extend(declarations(getattr(statement, "body", ())))
+    return found
+
+
+def data_statements(statements: list) -> list:
+    """
+    Returns the DATA statements among statements and the statements nested
+    in them, in source order.
+    """
+    return [statement for statement in declarations(statements)
+            if isinstance(statement, Statement.Data)]
+
+
+def definitions(statements: list) -> list:
+    """
+    Returns the DEF statements among statements and the statements nested
+    in them, in source order.
+    """
+    return [statement for statement in declarations(statements)
+            if isinstance(statement, Statement.Def)]
+
+
+def count_statements(statements: list) -> int:
+    """
+    Counts statements including the ones nested in loop and if bodies.
+    """
+    count = 0
+    for statement in statements:
+        count += 1
+        body = getattr(statement, "body", None)
+        if body is not None:
+            count += count_statements(body)
+    return count
+
+
+def increment_step(assign_stmnt: Statement.Assignment):
+    """
+    Returns the constant added to the variable by an assignment of the form
+    LET v = v + c, LET v = c + v or LET v = v - c, or None for any other
+    assignment.
+    """
+    expr = assign_stmnt.expr
+    if (not isinstance(expr, Expression.Binary)
+            or expr.operator not in (Operators.ADD_OP, Operators.SUB_OP)):
+        return None
+    if (is_variable(expr.l_expr, assign_stmnt.identifier)
+            and isinstance(expr.r_expr, Expression.Literal)):
+        if expr.operator == Operators.SUB_OP:
+            return -expr.r_expr.value
+        return expr.r_expr.value
+    if (expr.operator == Operators.ADD_OP
+            and isinstance(expr.l_expr, Expression.Literal)
+            and is_variable(expr.r_expr, assign_stmnt.identifier)):
+        return expr.l_expr.value
+    return None
+
+
+def located(statement, original):
+    """
+    Gives a rewritten statement the source line and line number of the
+    statement it replaces, if the parser recorded them.
+    """
+    if hasattr(original, "line"):
+        statement.line = original.line
+    if hasattr(original, "label"):
+        statement.label = original.label
+    return statement
+
+
+def unchanged(old, new) -> bool:
+    """
+    Checks if a rewritten field is the same node, or list of the same
+    nodes, as before.
+    """
+    if isinstance(old, list):
+        return len(old) == len(new) and all(
+            old_item is new_item for old_item, new_item in zip(old, new))
+    return old is new
+
+
+def is_variable(expr, identifier: str) -> bool:
+    """
+    Checks if an expression is a reference to the given variable.
+    """
+    return (isinstance(expr, Expression.Variable)
+            and expr.identifier == identifier)
@@ -0,0 +1,129 @@
+"""
+Python Implementation of Parallel Parsing for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from basic_scanner import Scanner
+from basic_parser import Parser
+from basic_incremental import nesting, scan_line
+from basic_program import Program, dump
+
+"""
+This file includes a parallel front end for very large programs. The
+top-level statements of a program are independent parse units, so the
+source is split at top-level statement boundaries by a cheap pass over
+the first word of every line which tracks the DO/LOOP and IF/END IF
+nesting depth. Only the lines starting with one of these words are
+scanned, to tell a single line IF from one opening a body the way the
+parser does. The resulting chunks are scanned and parsed in a process
+pool, and their statements are concatenated in order.
+"""
+
+# first words of a line, after its line number, which may open or close
+# a body
+NESTING = re.compile(r"\s*(\d+\s*)?(DO|IF|LOOP|END)\b", re.IGNORECASE)
+# smallest number of lines worth sending to another process
+MIN_CHUNK_LINES = 2000
+
+
+def split_top_level(lines: list, chunks: int) -> list:
+    """
+    Splits source lines into chunks of roughly equal size which start and
+    end at top-level statement boundaries.
+
+    Parameters:
+    lines (list): the source lines
+    chunks (int): the number of chunks wanted
+
+    Returns:
+    list of (first_line, lines) of each chunk
+    """
+    size = max(len(lines) // chunks, 1)
+    result = []
+    start = depth = 0
+    for index, line in enumerate(lines):
+        if NESTING.match(line):
+            depth += nesting(scan_line(line))
+        if depth <= 0:
+            depth = 0
+            if index + 1 - start >= size:
+                result.append((start, lines[start:index + 1]))
+                start = index + 1
+    if start < len(lines):
+        result.append((start, lines[start:]))
+    return result
+
+
+def parse_chunk(chunk: tuple) -> list:
+    """
+    Scans and parses the top-level statements of a chunk.
+
+    Parameters:
+    chunk (tuple): the index of the first line and the lines of the chunk
+
+    Returns:
+    the list of statements of the chunk
+    """
+    first_line, lines = chunk
+    return Parser(Scanner(lines, first_line)).statements()
+
+
+def parse_parallel(lines: list, workers: int = None) -> Program:
+    """
+    Parses a program using a process pool. Small programs are parsed in
+    the current process.
+
+    Parameters:
+    lines (list): the source lines
+    workers (int): number of processes, by default the number of cores
+
+    Raises:
+    ScannerError, ParserError: as a sequential parse would
+
+    Returns:
+    the Program, identical to the one of a sequential parse
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = min(workers * 4, len(lines) // MIN_CHUNK_LINES)
+    if workers == 1 or chunks < 2:
+        return Parser(Scanner(lines)).program()
+    statements = []
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk in executor.map(parse_chunk,
+                                  split_top_level(lines, chunks)):
+            statements.extend(chunk)
+    return Program(statements)
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    The parallel parser can be timed and compared with a sequential parse
+    using the following command:
+
+    python3 basic_parallel.py <filename> [--workers N]
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Time parallel parsing of a BASIC file.")
+    arg_parser.add_argument("filename", help="BASIC source file")
+    arg_parser.add_argument("--workers", type=int,
+                            help="number of processes")
+    args = arg_parser.parse_args()
+    with open(args.filename, "r") as f:
+        lines = f.readlines()
+    start = time.perf_counter()
+    sequential = Parser(Scanner(lines)).program()
+    print("sequential: {:.3f}s".format(time.perf_counter() - start))
+    start = time.perf_counter()
+    parallel = parse_parallel(lines, args.workers)
+    print("parallel:   {:.3f}s".format(time.perf_counter() - start))
+    if dump(parallel) != dump(sequential):
+        print("The parallel parse differs from the sequential parse")
+
+
+if __name__ == "__main__":
+    main()
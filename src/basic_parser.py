@@ -10,19 +10,36 @@ Created by Nihad Kalathingal and Nick Green on 3/19/2020. Modified (03-20-2020)
     Nick Green (ngreen@students.kennesaw.edu)
 """
 
-from basic_scanner import *   # import scanner and scanner errors
-from basic_tokens import *  # import the basic subset with the tokens
+from basic_scanner import Scanner, ScannerError  # import scanner and errors
+from basic_scanner import TokenBuffer, token_buffer
+# import the basic subset with the tokens
+from basic_tokens import Delimiters, Identifiers, Keywords, Literals
+from basic_tokens import TOKEN_TYPES
+from basic_tokens import Operators, PRECEDENCE, PREFIX_PRECEDENCE
 import sys  # import sys used for CLI args
-from basic_program import *
+from basic_program import Expression, Statement, Program, dump
 """
 The parser is implemented as functions which uses the BNF grammar rules
 specified for the chosen Basic subset. The implementation is direct
 in the sense that each non-terminal in the grammar has a function.
-The parser uses the scanner to retrieve tokens specified by the Token
-in the lex() function. The parser throws a ParserError if an invalid
-statment is found.
+The parser has the scanner fill a TokenBuffer with the tokens of the
+whole source, and walks it with an integer cursor in the lex() function,
+peek() looks further ahead without moving the cursor. The parser throws a
+ParserError if an invalid statment is found.
 """
 
+# the precedence of the binary and of the prefix operators by the id of
+# their token type, None for other tokens, so the expression parser looks
+# them up without hashing the token types
+PRECEDENCE_IDS = tuple(PRECEDENCE.get(token_type)
+                       for token_type in TOKEN_TYPES)
+PREFIX_PRECEDENCE_IDS = tuple(PREFIX_PRECEDENCE.get(token_type)
+                              for token_type in TOKEN_TYPES)
+# lowest precedence of the operators combined into an Expression.Binary
+ARITHMETIC_PRECEDENCE = PRECEDENCE[Operators.EQUAL_OP]
+LEFT_PEREN_ID = TOKEN_TYPES.index(Operators.LEFT_PEREN)
+RIGHT_PEREN_ID = TOKEN_TYPES.index(Operators.RIGHT_PEREN)
+
 
 class ParserError(Exception):
     """
@@ -57,11 +74,20 @@ class ParserError(Exception):
 class Parser:
     def __init__(self, scanner):
         """
-        Simple constructor to initialize next_token and lexer.
+        Simple constructor to initialize the token cursor. The scanner is
+        only run when parsing starts, see token_buffer().
         """
-        self.next_token = None
-        self.lexer = scanner.lex()
         self.scanner = scanner
+        # the parallel arrays of the TokenBuffer and the index of the next
+        # token in them
+        self.types = self.lexemes = self.lines = self.columns = None
+        self.cursor = -1
+        self.end = 0
+        # type and lexeme of the token at the cursor
+        self.next_type = None
+        self.next_lexeme = None
+        # index of each parameter of the function being defined
+        self.parameters = {}
 
     def program(self):
         """
@@ -83,178 +109,435 @@ class Parser:
         <statements> -> <statement>
                       | <statement> EOL <statements>
         """
+        if self.types is None:
+            self.load(token_buffer(self.scanner))
         # parse statemnt
         self.lex()
         statements = []
-        statements.append(self.statement())
-        # while mext token EOL parse statements
-        if self.next_token.type == Delimiters.EOL:
-            statements = statements + self.statements()
+        while True:
+            statements.append(self.statement())
+            # stop at the end of the file
+            if self.next_type == Delimiters.EOF:
+                break
+            if self.next_type != Delimiters.EOL:
+                raise ParserError(self.next_pos(),
+                                  "Expected end of line")
+            # while mext token EOL parse statements, a trailing EOL at
+            # the end of the file ends the program
+            self.lex()
+            if self.next_type == Delimiters.EOF:
+                break
         return statements
 
-    def statement(self):
+    def statement(self, label=None):
         """
         Function for the statement non-terminal following the BNF rule:
-        <statement> -> <assn_stmnt>
+        <statement> -> [<line_number>] <statement_body>
+        <statement_body> -> <assn_stmnt>
                     | <print_stmnt>
                     | <do_while>
                     | <if_stmnt>
+                    | <dim_stmnt>
+                    | <data_stmnt>
+                    | <read_stmnt>
+                    | <input_stmnt>
+                    | <def_stmnt>
+                    | GOTO <line_number>
+                    | GOSUB <line_number>
+                    | RETURN
                     | END
+
+        Parameters:
+        label (int): the line number if it was already consumed by body()
         """
         # enter statement
         # print("<statement>")
-        # choose type of statement based on next_token
+        # choose type of statement based on next_type
         statement = None
-        if self.next_token.type == Keywords.LET:
+        # source line of the statement, used to report run time profiles
+        line = self.next_pos()[0]
+        if label is None:
+            label = self.line_number()
+        if self.next_type == Keywords.LET:
             statement = self.assn_stmnt()
-        elif self.next_token.type == Keywords.PRINT:
+        elif self.next_type == Keywords.PRINT:
             statement = self.print_stmnt()
-        elif self.next_token.type == Keywords.DO:
+        elif self.next_type == Keywords.DO:
             statement = self.do_while()
-        elif self.next_token.type == Keywords.IF:
+        elif self.next_type == Keywords.IF:
             statement = self.if_stmnt()
-        elif self.next_token.type == Keywords.END:
-            statement = Statement.End()
-            #  empty statement/line, do nothing
-        elif self.next_token.type == Delimiters.EOL:
+        elif self.next_type == Keywords.DIM:
+            statement = self.dim_stmnt()
+        elif self.next_type == Keywords.DATA:
+            statement = self.data_stmnt()
+        elif self.next_type == Keywords.READ:
+            self.lex()
+            statement = Statement.Read(self.targets())
+        elif self.next_type == Keywords.INPUT:
+            statement = self.input_stmnt()
+        elif self.next_type == Keywords.DEF:
+            statement = self.def_stmnt()
+        elif self.next_type == Keywords.GOTO:
+            statement = Statement.Goto(self.target())
+        elif self.next_type == Keywords.GOSUB:
+            statement = Statement.Gosub(self.target())
+        elif self.next_type == Keywords.RETURN:
+            statement = Statement.Return()
+            # consume RETURN
+            self.lex()
+        elif self.next_type == Keywords.END:
             statement = Statement.End()
+            # consume END
+            self.lex()
+        elif self.next_type == Delimiters.EOL or (
+                label is not None and self.next_type == Delimiters.EOF):
+            statement = Statement.End(placeholder=True)
             #  empty statement/line, do nothing
         else:
             # raise a parsing error as its not a valid statement
-            raise ParserError(self.next_token.pos,
+            raise ParserError(self.next_pos(),
                               "Invalid type of statement")
+        statement.line = line
+        if label is not None:
+            statement.label = label
         # exit statement
         # print("</statement>")
         return statement
 
-    def expr(self) -> Expression:
+    def line_number(self):
         """
-        Function for the expr non-terminal following the BNF rule:
-        <expression> -> <addition> ((EQUAL_OP
-                                    | LESS_THAN
-                                    |  GREATER_THAN
-                                    | NOT_GREATER
-                                    | NOT_LESS) <addition>)*
+        Function for the optional line number at the start of a statement
+        following the BNF rule:
+        <line_number> -> INT_LIT
+
+        Returns:
+        the line number or None if the statement is not numbered
         """
-        # lex to get the first term in expression
+        if self.next_type != Literals.INT_LIT:
+            return None
+        label = int(self.next_lexeme)
+        # consume line number
         self.lex()
-        expr = self.addition()
-        # iterate while there are more comparison operations
-        while self.next_token.type in (Operators.EQUAL_OP,
-                                       Operators.LESS_THAN,
-                                       Operators.GREATER_THAN,
-                                       Operators.NOT_GREATER,
-                                       Operators.NOT_LESS):
-            operator = self.next_token.type
-            self.lex()
-            right = self.addition()
-            # combine expressions
-            expr = Expression.Binary(expr, operator, right)
-        return expr
+        return label
 
-    def addition(self) -> Expression:
+    def target(self) -> int:
         """
-        Function for the addition non-terminal following the BNF rule:
-        <addition> -> <multiplication> ((ADD_OP | SUB_OP) <multiplication>)
+        Function for the line number following GOTO and GOSUB.
         """
-        expr = self.multiplication()
-        # iterate while there are more addition/substraction operations
-        while self.next_token.type in (Operators.ADD_OP, Operators.SUB_OP):
-            operator = self.next_token.type
-            self.lex()
-            right = self.multiplication()
-            # combine expressions
-            expr = Expression.Binary(expr, operator, right)
-        return expr
+        self.lex()
+        label = self.line_number()
+        if label is None:
+            raise ParserError(self.next_pos(), "Invalid line number")
+        return label
 
-    def multiplication(self) -> Expression:
+    def expr(self) -> Expression:
         """
-        Function for the multiplication non-terminal following the BNF rule:
+        Function for the expr non-terminal following the BNF rules:
+        <expression> -> <conjunction> (OR <conjunction>)*
+        <conjunction> -> <negation> (AND <negation>)*
+        <negation> -> NOT <negation> | <comparison>
+        <comparison> -> <addition> ((EQUAL_OP
+                                    | LESS_THAN
+                                    |  GREATER_THAN
+                                    | NOT_GREATER
+                                    | NOT_LESS) <addition>)*
+        <addition> -> <multiplication> ((ADD_OP | SUB_OP) <multiplication>)*
         <multiplication> -> <unary> ((DIV_OP | MULT_OP) <unary>)*
+        <unary> -> (ADD_OP | SUB_OP) <unary> | <primary>
+
+        The rules are implemented by precedence climbing using the
+        PRECEDENCE and PREFIX_PRECEDENCE tables instead of a function per
+        rule. Operators and open perenthesis are kept on an explicit stack,
+        so nested expressions do not recurse.
         """
-        expr = self.unary()
-        # iterate while there are more addition/substraction operations
-        while self.next_token.type in (Operators.MULT_OP, Operators.DIV_OP):
-            operator = self.next_token.type
+        # lex to get the first term in expression
+        self.lex()
+        operands = []
+        # stack of (precedence, operator, is_prefix) with None for an open
+        # perenthesis
+        operators = []
+        types = self.types
+        while True:
+            # parse prefix operators and open perenthesis before an operand
+            type_id = types[self.cursor]
+            precedence = PREFIX_PRECEDENCE_IDS[type_id]
+            if precedence is not None:
+                operators.append((precedence, self.next_type, True))
+                self.lex()
+                continue
+            if type_id == LEFT_PEREN_ID:
+                operators.append(None)
+                self.lex()
+                continue
+            operands.append(self.primary())
+            # close perenthesis following the operand
+            while types[self.cursor] == RIGHT_PEREN_ID and None in operators:
+                self.reduce(operands, operators, 0)
+                operators.pop()
+                operands.append(Expression.Grouping(operands.pop()))
+                # consume perenthesis
+                self.lex()
+            # parse the binary operator following the operand
+            precedence = PRECEDENCE_IDS[types[self.cursor]]
+            if precedence is None:
+                break
+            # combine expressions of higher or equal precedence, the
+            # arithmetic operator of a chain like a - b - c is combined here
+            # rather than by reduce()
+            while operators:
+                top = operators[-1]
+                if top is None or top[0] < precedence:
+                    break
+                if top[2] or top[0] < ARITHMETIC_PRECEDENCE:
+                    self.reduce(operands, operators, precedence)
+                    break
+                operators.pop()
+                right = operands.pop()
+                operands.append(Expression.Binary(operands.pop(), top[1],
+                                                  right))
+            operators.append((precedence, self.next_type, False))
             self.lex()
-            right = self.unary()
-            # combine expressions
-            expr = Expression.Binary(expr, operator, right)
-        return expr
+        self.reduce(operands, operators, 0)
+        if operators:
+            raise ParserError(self.next_pos(), "Mismatched perenthesis")
+        return operands[0]
 
-    def unary(self) -> Expression:
-        """
-        Function for the unary non-terminal following the BNF rule:
-        <unary> -> (ADD_OP | SUB_OP) <unary> | <primary>
+    def reduce(self, operands: list, operators: list, precedence: int):
         """
-        # check if a unary expression
-        if self.next_token.type in (Operators.ADD_OP, Operators.SUB_OP):
-            operator = self.next_token.type
-            expr = self.expr()
-            return Expression.Unary(operator, expr)
-        else:
-            # otherwise its a primary expression
-            return self.primary()
+        Combines the operands with the operators on top of the stack which
+        have at least the given precedence, up to an open perenthesis.
+
+        Parameters:
+        operands (list): stack of parsed expressions
+        operators (list): stack of (precedence, operator, is_prefix) tuples
+        precedence (int): lowest precedence to combine
+        """
+        while operators and operators[-1] is not None \
+                and operators[-1][0] >= precedence:
+            _, operator, is_prefix = operators.pop()
+            right = operands.pop()
+            if operator == Keywords.NOT:
+                operands.append(Expression.Not(right))
+            elif is_prefix:
+                operands.append(Expression.Unary(operator, right))
+            elif operator in (Keywords.AND, Keywords.OR):
+                operands.append(Expression.Logical(operands.pop(), operator,
+                                                   right))
+            else:
+                operands.append(Expression.Binary(operands.pop(), operator,
+                                                  right))
 
     def primary(self):
         """
-        Function for the unary non-terminal following the BNF rule:
+        Function for the primary non-terminal following the BNF rule:
         <primary > -> FLOAT_LIT
                     | INT_LIT
-                    | RIGHT_PEREN < expr > LEFT_PEREN
+                    | IDENT
+                    | IDENT LEFT_PEREN <expr> RIGHT_PEREN
+                    | <call>
+        Perenthesized expressions are parsed by expr().
         """
         # parse literals
-        if self.next_token.type == Literals.FLOAT_LIT:
+        if self.next_type == Literals.FLOAT_LIT:
             expr = Expression.Literal(Literals.FLOAT_LIT,
-                                      float(self.next_token.lexeme))
+                                      float(self.next_lexeme))
             # consume literal
             self.lex()
             return expr
-        elif self.next_token.type == Literals.INT_LIT:
+        elif self.next_type == Literals.INT_LIT:
             expr = Expression.Literal(Literals.INT_LIT,
-                                      int(self.next_token.lexeme))
+                                      int(self.next_lexeme))
             # consume literal
             self.lex()
             return expr
-        # parse a grouping expressions
-        elif self.next_token.type == Operators.LEFT_PEREN:
-            expr = self.expr()
-            if self.next_token.type != Operators.RIGHT_PEREN:
-                raise ParserError(self.next_token.pos,
-                                  "Mismatched perenthesis")
-            # consume perenthesis
-            self.lex()
-            return Expression.Grouping(expr)
         # parse identifiers
-        elif self.next_token.type == Identifiers.IDENT:
-            expr = Expression.Variable(self.next_token.lexeme)
+        elif self.next_type == Identifiers.IDENT:
+            identifier = self.next_lexeme
             # consume identifier
             self.lex()
-            return expr
+            if is_function(identifier):
+                return self.call(identifier)
+            if identifier in self.parameters:
+                return Expression.Parameter(identifier,
+                                            self.parameters[identifier])
+            if self.next_type == Operators.LEFT_PEREN:
+                # parse the subscript of an array element
+                return Expression.Index(identifier, self.subscript())
+            return Expression.Variable(identifier)
         else:
             # raise an erorr because an illegal primary was recieved
-            raise ParserError(self.next_token.pos, "Illegal primary")
+            raise ParserError(self.next_pos(), "Illegal primary")
+
+    def subscript(self) -> Expression:
+        """
+        Function for the subscript of an array following the BNF rule:
+        <subscript> -> LEFT_PEREN <expr> RIGHT_PEREN
+        """
+        index = self.expr()
+        if self.next_type != Operators.RIGHT_PEREN:
+            raise ParserError(self.next_pos(), "Invalid subscript")
+        # consume perenthesis
+        self.lex()
+        return index
+
+    def call(self, name: str) -> Expression:
+        """
+        Function for the call non-terminal following the BNF rule:
+        <call> -> IDENT [LEFT_PEREN <expr> (COMMA <expr>)* RIGHT_PEREN]
+        where the identifier is FN followed by one letter.
+        """
+        args = []
+        if self.next_type == Operators.LEFT_PEREN:
+            while True:
+                args.append(self.expr())
+                if self.next_type != Delimiters.COMMA:
+                    break
+            if self.next_type != Operators.RIGHT_PEREN:
+                raise ParserError(self.next_pos(), "Invalid call")
+            # consume perenthesis
+            self.lex()
+        return Expression.Call(name, args)
+
+    def def_stmnt(self):
+        """
+        Function for the def_stmnt non-terminal following the BNF rule:
+        <def_stmnt> -> DEF IDENT [LEFT_PEREN IDENT (COMMA IDENT)*
+                       RIGHT_PEREN] EQUAL_OP <expr>
+        where the function name is FN followed by one letter. The
+        parameters are replaced by Expression.Parameter nodes in the body.
+        """
+        self.lex()
+        name = self.next_lexeme
+        if self.next_type != Identifiers.IDENT \
+                or not is_function(name):
+            raise ParserError(self.next_pos(), "Invalid function name")
+        self.lex()
+        parameters = []
+        if self.next_type == Operators.LEFT_PEREN:
+            while True:
+                self.lex()
+                if self.next_type != Identifiers.IDENT \
+                        or is_function(self.next_lexeme) \
+                        or self.next_lexeme in parameters:
+                    raise ParserError(self.next_pos(),
+                                      "Invalid parameter")
+                parameters.append(self.next_lexeme)
+                self.lex()
+                if self.next_type != Delimiters.COMMA:
+                    break
+            if self.next_type != Operators.RIGHT_PEREN:
+                raise ParserError(self.next_pos(),
+                                  "Invalid DEF statement")
+            self.lex()
+        if self.next_type != Operators.EQUAL_OP:
+            raise ParserError(self.next_pos(), "Invalid DEF statement")
+        self.parameters = {parameter: index
+                           for index, parameter in enumerate(parameters)}
+        try:
+            expression = self.expr()
+        finally:
+            self.parameters = {}
+        return Statement.Def(name, parameters, expression)
+
+    def dim_stmnt(self):
+        """
+        Function for the dim_stmnt non-terminal following the BNF rule:
+        <dim_stmnt> -> DIM IDENT <subscript>
+        """
+        self.lex()
+        identifier = self.next_lexeme
+        if self.next_type != Identifiers.IDENT:
+            raise ParserError(self.next_pos(),
+                              "Invalid identifier in DIM statement")
+        self.lex()
+        if self.next_type != Operators.LEFT_PEREN:
+            raise ParserError(self.next_pos(), "Invalid DIM statement")
+        return Statement.Dim(identifier, self.subscript())
+
+    def data_stmnt(self):
+        """
+        Function for the data_stmnt non-terminal following the BNF rule:
+        <data_stmnt> -> DATA <constant> (COMMA <constant>)*
+        <constant> -> [ADD_OP | SUB_OP] (INT_LIT | FLOAT_LIT)
+        """
+        values = []
+        while True:
+            self.lex()
+            sign = 1
+            if self.next_type in (Operators.ADD_OP, Operators.SUB_OP):
+                if self.next_type == Operators.SUB_OP:
+                    sign = -1
+                self.lex()
+            if self.next_type == Literals.INT_LIT:
+                values.append(sign * int(self.next_lexeme))
+            elif self.next_type == Literals.FLOAT_LIT:
+                values.append(sign * float(self.next_lexeme))
+            else:
+                raise ParserError(self.next_pos(), "Invalid DATA value")
+            self.lex()
+            if self.next_type != Delimiters.COMMA:
+                return Statement.Data(values)
+
+    def targets(self) -> list:
+        """
+        Function for the targets of READ and INPUT following the BNF rule:
+        <targets> -> <target> (COMMA <target>)*
+        <target> -> IDENT | IDENT <subscript>
+        """
+        targets = []
+        while True:
+            if self.next_type != Identifiers.IDENT:
+                raise ParserError(self.next_pos(), "Invalid target")
+            targets.append(self.primary())
+            if self.next_type != Delimiters.COMMA:
+                return targets
+            self.lex()
+
+    def input_stmnt(self):
+        """
+        Function for the input_stmnt non-terminal following the BNF rule:
+        <input_stmnt> -> INPUT [HASH INT_LIT COMMA] <targets>
+        """
+        self.lex()
+        channel = 0
+        if self.next_type == Delimiters.HASH:
+            self.lex()
+            if self.next_type != Literals.INT_LIT:
+                raise ParserError(self.next_pos(), "Invalid channel")
+            channel = int(self.next_lexeme)
+            self.lex()
+            if self.next_type != Delimiters.COMMA:
+                raise ParserError(self.next_pos(),
+                                  "Invalid INPUT statement")
+            self.lex()
+        return Statement.Input(channel, self.targets())
 
     def assn_stmnt(self):
         """
         Function for the assn_stmnt non-terminal following the BNF rule:
-        <assn_stment> -> LET IDENT EQUAL_OP <expr>
+        <assn_stment> -> LET IDENT [<subscript>] EQUAL_OP <expr>
         """
         # enter assig_stmnt
         # print("<assn_stmnt>")
         # check for identifier
         self.lex()
-        identifier = self.next_token.lexeme
-        if self.next_token.type != Identifiers.IDENT:
-            raise ParserError(self.next_token.pos,
+        identifier = self.next_lexeme
+        if self.next_type != Identifiers.IDENT:
+            raise ParserError(self.next_pos(),
                               "Invalid identifier in assignment statement")
-        # check for assinment operator
+        # parse the subscript of an array element
         self.lex()
-        if self.next_token.type != Operators.EQUAL_OP:
-            raise ParserError(self.next_token.pos,
+        index = None
+        if self.next_type == Operators.LEFT_PEREN:
+            index = self.subscript()
+        # check for assinment operator
+        if self.next_type != Operators.EQUAL_OP:
+            raise ParserError(self.next_pos(),
                               "Invalid assignment statement")
         # parse an expression
         expression = self.expr()
+        if index is not None:
+            return Statement.ElementAssignment(identifier, index, expression)
 
         # exit assig_stmnt
         # print("</assn_stmnt>")
@@ -283,48 +566,62 @@ class Parser:
         # check for while statement
         self.lex()
         # if no while raise an error
-        if self.next_token.type != Keywords.WHILE:
-            raise ParserError(self.next_token.pos, "Invalid loop")
+        if self.next_type != Keywords.WHILE:
+            raise ParserError(self.next_pos(), "Invalid loop")
         # parse relational expression
         rel_exp = self.expr()
         # parse the body
         body = self.body()
         # check for loop end else raise error
-        if self.next_token.type != Keywords.LOOP:
-            raise ParserError(self.next_token.pos, "Invalid loop")
+        if self.next_type != Keywords.LOOP:
+            raise ParserError(self.next_pos(), "Invalid loop")
         # check for loop EOL else raise error
         self.lex()
-        if self.next_token.type != Delimiters.EOL:
-            raise ParserError(self.next_token.pos, "Invalid loop")
+        if self.next_type not in (Delimiters.EOL, Delimiters.EOF):
+            raise ParserError(self.next_pos(), "Invalid loop")
         # exit do_while
         # print("</do_while>")
         return Statement.DoWhile(rel_exp, body)
 
     def if_stmnt(self):
         """
-        Function for the if_stmnt non-terminal following the BNF rule:
-        <if_stmnt> ->  IF <relational-expression> THEN EOL <body> IF EOL
+        Function for the if_stmnt non-terminal following the BNF rules:
+        <if_stmnt> ->  IF <relational-expression> THEN EOL <body> END IF EOL
+                    | IF <relational-expression> THEN <line_number>
+                    | IF <relational-expression> THEN <statement_body>
+        The single line forms take one statement other than DO or IF, THEN
+        followed by a line number jumps to it.
         """
         # enter if_stmnt
         # print("<if_stmnt>")
         # parse relational expression
         rel_exp = self.expr()
         # check for if otherwise raise error
-        if self.next_token.type != Keywords.THEN:
-            raise ParserError(self.next_token.pos, "Invalid if statement")
-        # check for EOL, otherwise raise error
+        if self.next_type != Keywords.THEN:
+            raise ParserError(self.next_pos(), "Invalid if statement")
         self.lex()
-        if self.next_token.type != Delimiters.EOL:
-            raise ParserError(self.next_token.pos, "Invalid if statement")
+        # parse the single line forms
+        if self.next_type == Literals.INT_LIT:
+            line = self.next_pos()[0]
+            goto = Statement.Goto(self.line_number())
+            goto.line = line
+            return Statement.If(rel_exp, [goto])
+        if self.next_type in (Keywords.DO, Keywords.IF):
+            raise ParserError(self.next_pos(), "Invalid if statement")
+        if self.next_type not in (Delimiters.EOL, Delimiters.EOF):
+            return Statement.If(rel_exp, [self.statement()])
+        # check for EOL, otherwise raise error
+        if self.next_type != Delimiters.EOL:
+            raise ParserError(self.next_pos(), "Invalid if statement")
         # parse the body
         body = self.body()
         # check for end if otherwise raise error
-        if self.next_token.type != Keywords.IF:
-            raise ParserError(self.next_token.pos, "Invalid if statement")
+        if self.next_type != Keywords.IF:
+            raise ParserError(self.next_pos(), "Invalid if statement")
         # check for EOL, otherwise raise error
         self.lex()
-        if self.next_token.type != Delimiters.EOL:
-            raise ParserError(self.next_token.pos, "Invalid if statement")
+        if self.next_type not in (Delimiters.EOL, Delimiters.EOF):
+            raise ParserError(self.next_pos(), "Invalid if statement")
         # exit if_stmnt
         # print("</if_stmnt>")
         return Statement.If(rel_exp, body)
@@ -333,36 +630,80 @@ class Parser:
         """
         Function for the body non-terminal following the BNF rule:
         body -> <statement><body>
-            |<statement> IF
-            |<statement> LOOP
+            | [<line_number>] END IF
+            | [<line_number>] LOOP
+        The line numbers of END IF and LOOP are ignored, they can not be
+        jumped to.
         """
         # enter body
         # print("<body>")
         statements = []
         self.lex()
         # parse statements while not end of loop/if statement
-        while(self.next_token.type != Keywords.IF
-              and self.next_token.type != Keywords.LOOP):
-            statements.append(self.statement())
+        while True:
+            label = self.line_number()
+            if self.next_type == Keywords.LOOP:
+                break
+            if self.next_type == Keywords.END:
+                # END IF closes the body of an if statement
+                if self.peek() == Keywords.IF:
+                    self.lex()
+                    break
+                if self.peek() != Delimiters.EOL:
+                    self.lex()
+                    raise ParserError(self.next_pos(),
+                                      "Invalid end statement")
+            statements.append(self.statement(label))
             self.lex()
         # exit body
         # print("</body>")
         return statements
 
+    def load(self, buffer: TokenBuffer):
+        """
+        Sets the tokens to parse, the cursor starts before the first token.
+
+        Parameters:
+        buffer (TokenBuffer): the tokens, ending with an EOF token
+        """
+        self.types, self.lexemes = buffer.types, buffer.lexemes
+        self.lines, self.columns = buffer.lines, buffer.columns
+        self.cursor = -1
+        self.end = len(buffer)
+
     def lex(self):
         """
-        retrieves next token from scanner and assigns the next token to a
-        instance available variable, to be used by other parser functions.
+        Moves the cursor to the next token and assigns its type and lexeme
+        to instance variables, to be used by other parser functions. The
+        cursor stays on the EOF token at the end.
         """
-        try:
-            # get the next token
-            token = next(self.lexer)
-        except ScannerError as e:
-            # catch any errors and print them
-            print(e)
-        # print the token
-        # print(token)
-        self.next_token = token
+        if self.cursor + 1 < self.end:
+            self.cursor += 1
+        self.next_type = TOKEN_TYPES[self.types[self.cursor]]
+        self.next_lexeme = self.lexemes[self.cursor]
+
+    def peek(self, k: int = 1):
+        """
+        Returns the type of the token k tokens after the cursor without
+        moving it, the EOF type past the end.
+        """
+        return TOKEN_TYPES[self.types[min(self.cursor + k, self.end - 1)]]
+
+    def next_pos(self) -> tuple:
+        """
+        Returns the position (row, column) of the token at the cursor.
+        """
+        return (self.lines[self.cursor], self.columns[self.cursor])
+
+
+def is_function(identifier: str) -> bool:
+    """
+    Checks if an identifier names a user defined function, which is FN
+    followed by one letter as in ECMA 116. Longer identifiers starting
+    with FN, like fname, are variables.
+    """
+    return len(identifier) == 3 and identifier[:2].upper() == "FN" \
+        and identifier[2].isalpha()
 
 
 def main():
@@ -385,16 +726,18 @@ def main():
     # exception handling
     with open(filename, "r") as f:
         scanner = Scanner(f)  # create a scanner object with a source file
-        # make the generator global to be used with parser functions
         parser = Parser(scanner)
         # try catch to catch any parser errors
         try:
             # start parsing the program
             parse_tree = parser.program()
-            print(parse_tree)
+            print(dump(parse_tree))
         except ParserError as e:
             # if a parsing error occurred, alert the user
             print(e)
+        except ScannerError as e:
+            # if a scanning error occurred, alert the user
+            print(e)
         except Exception as e:
             # print any other errors
             print(e)
@@ -0,0 +1,202 @@
+"""
+Python Implementation of a Sampling Profiler for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import signal
+import sys
+from collections import Counter
+from basic_interpreter import Interpreter, InterpreterError
+from basic_parser import Parser, ParserError
+from basic_program import Statement
+from basic_scanner import Scanner, ScannerError
+
+"""
+This file includes a sampling profiler which maps the time spent by the
+interpreter to BASIC source lines. A profiling interval timer (SIGPROF)
+interrupts the interpreter at a fixed interval of CPU time, and the signal
+handler walks the Python stack of the interrupted frame. Every frame of
+Interpreter.execute holds the statement being executed, so the frames
+give the statement running on top of the nesting path of the DO WHILE and
+IF statements enclosing it. Nothing is recorded between samples, so the
+cost does not depend on how many statements the program executes.
+
+The samples are written as collapsed stacks, one line per nesting path
+followed by its number of samples, which flame graph tools read directly:
+
+    program;2 DO WHILE;3 DO WHILE;4 LET 153
+"""
+
+# default seconds of CPU time between samples
+INTERVAL = 0.005
+
+# BASIC keywords of the statement nodes, used to name the frames
+KEYWORDS = {
+    Statement.Assignment: "LET",
+    Statement.Print: "PRINT",
+    Statement.DoWhile: "DO WHILE",
+    Statement.If: "IF",
+    Statement.End: "END",
+    Statement.Increment: "LET",
+    Statement.PrintVariable: "PRINT",
+    Statement.Dim: "DIM",
+    Statement.ElementAssignment: "LET",
+    Statement.Guarded: "DO WHILE",
+    Statement.Data: "DATA",
+    Statement.Read: "READ",
+    Statement.Input: "INPUT",
+    Statement.Goto: "GOTO",
+    Statement.Gosub: "GOSUB",
+    Statement.Return: "RETURN",
+    Statement.Def: "DEF",
+}
+
+
+class SamplingProfiler:
+    """
+    Samples the statements an interpreter is executing. Only one profiler
+    can be active at a time, as it owns the SIGPROF handler.
+    """
+
+    def __init__(self, interpreter: Interpreter, interval: float = INTERVAL):
+        """
+        Arguments:
+            interpreter {Interpreter} -- The interpreter to sample, which can
+            be a subclass of Interpreter.
+            interval {float} -- Seconds of CPU time between samples.
+        """
+        self.interval = interval
+        # code objects of the execute methods of the interpreter class
+        self.codes = {cls.__dict__["execute"].__code__
+                      for cls in type(interpreter).__mro__
+                      if "execute" in cls.__dict__}
+        self.samples = Counter()
+        self.previous = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """
+        Installs the signal handler and starts the interval timer.
+        """
+        self.previous = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        """
+        Stops the interval timer and restores the previous signal handler.
+        """
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        if self.previous is not None:
+            signal.signal(signal.SIGPROF, self.previous)
+            self.previous = None
+
+    def sample(self, signum, frame):
+        """
+        Signal handler which records the nesting path of the statement
+        being executed in the interrupted frame.
+        """
+        codes = self.codes
+        path = []
+        while frame is not None:
+            if frame.f_code in codes:
+                statement = frame.f_locals["statement"]
+                # an execute method overridden by a subclass, like the
+                # ones of basic_hooks.py, calls the base method with the
+                # same statement, which is recorded once
+                if not path or path[-1] is not statement:
+                    path.append(statement)
+            frame = frame.f_back
+        if path:
+            # the statements are found from the innermost outwards
+            self.samples[tuple(reversed(path))] += 1
+
+    def collapsed(self) -> str:
+        """
+        Returns the samples as collapsed stacks for flame graph tools.
+        """
+        lines = []
+        for path, count in sorted(self.samples.items(),
+                                  key=lambda item: -item[1]):
+            frames = ["program"] + [frame_name(statement)
+                                    for statement in path]
+            lines.append("{} {}".format(";".join(frames), count))
+        return "\n".join(lines)
+
+    def report(self, limit: int = 10) -> str:
+        """
+        Returns a human readable table of the lines with the most samples,
+        counting the samples of a line itself (self) and the samples of the
+        statements nested in it (total).
+
+        Arguments:
+            limit {int} -- The number of lines listed.
+        """
+        own, total = Counter(), Counter()
+        for path, count in self.samples.items():
+            own[frame_name(path[-1])] += count
+            # a line appears once in a path unless it is a one line loop
+            for name in set(frame_name(statement) for statement in path):
+                total[name] += count
+        samples = sum(self.samples.values()) or 1
+        lines = ["Profile ({} samples every {}s):".format(
+            sum(self.samples.values()), self.interval),
+            "  {:>7}  {:>7}  {}".format("self", "total", "line")]
+        for name, count in total.most_common(limit):
+            lines.append("  {:>6.1f}%  {:>6.1f}%  {}".format(
+                100 * own[name] / samples, 100 * count / samples, name))
+        return "\n".join(lines)
+
+
+def frame_name(statement) -> str:
+    """
+    Returns the name of a statement in a profile, its source line followed
+    by its keyword.
+    """
+    return "{} {}".format(getattr(statement, "line", "?"),
+                          KEYWORDS.get(type(statement), "?"))
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    A BASIC file can be profiled with the following command:
+
+    python3 basic_profiler.py <filename> [--interval SECONDS] [-o FILE]
+
+    The collapsed stacks are written to FILE (<filename>.folded by default)
+    and a table of the busiest lines is printed to STDERR. The profiler can
+    also be enabled with the --profile option of basic_interpreter.py.
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Profile a BASIC program by sampling.")
+    arg_parser.add_argument("filename", help="BASIC source file")
+    arg_parser.add_argument("--interval", type=float, default=INTERVAL,
+                            metavar="SECONDS",
+                            help="seconds of CPU time between samples")
+    arg_parser.add_argument("-o", "--output", metavar="FILE",
+                            help="file for the collapsed stacks")
+    args = arg_parser.parse_args()
+    with open(args.filename, "r") as f:
+        parser = Parser(Scanner(f.readlines()))
+    try:
+        program = parser.program()
+        interpreter = Interpreter(parser)
+        with SamplingProfiler(interpreter, args.interval) as profiler:
+            interpreter.run(program)
+    except (ParserError, ScannerError, InterpreterError) as e:
+        # if the program is invalid or fails, alert the user
+        print(e)
+        return
+    with open(args.output or args.filename + ".folded", "w") as f:
+        print(profiler.collapsed(), file=f)
+    print(profiler.report(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
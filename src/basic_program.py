@@ -10,7 +10,7 @@ Created by Nihad Kalathingal and Nick Green on 4/26/2020. Modified (04-30-2020)
     Nick Green (ngreen@students.kennesaw.edu)
 """
 from basic_tokens import Operators, Literals, Identifiers, Tokens
-from typing import Union
+from basic_tokens import Keywords
 from abc import ABC, abstractmethod
 
 """
@@ -80,6 +80,71 @@ class ExpressionVisitor(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def visit_compare(self, compare_exp):
+        """
+        Visit method for a fused variable/constant comparison.
+
+        Arguments:
+            compare_exp {Expression.Compare} -- The comparison expression
+            visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_logical(self, logical_exp):
+        """
+        Visit method for an AND or OR expression.
+
+        Arguments:
+            logical_exp {Expression.Logical} -- The logical expression
+            visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_not(self, not_exp):
+        """
+        Visit method for a NOT expression.
+
+        Arguments:
+            not_exp {Expression.Not} -- The NOT expression visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_index(self, index_exp):
+        """
+        Visit method for an array element expression.
+
+        Arguments:
+            index_exp {Expression.Index} -- The array element expression
+            visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_call(self, call_exp):
+        """
+        Visit method for a call of a user defined function.
+
+        Arguments:
+            call_exp {Expression.Call} -- The call expression visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_parameter(self, parameter_exp):
+        """
+        Visit method for a parameter in the body of a user defined
+        function.
+
+        Arguments:
+            parameter_exp {Expression.Parameter} -- The parameter expression
+            visited.
+        """
+        raise NotImplementedError
+
 
 class Expression:
     """
@@ -158,6 +223,95 @@ class Expression:
         def accept(self, visitor: ExpressionVisitor):
             return visitor.visit_variable(self)
 
+    class Compare:
+        """
+        Fused form of a binary comparison between a variable and a literal,
+        such as the condition of a counting loop. Created by the optimizer
+        rather than the parser.
+        """
+
+        def __init__(self, identifier: str, operator: Operators, value):
+            super().__init__()
+            self.identifier = identifier
+            self.operator = operator
+            self.value = value
+
+        def accept(self, visitor: ExpressionVisitor):
+            return visitor.visit_compare(self)
+
+    class Logical:
+        """
+        Encapsulates the operator (AND or OR) and the operands of a logical
+        expression. The right operand is only evaluated if the left one
+        does not decide the value.
+        """
+
+        def __init__(self, l_expr, operator: Keywords, r_expr):
+            super().__init__()
+            self.l_expr = l_expr
+            self.operator = operator
+            self.r_expr = r_expr
+
+        def accept(self, visitor: ExpressionVisitor):
+            return visitor.visit_logical(self)
+
+    class Not:
+        """
+        Encapsulates the operand of a NOT expression.
+        """
+
+        def __init__(self, expr):
+            super().__init__()
+            self.expr = expr
+
+        def accept(self, visitor: ExpressionVisitor):
+            return visitor.visit_not(self)
+
+    class Index:
+        """
+        Encapsulates the identifier of an array and the subscript expression
+        of an array element. The subscript is only bounds checked if checked
+        is set, the optimizer clears it for subscripts which were checked
+        before entering a loop.
+        """
+
+        def __init__(self, identifier: str, index, checked: bool = True):
+            super().__init__()
+            self.identifier = identifier
+            self.index = index
+            self.checked = checked
+
+        def accept(self, visitor: ExpressionVisitor):
+            return visitor.visit_index(self)
+
+    class Call:
+        """
+        Encapsulates the name and argument expressions of a call of a
+        function defined by DEF. The Statement.Def called is set in
+        function when the program is loaded.
+        """
+
+        def __init__(self, name: str, args: list, function=None):
+            self.name = name
+            self.args = args
+            self.function = function
+
+        def accept(self, visitor: ExpressionVisitor):
+            return visitor.visit_call(self)
+
+    class Parameter:
+        """
+        Encapsulates a parameter in the body of a function, which is the
+        argument at index of the call being evaluated.
+        """
+
+        def __init__(self, identifier: str, index: int):
+            self.identifier = identifier
+            self.index = index
+
+        def accept(self, visitor: ExpressionVisitor):
+            return visitor.visit_parameter(self)
+
 
 class StatementVisitor(ABC):
 
@@ -213,6 +367,129 @@ class StatementVisitor(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def visit_increment(self, increment_stmnt):
+        """
+        Visit method for a fused increment statement.
+
+        Arguments:
+            increment_stmnt {Statement.Increment} -- The increment statement
+            visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_print_variable(self, print_stmnt):
+        """
+        Visit method for a fused print of a variable.
+
+        Arguments:
+            print_stmnt {Statement.PrintVariable} -- The print statement
+            visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_dim(self, dim_stmnt):
+        """
+        Visit method for an array declaration.
+
+        Arguments:
+            dim_stmnt {Statement.Dim} -- The DIM statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_element_assignment(self, assign_stmnt):
+        """
+        Visit method for an assignment to an array element.
+
+        Arguments:
+            assign_stmnt {Statement.ElementAssignment} -- The assignment
+            statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_guarded(self, guarded_stmnt):
+        """
+        Visit method for a loop with hoisted bounds checks.
+
+        Arguments:
+            guarded_stmnt {Statement.Guarded} -- The guarded loop visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_data(self, data_stmnt):
+        """
+        Visit method for a DATA statement.
+
+        Arguments:
+            data_stmnt {Statement.Data} -- The DATA statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_read(self, read_stmnt):
+        """
+        Visit method for a READ statement.
+
+        Arguments:
+            read_stmnt {Statement.Read} -- The READ statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_input(self, input_stmnt):
+        """
+        Visit method for an INPUT statement.
+
+        Arguments:
+            input_stmnt {Statement.Input} -- The INPUT statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_goto(self, goto_stmnt):
+        """
+        Visit method for a GOTO statement.
+
+        Arguments:
+            goto_stmnt {Statement.Goto} -- The GOTO statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_gosub(self, gosub_stmnt):
+        """
+        Visit method for a GOSUB statement.
+
+        Arguments:
+            gosub_stmnt {Statement.Gosub} -- The GOSUB statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_return(self, return_stmnt):
+        """
+        Visit method for a RETURN statement.
+
+        Arguments:
+            return_stmnt {Statement.Return} -- The RETURN statement visited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def visit_def(self, def_stmnt):
+        """
+        Visit method for a DEF statement.
+
+        Arguments:
+            def_stmnt {Statement.Def} -- The DEF statement visited.
+        """
+        raise NotImplementedError
+
 
 class Statement:
     """
@@ -267,12 +544,184 @@ class Statement:
 
     class End:
         """
-        Placeholder for the END statement
+        Encapsulates the END statement, which stops the program. Empty lines
+        are also represented as End nodes with placeholder set, which do
+        nothing.
         """
 
+        def __init__(self, placeholder: bool = False):
+            self.placeholder = placeholder
+
         def accept(self, visitor: StatementVisitor):
             return visitor.visit_end(self)
 
+    class Increment:
+        """
+        Fused form of LET v = v + c and LET v = v - c. The step is the
+        signed constant added to the variable. Created by the optimizer
+        rather than the parser.
+        """
+
+        def __init__(self, identifier: str, step):
+            self.identifier = identifier
+            self.step = step
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_increment(self)
+
+    class PrintVariable:
+        """
+        Fused form of PRINT v. Created by the optimizer rather than the
+        parser.
+        """
+
+        def __init__(self, identifier: str):
+            self.identifier = identifier
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_print_variable(self)
+
+    class Dim:
+        """
+        Encapsulates the identifier and upper bound of an array declaration,
+        DIM a(n) declares the elements a(0) to a(n).
+        """
+
+        def __init__(self, identifier: str, bound: Expression):
+            self.identifier = identifier
+            self.bound = bound
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_dim(self)
+
+    class ElementAssignment:
+        """
+        Encapsulates the array identifier, subscript and expression of an
+        assignment to an array element. The subscript is only bounds
+        checked if checked is set.
+        """
+
+        def __init__(self, identifier: str, index: Expression,
+                     expr: Expression, checked: bool = True):
+            self.identifier = identifier
+            self.index = index
+            self.expr = expr
+            self.checked = checked
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_element_assignment(self)
+
+    class Guarded:
+        """
+        A DO WHILE loop whose array subscripts are checked once before the
+        loop instead of on every access. If the variable is a non negative
+        integer and every array has an element at limit, loop (in which the
+        subscripts are unchecked) is executed, otherwise fallback (the
+        original loop). Created by the optimizer rather than the parser.
+        """
+
+        def __init__(self, variable: str, limit: int, arrays: tuple,
+                     loop, fallback):
+            self.variable = variable
+            self.limit = limit
+            self.arrays = arrays
+            self.loop = loop
+            self.fallback = fallback
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_guarded(self)
+
+    class Data:
+        """
+        Encapsulates the constants of a DATA statement. The constants of
+        all DATA statements of a program are read by READ statements in
+        the order they appear in the source, wherever the DATA statements
+        are placed.
+        """
+
+        def __init__(self, values: list):
+            self.values = values
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_data(self)
+
+    class Read:
+        """
+        Encapsulates the targets of a READ statement, each of which is an
+        Expression.Variable or Expression.Index.
+        """
+
+        def __init__(self, targets: list):
+            self.targets = targets
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_read(self)
+
+    class Input:
+        """
+        Encapsulates the channel and targets of an INPUT statement, each of
+        which is an Expression.Variable or Expression.Index. Channel 0 is
+        the standard input.
+        """
+
+        def __init__(self, channel: int, targets: list):
+            self.channel = channel
+            self.targets = targets
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_input(self)
+
+    class Goto:
+        """
+        Encapsulates the line number a GOTO statement jumps to. Line numbers
+        are kept in the label attribute of the numbered statements, only
+        top-level statements can be jumped to.
+        """
+
+        def __init__(self, target: int):
+            self.target = target
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_goto(self)
+
+    class Gosub:
+        """
+        Encapsulates the line number of the subroutine a GOSUB statement
+        calls. The subroutine runs until a RETURN statement, after which
+        execution continues after the GOSUB statement.
+        """
+
+        def __init__(self, target: int):
+            self.target = target
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_gosub(self)
+
+    class Return:
+        """
+        Encapsulates the RETURN statement, which ends the subroutine called
+        by the last GOSUB statement.
+        """
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_return(self)
+
+    class Def:
+        """
+        Encapsulates the name, parameter names and body expression of a
+        function definition, DEF FNA(X, Y) = X * Y. The parameters are
+        Expression.Parameter nodes in the body. Definitions are not
+        executed, a function can be called anywhere in the program.
+        """
+
+        def __init__(self, name: str, parameters: list, expr: Expression):
+            self.name = name
+            self.parameters = parameters
+            self.expr = expr
+
+        def accept(self, visitor: StatementVisitor):
+            return visitor.visit_def(self)
+
 
 class Program:
     """
@@ -281,3 +730,25 @@ class Program:
 
     def __init__(self, statements: list):
         self.statements = statements
+
+
+def dump(node) -> str:
+    """
+    Returns a textual form of a parse tree which lists every node with its
+    attributes. Two trees are identical if their dumps are equal.
+
+    Arguments:
+        node {object} -- A Program, statement, expression or list of them.
+
+    Returns:
+        str -- the textual form of the tree.
+    """
+    if isinstance(node, list):
+        return "[" + ", ".join(dump(item) for item in node) + "]"
+    if isinstance(node, Program):
+        return "Program(" + dump(node.statements) + ")"
+    if hasattr(node, "accept"):
+        return "{}({})".format(type(node).__qualname__, ", ".join(
+            "{}={}".format(name, dump(value))
+            for name, value in vars(node).items()))
+    return repr(node)
@@ -0,0 +1,233 @@
+"""
+Python Implementation of the Runtime Support for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import sys
+
+"""
+This file includes the functions shared by the interpreter, the virtual
+machine and the modules written by the ahead-of-time compiler: errors,
+arrays, INPUT channels and the reporting of errors of compiled modules.
+It only imports what every program needs, so a compiled module starts
+without loading the scanner, the parser or the interpreter. Arrays and
+the readers of INPUT files are imported when a program uses them.
+"""
+
+
+class InterpreterError(Exception):
+    """
+    Exception class for a Interpreter error.
+    Used in case a Interpreter error occurs.
+    """
+
+    def __init__(self, err=None):
+        """
+        Simple constructor to assign InterpreterError attributes.
+
+        Parameters:
+        pos (tuple): tuple of length 2 of the form (row, column)
+        pos (str): string description of an error, a generic error is used
+        if none is given
+        """
+
+        if err is None:
+            # use a default error if none specified
+            err = "Interpreter error occured."
+        self.err = err
+
+    def __str__(self) -> str:
+        """
+        Returns an error message with details of the error.
+        """
+        return "InterpreterError: {}".format(self.err)
+
+
+def make_array(bound):
+    """
+    Creates the zero filled storage of an array. Arrays hold 64 bit
+    integers until a float is stored in them, see store_element().
+
+    Arguments:
+        bound {Union[float, int]} -- The largest subscript of the array.
+
+    Raises:
+        InterpreterError: If the bound is negative.
+
+    Returns:
+        array -- The storage of the elements 0 to bound.
+    """
+    bound = round(bound)
+    if bound < 0:
+        raise InterpreterError("Invalid array bound {}".format(bound))
+    # imported here as only programs with arrays need it
+    from array import array
+    return array("q", bytes(8 * (bound + 1)))
+
+
+def get_array(arrays: dict, identifier: str):
+    """
+    Returns the storage of a declared array.
+
+    Raises:
+        InterpreterError: If the array was not declared.
+    """
+    try:
+        return arrays[identifier]
+    except KeyError:
+        raise InterpreterError("Array {} used before DIM".format(identifier))
+
+
+def subscript(values, index) -> int:
+    """
+    Rounds a subscript to an integer and checks it is within the bounds
+    of an array.
+
+    Arguments:
+        values {array} -- The storage of the array.
+        index {Union[float, int]} -- The value of the subscript expression.
+
+    Raises:
+        InterpreterError: If the subscript is out of range.
+
+    Returns:
+        int -- The index of the element.
+    """
+    if type(index) is not int:
+        index = round(index)
+    if not 0 <= index < len(values):
+        raise InterpreterError("Subscript {} out of range".format(index))
+    return index
+
+
+def store_element(arrays: dict, identifier: str, index: int, value):
+    """
+    Stores a value in an array, converting the storage of an integer
+    array to 64 bit floats when a value does not fit into it.
+
+    Arguments:
+        arrays {dict} -- The arrays by identifier.
+        identifier {str} -- The identifier of the array.
+        index {int} -- The index of the element, already checked.
+        value {Union[float, int]} -- The value to store.
+    """
+    values = arrays[identifier]
+    try:
+        values[index] = value
+    except (TypeError, OverflowError):
+        from array import array
+        values = arrays[identifier] = array("d", values)
+        values[index] = value
+
+
+def input_channel(inputs: dict, channel: int):
+    """
+    Returns the reader of an INPUT channel, channel 0 reads from STDIN.
+
+    Arguments:
+        inputs {dict} -- The NumberReader of each open channel.
+        channel {int} -- The channel number.
+
+    Raises:
+        InterpreterError: If the channel is not open.
+    """
+    reader = inputs.get(channel)
+    if reader is None:
+        if channel != 0:
+            raise InterpreterError("Channel #{} is not open".format(channel))
+        # imported here as only programs using INPUT need it
+        from basic_input import NumberReader
+        reader = inputs[0] = NumberReader(sys.stdin.buffer)
+    return reader
+
+
+def next_input(reader, channel: int):
+    """
+    Returns the next number of an INPUT channel.
+
+    Raises:
+        InterpreterError: At the end of the input or if the input is not a
+        number.
+    """
+    try:
+        return next(reader)
+    except StopIteration:
+        raise InterpreterError("End of input on #{}".format(channel))
+    except Exception as e:
+        # basic_input is loaded, the reader is one of its NumberReaders
+        from basic_input import InputError
+        if not isinstance(e, InputError):
+            raise
+        raise InterpreterError(e.err)
+
+
+def open_inputs(specs: list, use_mmap: bool = False) -> dict:
+    """
+    Opens the files of INPUT channels.
+
+    Arguments:
+        specs {list} -- Strings of the form N=FILE, or FILE for channel 1.
+        use_mmap {bool} -- Read the files through memory maps.
+
+    Returns:
+        dict -- The NumberReader of each channel.
+    """
+    inputs = {}
+    for spec in specs or ():
+        # imported here as only programs using INPUT need it
+        from basic_input import NumberReader
+        channel, _, filename = spec.rpartition("=")
+        inputs[int(channel) if channel else 1] = NumberReader.open(
+            filename, use_mmap)
+    return inputs
+
+
+def source_line(module, traceback):
+    """
+    Returns the BASIC line of the innermost frame of a traceback which
+    belongs to a compiled module, or None if there is none.
+    """
+    line = None
+    while traceback is not None:
+        if traceback.tb_frame.f_code.co_filename == module.__file__:
+            line = module.LINES.get(traceback.tb_lineno, line)
+        traceback = traceback.tb_next
+    return line
+
+
+def describe(module, error: Exception) -> str:
+    """
+    Returns the message of an error raised by a compiled module, with the
+    BASIC line it was raised on.
+    """
+    line = source_line(module, error.__traceback__)
+    if isinstance(error, NameError):
+        # imported here as it is only needed to report an error
+        import re
+        # an unbound local variable of run() or of a function
+        match = re.search(r"'([va])_(\w+)'", str(error))
+        if match and match.group(1) == "a":
+            error = InterpreterError("Array {} used before DIM".format(
+                match.group(2)))
+        elif match:
+            error = InterpreterError("Variable {} used before "
+                                     "assignment".format(match.group(2)))
+    message = str(error) if isinstance(error, InterpreterError) \
+        else "Uknown Error Occured!\n{}".format(error)
+    if line is None:
+        return message
+    return "{} Ln:{}".format(message, line)
+
+
+def run_module(module, specs: list = None, use_mmap: bool = False):
+    """
+    Runs a compiled module, printing errors against the BASIC source.
+
+    Arguments:
+        module {module} -- The compiled module.
+        specs {list} -- Strings of the form N=FILE opening INPUT channels.
+        use_mmap {bool} -- Read the input files through memory maps.
+    """
+    try:
+        module.run(open_inputs(specs, use_mmap))
+    except Exception as e:
+        print(describe(module, e))
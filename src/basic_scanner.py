@@ -9,9 +9,12 @@ Created by Nihad Kalathingal on 2/23/2020. Modified (03-04-2020)
     Nihad Kalathingal (nkalathi@students.kennesaw.edu)
 """
 
-import re  # import regex library used to match lexemes
 import sys  # import sys library used for CLI arguments
-from basic_tokens import *   # import the basic subset to be used
+from array import array
+# import the basic subset to be used
+from basic_tokens import Tokens, Delimiters, Identifiers, Literals
+from basic_tokens import KEYWORDS
+from basic_tokens import lexer_tables, TOKEN_TYPES, TOKEN_IDS
 
 """
 The scanner is implemented in the Scanner class which uses the rules
@@ -20,7 +23,12 @@ with a source file and returns the associated tokens in that file.
 The scanner throws an exception of type ScannerError if a unkown lexeme
 is found. The class Token is the output of the Scanner which contains
 the type, postion, and lexeme which is to be used by other parts of the
-interpreter.
+interpreter. The parser reads the tokens of a whole source from a
+TokenBuffer instead, which holds them in parallel arrays so no object is
+created per token. Identifiers are interned in a symbol table, so every use of
+an identifier in a program is the same string object, which is stored
+once and whose hash is computed once however often the interpreter looks
+the variable up.
 """
 
 
@@ -76,65 +84,209 @@ class ScannerError(Exception):
             self.pos[1])
 
 
+class TokenBuffer:
+    """
+    The tokens of a source as parallel arrays rather than Token objects:
+    the type id of every token (see TOKEN_IDS), its lexeme, and the line
+    and column it starts at. The parser walks the arrays with an integer
+    cursor.
+    """
+
+    def __init__(self):
+        self.types = array("B")
+        self.lexemes = []
+        self.lines = array("I")
+        self.columns = array("I")
+
+    def __len__(self):
+        return len(self.types)
+
+    def append(self, type: Tokens, lexeme: str, pos: tuple):
+        """
+        Appends a token.
+
+        Parameters:
+        type (Tokens): the token encoded as an enum
+        lexeme (str): the lexeme that was matched
+        pos (tuple): tuple of length 2 of the form (row, column)
+        """
+        self.types.append(TOKEN_IDS[type])
+        self.lexemes.append(lexeme)
+        self.lines.append(pos[0])
+        self.columns.append(pos[1])
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """
+        Returns a buffer holding Token objects, for example the tokens
+        generated by the lex() method of a Scanner replacement.
+        """
+        buffer = cls()
+        for token in tokens:
+            buffer.append(token.type, token.lexeme, token.pos)
+        return buffer
+
+    def token(self, index: int) -> Token:
+        """
+        Returns the token at an index as a Token object.
+        """
+        return Token(TOKEN_TYPES[self.types[index]], self.lexemes[index],
+                     (self.lines[index], self.columns[index]))
+
+
+def token_buffer(source) -> TokenBuffer:
+    """
+    Returns the tokens of a Scanner or Scanner replacement, which has a
+    tokens() method returning a TokenBuffer or a lex() method generating
+    Token objects.
+
+    Raises:
+    ScannerError: if an unknown lexeme is found
+    """
+    if hasattr(source, "tokens"):
+        return source.tokens()
+    return TokenBuffer.from_tokens(source.lex())
+
+
 class Scanner:
     """
     Scanner class which tokenizes from a given buffer based on regex rules
     for lexemes.
     """
 
-    def __init__(self, source):
+    def __init__(self, source, first_line: int = 0, symbols: dict = None):
         """
         Simple constructor to assign Scanner attributes.
 
         Parameters:
         source (Buffer): source file/buffer
+        first_line (int): number of lines preceding the source, used when
+                          scanning a part of a file
+        symbols (dict): symbol table shared with other scanners of the
+                        same program, a new one is used if none is given
         """
         self.source = source  # source code
+        self.first_line = first_line  # offset of the line numbers
+        self.line_num = first_line - 1  # line number of an empty source
+        self.pos = 0
+        # the interned string of each identifier
+        self.symbols = {} if symbols is None else symbols
 
-    def __match_token(self, group):
+    def tokens(self) -> TokenBuffer:
         """
-        Internaly used function that matches a token in a specified group.
+        Scans the whole source into a TokenBuffer.
 
-        Parameters:
-        source (tuple): tuple of tuples which contain the compiled rule
-                        and Enum for tokens for which to perform match to.
-        """
-        match = None  # set to no matches found for lexeme
-        # Iterate trhough available rules for lexemes
-        for regex, token_type in group:
-            match = regex.match(self.line, self.pos)  # check for a match
-            if match:
-                # create a token for the match
-                token = Token(token_type, match.group(0),
-                              (self.line_num+1, self.pos+1))
-                # set position to end of last token
-                self.pos = match.end()
-                # generate token
-                return token
-        # if there is no match raise an error
-        if not match:
-            raise ScannerError((self.line_num+1, self.pos+1))
+        Raises:
+        ScannerError: if an unknown lexeme is found
+        """
+        buffer = TokenBuffer()
+        for _ in self.fill(buffer):
+            pass
+        return buffer
 
-    def lex(self):
+    def fill(self, buffer: TokenBuffer):
         """
-        Generates a Token object for each lexeme found per regex rules.
+        Appends the tokens of the source to a buffer one line at a time,
+        generating the number of tokens in the buffer after every line and
+        after the EOF token. No Token object is created, the type id,
+        lexeme, line and column of every token go straight into the arrays
+        of the buffer. The lexemes of keywords, operators and delimiters
+        are interned like identifiers, so a buffer holds one string for
+        every spelling rather than one per token.
+
+        Parameters:
+        buffer (TokenBuffer): the buffer the tokens are appended to
+
+        Raises:
+        ScannerError: if an unknown lexeme is found
         """
+        word_rule, non_alpha, ws_rule = lexer_tables()
+        match_word, skip_ws = word_rule.match, ws_rule.search
+        # the NON_ALPHA rules with their type ids and the table their
+        # lexemes are interned in, literals are not interned
+        spellings = {}
+        rules = [(regex.match, TOKEN_IDS[token_type],
+                  self.symbols if token_type == Identifiers.IDENT
+                  else None if token_type in (Literals.INT_LIT,
+                                              Literals.FLOAT_LIT)
+                  else spellings)
+                 for regex, token_type in non_alpha]
+        keyword_ids = {name: TOKEN_IDS[keyword]
+                       for name, keyword in KEYWORDS.items()}
+        ident_id = TOKEN_IDS[Identifiers.IDENT]
+        intern = self.symbols.setdefault
+        append_type, append_lexeme = buffer.types.append, \
+            buffer.lexemes.append
+        append_line, append_column = buffer.lines.append, \
+            buffer.columns.append
         # iterate through lines in the buffer
-        for self.line_num, self.line in enumerate(self.source):
-            self.pos = 0  # position of the lexeme in line
-            while self.pos < len(self.line):  # iterate while not end of line
+        for self.line_num, self.line in enumerate(self.source,
+                                                  self.first_line):
+            line, line_num = self.line, self.line_num + 1
+            pos = 0  # position of the lexeme in line
+            end = len(line)
+            while pos < end:  # iterate while not end of line
                 # skip whitespace
-                ws = WS_RULE.search(self.line, self.pos)
+                ws = skip_ws(line, pos)
                 if ws:
-                    self.pos = ws.start()
-                # if first char is alpha look in alpha group
-                if self.line[self.pos].isalpha():
-                    yield self.__match_token(ALPHA)
+                    pos = ws.start()
+                # if first char is alpha match a keyword or identifier
+                if line[pos].isalpha():
+                    match = match_word(line, pos)
+                    if not match:
+                        # a letter which is not an ASCII letter
+                        raise ScannerError((line_num, pos + 1))
+                    lexeme = match.group()
+                    type_id = keyword_ids.get(lexeme.upper())
+                    if type_id is None:
+                        type_id = ident_id
+                        lexeme = intern(lexeme, lexeme)
+                    else:
+                        lexeme = spellings.setdefault(lexeme, lexeme)
                 # if not look in unknown group
                 else:
-                    yield self.__match_token(NON_ALPHA)
-        # generate the EOF token for the EOF
-        yield Token(Delimiters.EOF, "/Z", (self.line_num+1, self.pos+1))
+                    for rule, type_id, table in rules:
+                        match = rule(line, pos)
+                        if match:
+                            break
+                    else:
+                        raise ScannerError((line_num, pos + 1))
+                    lexeme = match.group()
+                    if table is not None:
+                        lexeme = table.setdefault(lexeme, lexeme)
+                append_type(type_id)
+                append_lexeme(lexeme)
+                append_line(line_num)
+                append_column(pos + 1)
+                # set position to end of last token
+                pos = match.end()
+            self.pos = pos
+            yield len(buffer)
+        # the EOF token for the EOF
+        buffer.append(Delimiters.EOF, "/Z", (self.line_num+1, self.pos+1))
+        yield len(buffer)
+
+    def lex(self):
+        """
+        Generates a Token object for each lexeme found per regex rules, a
+        line at a time.
+        """
+        buffer = TokenBuffer()
+        lines = self.fill(buffer)
+        start = 0
+        while True:
+            try:
+                end = next(lines)
+            except StopIteration:
+                return
+            except ScannerError:
+                # the tokens before the unknown lexeme come first
+                for index in range(start, len(buffer)):
+                    yield buffer.token(index)
+                raise
+            for index in range(start, end):
+                yield buffer.token(index)
+            start = end
 
 
 # ------------------------ main --------------------------------------------
@@ -0,0 +1,421 @@
+"""
+Python Implementation of Parallel Execution for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import contextlib
+import io
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from basic_interpreter import Interpreter, InterpreterError, Halt
+from basic_memo import FreeVariables, array_version, ARGUMENTS
+from basic_optimizer import walk
+from basic_parser import Parser, ParserError
+from basic_program import Expression, StatementVisitor, Statement, Program
+from basic_scanner import Scanner, ScannerError
+
+"""
+This file includes an interpreter which runs independent top-level blocks
+of a program at the same time. The variables and arrays every top-level
+statement reads and writes are found before the program runs, and a
+statement depends on an earlier one if it reads or writes what the
+earlier one writes, or if both print. These dependencies form a DAG over
+the top-level statements in which every edge points forward.
+
+Statements holding a DO WHILE loop are sent to a process pool together
+with the values they read, the other statements are executed in the
+current process. A statement starts once the statements it depends on
+have finished, and a PRINT in the current process waits for all blocks
+before it, as one of them may still fail. The variables and arrays
+written by a block, its output and its error are merged back strictly in
+program order, so the output, the first error and the final enviornment
+of a program which ends without an error are those of a sequential run:
+
+    LET A = 0          current process
+    DO WHILE A < N     worker 1, reads A N, writes A S
+    DO WHILE B < N     worker 2, reads B N, writes B T
+    PRINT S + T        waits for both, then prints their output and S + T
+
+Programs with line numbers or jumps, and blocks which READ or INPUT, keep
+their sequential order, as their effects are not known statically or can
+not be moved to another process.
+"""
+
+# names standing for the output of a statement and for stopping the
+# program in its effects
+OUTPUT = "#print"
+HALT = "#end"
+
+
+class Effects:
+    """
+    The variables and arrays (see array_version) a statement reads and
+    writes, whether it can run in another process and whether it is
+    expensive enough to be worth it.
+    """
+
+    def __init__(self):
+        self.reads = set()
+        self.writes = set()
+        # READ and INPUT depend on the state of the current process
+        self.portable = True
+        self.loops = False
+
+
+class EffectAnalysis(StatementVisitor):
+    """
+    Statement visitor which collects the effects of a statement and of the
+    statements nested in it. Conditional writes count as writes, so the
+    sets are an upper bound of what a statement does.
+    """
+
+    def __init__(self):
+        self.free = FreeVariables()
+        self.effects = Effects()
+
+    def analyse(self, statement) -> Effects:
+        """
+        Returns the effects of a statement.
+        """
+        self.effects = Effects()
+        statement.accept(self)
+        return self.effects
+
+    def read(self, exp: Expression):
+        variables, _ = self.free.analyse(exp)
+        self.effects.reads |= variables - {ARGUMENTS}
+
+    def target(self, target: Expression):
+        if isinstance(target, Expression.Index):
+            self.read(target.index)
+            self.effects.reads.add(array_version(target.identifier))
+            self.effects.writes.add(array_version(target.identifier))
+        else:
+            self.effects.writes.add(target.identifier)
+
+    def body(self, statements: list):
+        for statement in statements:
+            statement.accept(self)
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        self.read(assign_stmnt.expr)
+        self.effects.writes.add(assign_stmnt.identifier)
+
+    def visit_print(self, print_stmnt: Statement.Print):
+        self.read(print_stmnt.expr)
+        self.effects.writes.add(OUTPUT)
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        self.effects.loops = True
+        self.read(dowhile_stmnt.rel_expr)
+        self.body(dowhile_stmnt.body)
+
+    def visit_if(self, if_stmnt: Statement.If):
+        self.read(if_stmnt.rel_expr)
+        self.body(if_stmnt.body)
+
+    def visit_end(self, end_stmnt: Statement.End):
+        if not end_stmnt.placeholder:
+            self.effects.writes.add(HALT)
+
+    def visit_increment(self, increment_stmnt: Statement.Increment):
+        self.effects.reads.add(increment_stmnt.identifier)
+        self.effects.writes.add(increment_stmnt.identifier)
+
+    def visit_print_variable(self, print_stmnt: Statement.PrintVariable):
+        self.effects.reads.add(print_stmnt.identifier)
+        self.effects.writes.add(OUTPUT)
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        self.read(dim_stmnt.bound)
+        self.effects.writes.add(array_version(dim_stmnt.identifier))
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        self.read(assign_stmnt.expr)
+        self.target(Expression.Index(assign_stmnt.identifier,
+                                     assign_stmnt.index))
+
+    def visit_guarded(self, guarded_stmnt: Statement.Guarded):
+        self.effects.reads.add(guarded_stmnt.variable)
+        self.effects.reads |= {array_version(identifier)
+                               for identifier in guarded_stmnt.arrays}
+        guarded_stmnt.loop.accept(self)
+        guarded_stmnt.fallback.accept(self)
+
+    def visit_data(self, data_stmnt: Statement.Data):
+        pass
+
+    def visit_read(self, read_stmnt: Statement.Read):
+        self.effects.portable = False
+        for target in read_stmnt.targets:
+            self.target(target)
+
+    def visit_input(self, input_stmnt: Statement.Input):
+        self.effects.portable = False
+        for target in input_stmnt.targets:
+            self.target(target)
+
+    def visit_goto(self, goto_stmnt: Statement.Goto):
+        pass
+
+    def visit_gosub(self, gosub_stmnt: Statement.Gosub):
+        pass
+
+    def visit_return(self, return_stmnt: Statement.Return):
+        pass
+
+    def visit_def(self, def_stmnt: Statement.Def):
+        pass
+
+
+def dependencies(effects: list) -> list:
+    """
+    Builds the dependency DAG of the top-level statements from their
+    effects. A statement depends on the last earlier statement which
+    writes a variable or array it reads or writes, printing counts as
+    writing the output. Every statement depends on the last earlier one
+    which may END the program, so nothing runs ahead of it. Edges to the
+    statements writing a name before are implied, as each of those writes
+    depends on the previous one.
+
+    Arguments:
+        effects {list} -- The Effects of every top-level statement.
+
+    Returns:
+        list -- The set of indices of the statements each statement
+        depends on.
+    """
+    graph = []
+    # index of the last statement writing each variable and array
+    writers = {}
+    for index, effect in enumerate(effects):
+        graph.append({writers[name]
+                      for name in effect.reads | effect.writes | {HALT}
+                      if name in writers})
+        for name in effect.writes:
+            writers[name] = index
+    return graph
+
+
+def sequential(statements: list) -> bool:
+    """
+    Returns whether a program has to run in order, because it numbers its
+    lines or jumps.
+    """
+    return any(getattr(statement, "label", None) is not None
+               or isinstance(statement, (Statement.Goto, Statement.Gosub,
+                                         Statement.Return))
+               for statement in walk(statements))
+
+
+# interpreter of a worker process, which holds the program
+_worker = None
+
+
+def start_worker(statements: list):
+    """
+    Initializer of a worker process, prepares an interpreter for the
+    program once rather than sending it with every block.
+    """
+    global _worker
+    _worker = Interpreter(None)
+    _worker.start(Program(statements))
+
+
+def run_block(index: int, env: dict, arrays: dict, writes: set) -> tuple:
+    """
+    Executes a top-level statement in a worker process.
+
+    Arguments:
+        index {int} -- The index of the statement.
+        env {dict} -- The variables the statement reads.
+        arrays {dict} -- The arrays the statement reads.
+        writes {set} -- The variables and arrays the statement may write.
+
+    Returns:
+        tuple -- The output of the statement, the variables and arrays it
+        wrote and the exception which stopped it, or None.
+    """
+    _worker.env, _worker.arrays = env, arrays
+    output = io.StringIO()
+    error = None
+    try:
+        with contextlib.redirect_stdout(output):
+            _worker.execute(_worker.statements[index])
+    except Exception as e:
+        error = e
+    # the variables it writes but does not read were not sent, so the
+    # ones present were assigned by the statement
+    return (output.getvalue(),
+            {identifier: value for identifier, value in env.items()
+             if identifier in writes},
+            {identifier: values for identifier, values in arrays.items()
+             if array_version(identifier) in writes},
+            error)
+
+
+class ParallelInterpreter(Interpreter):
+    """
+    Interpreter which runs the top-level DO WHILE blocks of a program in a
+    process pool as soon as the blocks they depend on finished, see
+    dependencies. The pool is a multiprocessing.Pool rather than a
+    ProcessPoolExecutor as blocks still running after an error or END have
+    to be terminated.
+    """
+
+    def __init__(self, parser: Parser, jobs: int = None):
+        """
+        Arguments:
+            parser {Parser} -- The parser of the program.
+            jobs {int} -- The number of worker processes, by default the
+            number of cores.
+        """
+        super().__init__(parser)
+        self.jobs = jobs or os.cpu_count() or 1
+        # number of blocks run by workers and in the current process
+        self.offloaded = self.inline = 0
+
+    def run(self, program: Program):
+        """
+        Executes a program, running independent blocks concurrently.
+
+        Arguments:
+            program {Program} -- The program to execute.
+        """
+        if self.jobs < 2 or sequential(program.statements):
+            super().run(program)
+            return
+        self.start(program)
+        analysis = EffectAnalysis()
+        effects = [analysis.analyse(statement)
+                   for statement in self.statements]
+        graph = dependencies(effects)
+        # blocks sent to the pool and not merged yet, in program order
+        self.pending = deque()
+        self.pool = None
+        try:
+            for index, statement in enumerate(self.statements):
+                effect = effects[index]
+                self.wait(graph[index])
+                if effect.loops and effect.portable:
+                    self.submit(index, effect)
+                    continue
+                self.inline += 1
+                if OUTPUT in effect.writes:
+                    # printing can not be undone if an earlier block fails
+                    self.wait(range(index))
+                try:
+                    self.execute(statement)
+                except Exception:
+                    # an earlier block may fail or halt first
+                    self.wait(range(index))
+                    raise
+            self.wait(range(len(self.statements)))
+        except Halt:
+            pass
+        finally:
+            if self.pool is not None:
+                self.pool.terminate()
+                self.pool.join()
+
+    def submit(self, index: int, effect: Effects):
+        """
+        Sends a block to the pool with the variables and arrays it reads.
+        """
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.jobs, start_worker,
+                                             (self.statements,))
+        env = {identifier: self.env[identifier]
+               for identifier in effect.reads if identifier in self.env}
+        # copied, as the task is pickled later and the current process
+        # may change the elements meanwhile
+        arrays = {identifier: values[:]
+                  for identifier, values in self.arrays.items()
+                  if array_version(identifier) in effect.reads}
+        self.pending.append((index, self.pool.apply_async(
+            run_block, (index, env, arrays, effect.writes))))
+        self.offloaded += 1
+
+    def wait(self, indices):
+        """
+        Merges the pending blocks up to the last one among indices, in
+        program order.
+
+        Raises:
+            Exception: The error or Halt which stopped a merged block.
+        """
+        pending = self.pending
+        last = max((index for index, _ in pending if index in indices),
+                   default=None)
+        while pending and last is not None and pending[0][0] <= last:
+            _, result = pending.popleft()
+            output, env, arrays, error = result.get()
+            sys.stdout.write(output)
+            self.env.update(env)
+            self.arrays.update(arrays)
+            if error is not None:
+                raise error
+
+    def report(self) -> str:
+        """
+        Returns a human readable count of the blocks run by the workers.
+        """
+        return "Parallel blocks: {} in {} processes, {} in the main " \
+            "process".format(self.offloaded, self.jobs, self.inline)
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    The parallel execution of a BASIC file can be timed and compared with a
+    sequential run using the following command:
+
+    python3 basic_scheduler.py <filename> [--jobs N]
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Time parallel execution of a BASIC file.")
+    arg_parser.add_argument("filename", help="BASIC source file")
+    arg_parser.add_argument("--jobs", type=int, help="number of processes")
+    args = arg_parser.parse_args()
+    with open(args.filename, "r") as f:
+        parser = Parser(Scanner(f.readlines()))
+    try:
+        program = parser.program()
+    except (ParserError, ScannerError) as e:
+        # if the program is invalid, alert the user
+        print(e)
+        return
+    effects = [EffectAnalysis().analyse(statement)
+               for statement in program.statements]
+    for index, depends in enumerate(dependencies(effects)):
+        print("{} {} <- {}".format(
+            getattr(program.statements[index], "line", "?"),
+            "block" if effects[index].loops and effects[index].portable
+            else "inline", sorted(getattr(program.statements[earlier],
+                                          "line", "?")
+                                  for earlier in depends)), file=sys.stderr)
+    for name, interpreter in (("sequential", Interpreter(parser)),
+                              ("parallel", ParallelInterpreter(
+                                  parser, args.jobs))):
+        output = io.StringIO()
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output):
+                interpreter.run(program)
+        except InterpreterError as e:
+            print(e)
+            return
+        print("{}: {:.3f}s".format(name, time.perf_counter() - start))
+        if name == "sequential":
+            expected = output.getvalue()
+        elif output.getvalue() != expected:
+            print("The parallel output differs from the sequential output")
+    print(interpreter.report())
+
+
+if __name__ == "__main__":
+    main()
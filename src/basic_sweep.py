@@ -0,0 +1,384 @@
+"""
+Python Implementation of Parameter Sweeps for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import contextlib
+import copy
+import io
+import os
+import sys
+import time
+from basic_input import convert, InputError
+from basic_interpreter import Interpreter, InterpreterError, Halt
+from basic_optimizer import walk
+from basic_parser import Parser, ParserError
+from basic_program import Expression, Statement, Program
+from basic_scanner import Scanner, ScannerError
+from basic_tokens import Literals
+
+"""
+This file includes an interpreter which runs a program once for every set
+of parameter values of a sweep. A parameter is a variable assigned by a
+top-level LET, and a run replaces the value of its first such assignment:
+
+    LET n = 100000     shared prefix, executed once
+    DO WHILE ...       shared prefix, executed once
+    LET rate = 0.5     first parameter, every run continues from here
+    ...                with its own value of rate
+
+The top-level statements before the first parameter assignment do not
+depend on the parameters, so they are executed once. The enviornment,
+arrays and DATA pointer after them are the snapshot every run continues
+from. Where os.fork is available every run is a forked child process, so
+the snapshot is shared copy-on-write and up to --jobs runs execute at the
+same time. Otherwise the runs continue one after the other from deep
+copies of the snapshot. The output of every run is the output of the
+prefix followed by its own, printed in the order of the runs.
+
+The prefix ends before the first statement which jumps, as the statement
+jumped to may be after the first parameter assignment. Programs reading
+INPUT can not be swept, as the runs would share the input files.
+"""
+
+
+def parse_runs(lines: list) -> list:
+    """
+    Parses the parameter values of the runs of a sweep, one run per line
+    of NAME=VALUE pairs separated by whitespace or commas. Empty lines and
+    lines starting with # are skipped.
+
+    Arguments:
+        lines {list} -- The lines of the sweep file.
+
+    Raises:
+        InterpreterError: If a pair is malformed or a value is not a number.
+
+    Returns:
+        list -- The dict of parameter values of every run.
+    """
+    runs = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        run = {}
+        for pair in line.replace(",", " ").split():
+            name, equals, value = pair.partition("=")
+            if not name or not equals:
+                raise InterpreterError("Invalid parameter {!r}".format(pair))
+            try:
+                run[name] = convert(value.encode())
+            except InputError as e:
+                raise InterpreterError("Parameter {}: {}".format(name,
+                                                                 e.err))
+        runs.append(run)
+    return runs
+
+
+def parameter_assignments(statements: list, parameters) -> dict:
+    """
+    Returns the index of the first top-level assignment of every
+    parameter.
+
+    Raises:
+        InterpreterError: If a parameter is not assigned at the top level.
+    """
+    found = {}
+    for index, statement in enumerate(statements):
+        if isinstance(statement, Statement.Assignment) and \
+                statement.identifier in parameters:
+            found.setdefault(statement.identifier, index)
+    for name in parameters:
+        if name not in found:
+            raise InterpreterError(
+                "Parameter {} is not assigned by a top-level LET".format(
+                    name))
+    return found
+
+
+def shared_prefix(statements: list, first: int) -> int:
+    """
+    Returns the number of top-level statements which can be executed once
+    for all runs, the statements before the first parameter assignment up
+    to the first one which jumps.
+    """
+    for index, statement in enumerate(statements[:first]):
+        if any(isinstance(nested, (Statement.Goto, Statement.Gosub,
+                                   Statement.Return))
+               for nested in walk([statement])):
+            return index
+    return first
+
+
+def error_message(error: Exception) -> str:
+    """
+    Returns the message an error is reported with by the interpreter CLI.
+    """
+    if isinstance(error, InterpreterError):
+        return str(error)
+    return "Uknown Error Occured!\n{}".format(error)
+
+
+def with_parameters(statements: list, assignments: dict,
+                    run: dict) -> list:
+    """
+    Returns the top-level statements of a run, in which the first
+    assignment of every parameter assigns its value. The other statements
+    are shared.
+
+    Arguments:
+        statements {list} -- The top-level statements of the program.
+        assignments {dict} -- The index of the first top-level assignment
+        of every parameter, see parameter_assignments.
+        run {dict} -- The parameter values of the run.
+    """
+    statements = list(statements)
+    for name, value in run.items():
+        index = assignments[name]
+        assign_stmnt = copy.copy(statements[index])
+        assign_stmnt.expr = Expression.Literal(
+            Literals.FLOAT_LIT if isinstance(value, float)
+            else Literals.INT_LIT, value)
+        statements[index] = assign_stmnt
+    return statements
+
+
+def run_captured(interpreter: Interpreter, index: int) -> str:
+    """
+    Executes the top-level statements of an interpreter from an index.
+
+    Returns:
+        str -- The output and the message of the error which stopped the
+        program.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            interpreter.run_from(index)
+        except Halt:
+            pass
+        except Exception as e:
+            print(error_message(e))
+    return output.getvalue()
+
+
+def run_alone(parser: Parser, program: Program, run: dict) -> str:
+    """
+    Executes a program for one set of parameter values from the start,
+    which is what a sweep saves.
+
+    Returns:
+        str -- The output of the run, see run_captured.
+    """
+    interpreter = Interpreter(parser)
+    interpreter.start(program)
+    interpreter.statements = with_parameters(
+        interpreter.statements,
+        parameter_assignments(interpreter.statements, run), run)
+    return run_captured(interpreter, 0)
+
+
+class SweepInterpreter(Interpreter):
+    """
+    Interpreter which runs a program for every set of parameter values,
+    executing the shared prefix of the runs once.
+    """
+
+    def __init__(self, parser: Parser, jobs: int = None,
+                 fork: bool = hasattr(os, "fork")):
+        """
+        Arguments:
+            parser {Parser} -- The parser of the program.
+            jobs {int} -- The number of runs executing at the same time in
+            forked processes, by default the number of cores.
+            fork {bool} -- Fork a process for every run rather than copy
+            the snapshot in this process.
+        """
+        super().__init__(parser)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.fork = fork
+        # top-level statements executed once, and seconds they took
+        self.prefix = 0
+        self.prefix_time = 0.0
+
+    def sweep(self, program: Program, runs: list):
+        """
+        Runs a program for every set of parameter values.
+
+        Arguments:
+            program {Program} -- The program to execute.
+            runs {list} -- The dict of parameter values of every run.
+
+        Raises:
+            InterpreterError: If the program reads INPUT or a parameter is
+            not assigned at the top level.
+
+        Returns:
+            generator -- The output of every run, in the order of the runs,
+            ending with the message of the error which stopped it.
+        """
+        if any(isinstance(statement, Statement.Input)
+               for statement in walk(program.statements)):
+            raise InterpreterError("Programs reading INPUT can not be swept")
+        self.start(program)
+        assignments = parameter_assignments(
+            self.statements, {name for run in runs for name in run})
+        self.prefix = shared_prefix(self.statements,
+                                    min(assignments.values(), default=0))
+        output = io.StringIO()
+        start = time.perf_counter()
+        # the error or Halt which stopped the prefix
+        stopped = None
+        with contextlib.redirect_stdout(output):
+            try:
+                for statement in self.statements[:self.prefix]:
+                    self.execute(statement)
+            except Exception as e:
+                stopped = e
+        self.prefix_time = time.perf_counter() - start
+        prefix_output = output.getvalue()
+        if stopped is not None:
+            message = "" if isinstance(stopped, Halt) else \
+                error_message(stopped) + "\n"
+            for _ in runs:
+                yield prefix_output + message
+            return
+        variants = [with_parameters(self.statements, assignments, run)
+                    for run in runs]
+        if self.fork:
+            for text in self.forked(variants):
+                yield prefix_output + text
+        else:
+            snapshot = (self.env, self.arrays, self.data_pointer)
+            for variant in variants:
+                self.env, self.arrays, self.data_pointer = copy.deepcopy(
+                    snapshot)
+                yield prefix_output + self.continue_run(variant)
+
+    def continue_run(self, statements: list) -> str:
+        """
+        Executes the statements of a run after the shared prefix.
+
+        Returns:
+            str -- The output of the run and the message of the error which
+            stopped it.
+        """
+        self.statements = statements
+        return run_captured(self, self.prefix)
+
+    def forked(self, variants: list):
+        """
+        Executes the runs in forked processes, at most jobs at a time, and
+        generates their output in order. A child sends its output through a
+        pipe, which the parent reads while the child runs.
+        """
+        sys.stdout.flush()
+        children = []
+        started = 0
+        for index in range(len(variants)):
+            while started < len(variants) and \
+                    started < index + self.jobs:
+                children.append(self.spawn(variants[started]))
+                started += 1
+            pid, fd = children[index]
+            with os.fdopen(fd, "rb") as pipe:
+                data = pipe.read()
+            _, status = os.waitpid(pid, 0)
+            text = data.decode()
+            if status != 0:
+                text += "Run stopped with status {}\n".format(status)
+            yield text
+
+    def spawn(self, statements: list) -> tuple:
+        """
+        Forks a process executing a run.
+
+        Returns:
+            tuple -- The process id of the child and the pipe it writes its
+            output to.
+        """
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            status = 1
+            try:
+                data = self.continue_run(statements).encode()
+                with os.fdopen(write_fd, "wb") as pipe:
+                    pipe.write(data)
+                status = 0
+            finally:
+                # leave without running the cleanup of the parent
+                os._exit(status)
+        os.close(write_fd)
+        return pid, read_fd
+
+    def report(self) -> str:
+        """
+        Returns a human readable summary of the shared prefix.
+        """
+        return "Sweep: {} top-level statements shared, executed once in " \
+            "{:.3f}s".format(self.prefix, self.prefix_time)
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    A parameter sweep of a BASIC file can be run with:
+
+    python3 basic_sweep.py <filename> <sweep file> [--jobs N] [--no-fork]
+                           [--compare]
+
+    Every line of the sweep file holds the parameter values of one run,
+    like "rate=0.5 steps=100". The output of every run follows a line
+    naming its values. With --compare every run is also executed from the
+    start and the times of both are printed to STDERR.
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Run a BASIC file for every set of parameter values.")
+    arg_parser.add_argument("filename", help="BASIC source file")
+    arg_parser.add_argument("sweep", help="file of parameter values, one "
+                            "run per line")
+    arg_parser.add_argument("--jobs", type=int,
+                            help="number of runs at the same time")
+    arg_parser.add_argument("--no-fork", action="store_true",
+                            help="copy the snapshot instead of forking")
+    arg_parser.add_argument("--compare", action="store_true",
+                            help="time runs from the start as well")
+    args = arg_parser.parse_args()
+    with open(args.filename, "r") as f:
+        parser = Parser(Scanner(f.readlines()))
+    with open(args.sweep, "r") as f:
+        sweep_lines = f.readlines()
+    try:
+        program = parser.program()
+        runs = parse_runs(sweep_lines)
+        interpreter = SweepInterpreter(parser, args.jobs,
+                                       not args.no_fork and hasattr(os,
+                                                                    "fork"))
+        start = time.perf_counter()
+        outputs = list(interpreter.sweep(program, runs))
+        elapsed = time.perf_counter() - start
+    except (ParserError, ScannerError, InterpreterError) as e:
+        # if the program or the sweep file is invalid, alert the user
+        print(e)
+        return
+    for run, output in zip(runs, outputs):
+        print("# " + " ".join("{}={}".format(name, value)
+                              for name, value in run.items()))
+        sys.stdout.write(output)
+    print(interpreter.report(), file=sys.stderr)
+    print("sweep: {:.3f}s".format(elapsed), file=sys.stderr)
+    if args.compare:
+        start = time.perf_counter()
+        for run, output in zip(runs, outputs):
+            if run_alone(parser, program, run) != output:
+                print("The output of {} differs".format(run),
+                      file=sys.stderr)
+        print("from the start: {:.3f}s".format(time.perf_counter() - start),
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
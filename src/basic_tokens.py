@@ -10,14 +10,15 @@ Created by Nihad Kalathingal on 2/23/2020. Modified (03-04-2020)
 """
 
 from enum import Enum, auto  # enumerator for lexemes
-import re  # import regex library used to define lexemes
 
 """
     This file includes the definitions for the basic subset chosen from the
     ECMA 116 Standard. The Tokens are described as Enums which inherit from
-    a base class into children with Token types. A ALPHA and NON_ALPHA tuple
-    defines the lexemes using regular expressions as well as the order in
-    which they are matched in the scanner.
+    a base class into children with Token types. Words starting with an
+    alpha char are classified as keywords or identifiers by the KEYWORDS
+    dict, the NON_ALPHA_RULES tuple defines the other lexemes using regular
+    expressions as well as the order in which they are matched in the
+    scanner.
 """
 
 
@@ -32,6 +33,8 @@ class Delimiters(Tokens):
     """Delimiters in the basic subset."""
     EOL = auto()
     EOF = auto()
+    COMMA = auto()
+    HASH = auto()
 
 
 class Identifiers(Tokens):
@@ -49,6 +52,17 @@ class Keywords(Tokens):
     DO = auto()
     WHILE = auto()
     LOOP = auto()
+    DIM = auto()
+    READ = auto()
+    DATA = auto()
+    INPUT = auto()
+    GOTO = auto()
+    GOSUB = auto()
+    RETURN = auto()
+    DEF = auto()
+    AND = auto()
+    OR = auto()
+    NOT = auto()
 
 
 class Literals(Tokens):
@@ -72,43 +86,91 @@ class Operators(Tokens):
     LEFT_PEREN = auto()
 
 
-# regex matching order for tokens that start with alpha char
-# i.e keywords/ identifier
-ALPHA = (
-    # check for keywords
-    (re.compile(r'IF', re.IGNORECASE), Keywords.IF),
-    (re.compile(r'THEN', re.IGNORECASE), Keywords.THEN),
-    (re.compile(r'PRINT', re.IGNORECASE), Keywords.PRINT),
-    (re.compile(r'LET', re.IGNORECASE), Keywords.LET),
-    (re.compile(r'END', re.IGNORECASE), Keywords.END),
-    (re.compile(r'DO', re.IGNORECASE), Keywords.DO),
-    (re.compile(r'WHILE', re.IGNORECASE), Keywords.WHILE),
-    (re.compile(r'LOOP', re.IGNORECASE), Keywords.LOOP),
-    # check for identifier last
-    (re.compile(r'[A-Za-z0-9_]{1,31}'), Identifiers.IDENT)
-)
+# keywords by their upper case spelling, a word is classified as a keyword
+# or an identifier with one lookup of the case folded word
+KEYWORDS = {keyword.name: keyword for keyword in Keywords}
+# regex of a word, which is a keyword or identifier, that starts with an
+# alpha char
+WORD_PATTERN = r'[A-Za-z0-9_]{1,31}'
 # regex matching order for tokens that start with non-alpha starting char
 # i.e. data types, operators, identifier
-NON_ALPHA = (
+NON_ALPHA_RULES = (
     # check for the two data types, float and integer
-    (re.compile(r'\d*\.\d+'), Literals.FLOAT_LIT),
-    (re.compile(r'[0-9]+'), Literals.INT_LIT),
+    (r'\d*\.\d+', Literals.FLOAT_LIT),
+    (r'[0-9]+', Literals.INT_LIT),
     # check for operators
-    (re.compile(r'\)'), Operators.RIGHT_PEREN),
-    (re.compile(r'\('), Operators.LEFT_PEREN),
-    (re.compile(r'\+'), Operators.ADD_OP),
-    (re.compile(r'\-'), Operators.SUB_OP),
-    (re.compile(r'\*'), Operators.MULT_OP),
-    (re.compile(r'\/'), Operators.DIV_OP),
-    (re.compile(r'='), Operators.EQUAL_OP),
-    (re.compile(r'<='), Operators.NOT_GREATER),
-    (re.compile(r'>='), Operators.NOT_LESS),
-    (re.compile(r'<'), Operators.LESS_THAN),
-    (re.compile(r'>'), Operators.GREATER_THAN),
-    # check for end of line
-    (re.compile(r'\n'), Delimiters.EOL),
+    (r'\)', Operators.RIGHT_PEREN),
+    (r'\(', Operators.LEFT_PEREN),
+    (r'\+', Operators.ADD_OP),
+    (r'\-', Operators.SUB_OP),
+    (r'\*', Operators.MULT_OP),
+    (r'\/', Operators.DIV_OP),
+    (r'=', Operators.EQUAL_OP),
+    (r'<=', Operators.NOT_GREATER),
+    (r'>=', Operators.NOT_LESS),
+    (r'<', Operators.LESS_THAN),
+    (r'>', Operators.GREATER_THAN),
+    # check for delimiters
+    (r'\n', Delimiters.EOL),
+    (r',', Delimiters.COMMA),
+    (r'#', Delimiters.HASH),
     # check for identifier last
-    (re.compile(r'[A-Za-z0-9_]{1,31}'), Identifiers.IDENT)
+    (r'[A-Za-z0-9_]{1,31}', Identifiers.IDENT)
 )
 # regex rule used to skip whitespaces
-WS_RULE = re.compile(r"\S|\r\n|\r|\n")
+WS_PATTERN = r"\S|\r\n|\r|\n"
+# the rules compiled by lexer_tables() when the first source is scanned, so
+# programs read from token streams or compiled modules never compile them
+_tables = None
+
+
+def lexer_tables() -> tuple:
+    """
+    Returns the compiled word rule, NON_ALPHA rules and whitespace rule,
+    compiling them the first time.
+
+    Returns:
+        tuple -- (word_rule, non_alpha, ws_rule), the NON_ALPHA rules are a
+        tuple of (compiled regex, token type) in matching order.
+    """
+    global _tables
+    if _tables is None:
+        # imported here as re takes a noticeable part of the startup time
+        import re
+        _tables = (re.compile(WORD_PATTERN),
+                   tuple((re.compile(pattern), token_type)
+                         for pattern, token_type in NON_ALPHA_RULES),
+                   re.compile(WS_PATTERN))
+    return _tables
+
+
+# every token type in a fixed order, the index of a type in this tuple is
+# its numeric id in serialized token streams and token buffers
+TOKEN_TYPES = tuple(token_type
+                    for group in (Delimiters, Identifiers, Keywords,
+                                  Literals, Operators)
+                    for token_type in group)
+# numeric id of each token type
+TOKEN_IDS = {token_type: index for index, token_type in enumerate(TOKEN_TYPES)}
+# precedence of binary operators, operators with a higher precedence bind
+# tighter and operators of equal precedence associate to the left
+PRECEDENCE = {
+    Keywords.OR: 1,
+    Keywords.AND: 2,
+    Operators.EQUAL_OP: 4,
+    Operators.LESS_THAN: 4,
+    Operators.GREATER_THAN: 4,
+    Operators.NOT_GREATER: 4,
+    Operators.NOT_LESS: 4,
+    Operators.ADD_OP: 5,
+    Operators.SUB_OP: 5,
+    Operators.MULT_OP: 6,
+    Operators.DIV_OP: 6,
+}
+# precedence of prefix (unary) operators, NOT binds looser than the
+# comparisons it negates
+PREFIX_PRECEDENCE = {
+    Keywords.NOT: 3,
+    Operators.ADD_OP: 7,
+    Operators.SUB_OP: 7,
+}
@@ -0,0 +1,243 @@
+"""
+Python Implementation of a Binary Token Stream for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import contextlib
+import mmap
+import os
+import struct
+from basic_scanner import Scanner, ScannerError, Token, TokenBuffer
+from basic_parser import Parser, ParserError
+from basic_program import dump
+from basic_tokens import TOKEN_TYPES, TOKEN_IDS
+
+"""
+This file includes a compact binary format for the output of the scanner,
+so a source only has to be scanned once and the tokens can be reused by
+the parser and other tools. All numbers are little endian:
+
+    header      magic "BTOK", version (u16), number of token types (u32),
+                number of strings (u32), number of tokens (u32)
+    types       string id of the name of each token type (u32 each)
+    strings     end offset of each string in the string data (u32 each)
+                followed by the UTF-8 string data
+    tokens      type id (u8), column (u32), line (u32) and string id of
+                the lexeme (u32) of each token
+
+Lexemes are interned in the string table, so every identifier, keyword
+or literal is stored once. The type names make a stream readable even if
+token types are added later. The reader unpacks records directly from a
+memoryview of the buffer (for example a memory mapped file).
+"""
+
+MAGIC = b"BTOK"
+VERSION = 2
+HEADER = struct.Struct("<4sHIII")
+# version 1 packed the column as u16, which longer lines overflowed
+RECORD = struct.Struct("<BIII")
+# token types by their name, used to map the type table of a stream
+TYPES_BY_NAME = {str(token_type): token_type for token_type in TOKEN_TYPES}
+
+
+class TokenStreamError(Exception):
+    """
+    Exception class for an invalid token stream.
+    """
+
+    def __init__(self, err: str):
+        self.err = err
+
+    def __str__(self):
+        return "TokenStreamError: {}".format(self.err)
+
+
+def write_tokens(tokens, f):
+    """
+    Serializes tokens to a binary file.
+
+    Parameters:
+    tokens (iterable): the tokens, for example Scanner.lex()
+    f (file): file opened in binary mode
+    """
+    strings = {}  # string id of each interned string
+
+    def intern(string):
+        string_id = strings.get(string)
+        if string_id is None:
+            string_id = strings[string] = len(strings)
+        return string_id
+
+    type_names = [intern(str(token_type)) for token_type in TOKEN_TYPES]
+    records = bytearray()
+    count = 0
+    for token in tokens:
+        records += RECORD.pack(TOKEN_IDS[token.type], token.pos[1],
+                               token.pos[0], intern(token.lexeme))
+        count += 1
+    data = [string.encode() for string in strings]
+    offsets, end = [], 0
+    for encoded in data:
+        end += len(encoded)
+        offsets.append(end)
+    f.write(HEADER.pack(MAGIC, VERSION, len(type_names), len(data), count))
+    f.write(struct.pack("<{}I".format(len(type_names)), *type_names))
+    f.write(struct.pack("<{}I".format(len(offsets)), *offsets))
+    f.write(b"".join(data))
+    f.write(records)
+
+
+class TokenStreamReader:
+    """
+    Reads a serialized token stream. A reader can be passed to the Parser
+    in place of a Scanner.
+    """
+
+    def __init__(self, buffer):
+        """
+        Parameters:
+        buffer (bytes-like): the serialized stream, which is not copied
+
+        Raises:
+        TokenStreamError: if the buffer is not a valid token stream
+        """
+        # the view is released when the stream is invalid, so the buffer
+        # (a memory mapped file) can be closed while the error is handled
+        with memoryview(buffer) as view:
+            if len(view) < HEADER.size:
+                raise TokenStreamError("Truncated header")
+            magic, version, n_types, n_strings, n_tokens = \
+                HEADER.unpack_from(view)
+            if magic != MAGIC or version != VERSION:
+                raise TokenStreamError(
+                    "Not a version {} token stream".format(VERSION))
+            try:
+                offset = HEADER.size
+                type_names = struct.unpack_from("<{}I".format(n_types),
+                                                view, offset)
+                offset += 4 * n_types
+                ends = struct.unpack_from("<{}I".format(n_strings), view,
+                                          offset)
+                offset += 4 * n_strings
+                strings, start = [], 0
+                for end in ends:
+                    if not start <= end <= len(view) - offset:
+                        raise TokenStreamError("Truncated string data")
+                    strings.append(str(view[offset + start:offset + end],
+                                       "utf-8"))
+                    start = end
+                offset += start
+                self.types = tuple(TYPES_BY_NAME[strings[name]]
+                                   for name in type_names)
+            except (struct.error, UnicodeDecodeError) as e:
+                raise TokenStreamError("Invalid string table ({})".format(e))
+            except (IndexError, KeyError) as e:
+                raise TokenStreamError("Unknown token type {}".format(e))
+            self.strings = strings
+            if len(view) - offset < n_tokens * RECORD.size:
+                raise TokenStreamError("Truncated token records")
+            self.records = view[offset:offset + n_tokens * RECORD.size]
+
+    def release(self):
+        """
+        Releases the view of the buffer, which has to be done before the
+        buffer is closed.
+        """
+        self.records.release()
+
+    def __len__(self):
+        return len(self.records) // RECORD.size
+
+    def tokens(self) -> TokenBuffer:
+        """
+        Returns the tokens of the stream in a TokenBuffer, used by the
+        parser, without creating Token objects.
+        """
+        # the type ids of the stream mapped to the ones of this version
+        ids = [TOKEN_IDS[token_type] for token_type in self.types]
+        strings = self.strings
+        buffer = TokenBuffer()
+        types, lexemes = buffer.types, buffer.lexemes
+        lines, columns = buffer.lines, buffer.columns
+        try:
+            for type_id, col, line, string_id in RECORD.iter_unpack(
+                    self.records):
+                types.append(ids[type_id])
+                lexemes.append(strings[string_id])
+                lines.append(line)
+                columns.append(col)
+        except IndexError:
+            raise TokenStreamError("Invalid token {}".format(len(types)))
+        return buffer
+
+    def lex(self):
+        """
+        Generates the Token objects of the stream.
+        """
+        types, strings = self.types, self.strings
+        for index, (type_id, col, line, string_id) in enumerate(
+                RECORD.iter_unpack(self.records)):
+            if type_id >= len(types) or string_id >= len(strings):
+                raise TokenStreamError("Invalid token {}".format(index))
+            yield Token(types[type_id], strings[string_id], (line, col))
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    A BASIC file can be scanned into a token stream with:
+
+    python3 basic_tokenstream.py write <filename> <stream>
+
+    and the stream can be printed or parsed with:
+
+    python3 basic_tokenstream.py read <stream>
+    python3 basic_tokenstream.py parse <stream>
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Write or read binary token streams.")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    write_parser = commands.add_parser("write", help="scan a source file")
+    write_parser.add_argument("filename", help="BASIC source file")
+    write_parser.add_argument("stream", help="token stream to write")
+    for command in ("read", "parse"):
+        commands.add_parser(command).add_argument(
+            "stream", help="token stream to read")
+    args = arg_parser.parse_args()
+    if args.command == "write":
+        with open(args.filename, "r") as source:
+            try:
+                # scanned first, so no stream is written for an invalid
+                # source
+                tokens = list(Scanner(source).lex())
+            except ScannerError as e:
+                print(e)
+                return
+        with open(args.stream, "wb") as f:
+            write_tokens(tokens, f)
+        return
+    with open(args.stream, "rb") as f:
+        # an empty file can not be mapped, it is read as an empty buffer
+        if os.fstat(f.fileno()).st_size:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            mapping = contextlib.nullcontext(b"")
+        with mapping as buffer:
+            try:
+                reader = TokenStreamReader(buffer)
+                try:
+                    if args.command == "read":
+                        for token in reader.lex():
+                            print(token)
+                    else:
+                        print(dump(Parser(reader).program()))
+                finally:
+                    # the views of the buffer are released before it is
+                    # closed
+                    reader.release()
+            except (TokenStreamError, ParserError) as e:
+                print(e)
+
+
+if __name__ == "__main__":
+    main()
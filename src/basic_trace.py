@@ -0,0 +1,520 @@
+"""
+Python Implementation of Execution Traces for a Subset of BASIC
+(ECMA 116 Standard)
+"""
+import argparse  # import argparse used for CLI options
+import bisect
+import pickle
+import struct
+import zlib
+from basic_interpreter import Interpreter, InterpreterError
+from basic_optimizer import walk
+from basic_parser import Parser
+from basic_program import Expression, Statement, Program
+from basic_runtime import get_array, make_array, subscript, store_element
+
+"""
+This file includes an interpreter which records an execution trace, and
+a reader which replays it. The trace logs every assignment and branch
+decision, so the enviornment of a run which misbehaved can be inspected
+at any step without executing it again. Every record is one step:
+
+    assign      statement id, variable slot, value
+    element     statement id, array slot, subscript, value
+    dim         statement id, array slot, number of elements
+    branch      statement id of an IF, whether its body was executed
+    loop        statement id of a DO WHILE, number of iterations
+
+A loop is logged once when it ends with the number of iterations it ran,
+rather than a decision per iteration. Statement ids number the statements
+of the program in the order of basic_optimizer.walk. The trace is an
+append-only file, all numbers are little endian:
+
+    header      magic "BTRC", version (u16), number of statements (u32),
+                steps per chunk (u32), followed by the source line of
+                every statement (u32 each, 0 if unknown)
+    chunks      first step (u64), number of steps (u32), compressed size
+                (u32), followed by the zlib compressed chunk
+
+A chunk starts with a pickled snapshot of the enviornment and the arrays
+before its first step, followed by its records. A slot is declared by a
+name record the first time a variable is used in a chunk, so every chunk
+can be decoded on its own. The index file (the trace file name followed
+by .idx) holds the first step (u64) and the file offset (u64) of every
+chunk, so replaying a step loads the snapshot of its chunk and applies at
+most a chunk of records, without executing any expression.
+"""
+
+MAGIC = b"BTRC"
+# version 1 recorded the values of comparisons as integers
+VERSION = 2
+HEADER = struct.Struct("<4sHII")
+CHUNK = struct.Struct("<QII")
+INDEX = struct.Struct("<QQ")
+# steps recorded in a chunk, the steps between two snapshots
+CHUNK_STEPS = 1 << 16
+SNAPSHOT_SIZE = struct.Struct("<I")
+
+# record tags
+NAME, ASSIGN_INT, ASSIGN_FLOAT, ASSIGN_BIG, ELEMENT_INT, ELEMENT_FLOAT, \
+    DIM, BRANCH, LOOP, ASSIGN_BOOL = range(10)
+# record layouts by tag, ASSIGN_BIG is followed by the decimal digits and
+# NAME by the UTF-8 name
+RECORDS = {
+    NAME: struct.Struct("<BH"),
+    ASSIGN_INT: struct.Struct("<BIIq"),
+    ASSIGN_FLOAT: struct.Struct("<BIId"),
+    ASSIGN_BIG: struct.Struct("<BIIH"),
+    ELEMENT_INT: struct.Struct("<BIIQq"),
+    ELEMENT_FLOAT: struct.Struct("<BIIQd"),
+    DIM: struct.Struct("<BIIQ"),
+    BRANCH: struct.Struct("<BIB"),
+    LOOP: struct.Struct("<BIQ"),
+    ASSIGN_BOOL: struct.Struct("<BIIB"),
+}
+# the kind of step of each record tag
+KINDS = {ASSIGN_INT: "assign", ASSIGN_FLOAT: "assign", ASSIGN_BIG: "assign",
+         ASSIGN_BOOL: "assign",
+         ELEMENT_INT: "element", ELEMENT_FLOAT: "element", DIM: "dim",
+         BRANCH: "branch", LOOP: "loop"}
+
+
+class TraceWriter:
+    """
+    Appends the records of a run to a trace file, a chunk at a time.
+    """
+
+    def __init__(self, filename: str, lines: list, state,
+                 chunk_steps: int = CHUNK_STEPS):
+        """
+        Arguments:
+            filename {str} -- The trace file, replaced if it exists.
+            lines {list} -- The source line of every statement.
+            state {callable} -- Returns the enviornment and the arrays for
+            the snapshot at the start of a chunk.
+            chunk_steps {int} -- Steps recorded in a chunk.
+        """
+        self.file = open(filename, "wb")
+        self.index = open(filename + ".idx", "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, len(lines), chunk_steps))
+        self.file.write(struct.pack("<{}I".format(len(lines)), *lines))
+        self.state = state
+        self.chunk_steps = chunk_steps
+        self.step = 0
+        self.begin_chunk()
+
+    def begin_chunk(self):
+        """
+        Starts a chunk with a snapshot of the current state.
+        """
+        self.first = self.step
+        self.end = self.step + self.chunk_steps
+        # slot of each name declared in the chunk
+        self.slots = {}
+        snapshot = pickle.dumps(self.state(), pickle.HIGHEST_PROTOCOL)
+        self.records = bytearray(SNAPSHOT_SIZE.pack(len(snapshot)))
+        self.records += snapshot
+
+    def flush(self):
+        """
+        Compresses the current chunk, appends it to the file and its
+        position to the index.
+        """
+        data = zlib.compress(self.records)
+        self.index.write(INDEX.pack(self.first, self.file.tell()))
+        self.file.write(CHUNK.pack(self.first, self.step - self.first,
+                                   len(data)))
+        self.file.write(data)
+        self.file.flush()
+        self.index.flush()
+
+    def slot(self, name: str) -> int:
+        """
+        Returns the slot of a name in the current chunk, declaring it by a
+        record the first time it is used.
+        """
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.slots)
+            encoded = name.encode()
+            self.records += RECORDS[NAME].pack(NAME, len(encoded))
+            self.records += encoded
+        return slot
+
+    def stepped(self):
+        """
+        Counts a recorded step and starts a new chunk when the current one
+        is full. The snapshot is taken after the step was executed.
+        """
+        self.step += 1
+        if self.step == self.end:
+            self.flush()
+            self.begin_chunk()
+
+    def assign(self, statement: int, name: str, value,
+               pack_int=RECORDS[ASSIGN_INT].pack,
+               pack_float=RECORDS[ASSIGN_FLOAT].pack):
+        # the most frequent record, stepped() and slot() are inlined
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slot(name)
+        if type(value) is float:
+            self.records += pack_float(ASSIGN_FLOAT, statement, slot, value)
+        elif type(value) is bool:
+            # the value of a comparison or a logical expression
+            self.records += RECORDS[ASSIGN_BOOL].pack(
+                ASSIGN_BOOL, statement, slot, value)
+        elif -0x8000000000000000 <= value <= 0x7fffffffffffffff:
+            self.records += pack_int(ASSIGN_INT, statement, slot, value)
+        else:
+            digits = str(value).encode()
+            self.records += RECORDS[ASSIGN_BIG].pack(
+                ASSIGN_BIG, statement, slot, len(digits))
+            self.records += digits
+        self.step += 1
+        if self.step == self.end:
+            self.flush()
+            self.begin_chunk()
+
+    def element(self, statement: int, name: str, index: int, value):
+        # arrays hold 64 bit integers or floats, see store_element
+        tag = ELEMENT_FLOAT if type(value) is float else ELEMENT_INT
+        self.records += RECORDS[tag].pack(tag, statement, self.slot(name),
+                                          index, value)
+        self.stepped()
+
+    def dim(self, statement: int, name: str, size: int):
+        self.records += RECORDS[DIM].pack(DIM, statement, self.slot(name),
+                                          size)
+        self.stepped()
+
+    def branch(self, statement: int, taken: bool):
+        self.records += RECORDS[BRANCH].pack(BRANCH, statement, taken)
+        self.stepped()
+
+    def loop(self, statement: int, iterations: int):
+        self.records += RECORDS[LOOP].pack(LOOP, statement, iterations)
+        self.stepped()
+
+    def close(self):
+        """
+        Writes the last chunk, also if it has no steps so the final state
+        is part of the trace.
+        """
+        self.flush()
+        self.file.close()
+        self.index.close()
+
+
+class TraceInterpreter(Interpreter):
+    """
+    Interpreter which records an execution trace of the program it runs.
+    """
+
+    def __init__(self, parser: Parser, filename: str,
+                 chunk_steps: int = CHUNK_STEPS):
+        """
+        Arguments:
+            parser {Parser} -- The parser of the program.
+            filename {str} -- The trace file.
+            chunk_steps {int} -- Steps between two snapshots.
+        """
+        super().__init__(parser)
+        self.filename = filename
+        self.chunk_steps = chunk_steps
+        self.trace = None
+
+    def run(self, program: Program):
+        """
+        Executes a program and records its trace, the trace is complete
+        also if the program stopped with an error.
+        """
+        try:
+            super().run(program)
+        finally:
+            if self.trace is not None:
+                self.trace.close()
+
+    def start(self, program: Program):
+        super().start(program)
+        statements = list(walk(self.statements))
+        # statement id of every statement
+        self.ids = {id(statement): number for number, statement in
+                    enumerate(statements)}
+        self.target_statement = None
+        self.trace = TraceWriter(self.filename,
+                                 [getattr(statement, "line", None) or 0
+                                  for statement in statements],
+                                 lambda: (self.env, self.arrays),
+                                 self.chunk_steps)
+
+    def visit_assignment(self, assign_stmnt: Statement.Assignment):
+        value = self.evaluate(assign_stmnt.expr)
+        self.env[assign_stmnt.identifier] = value
+        self.trace.assign(self.ids[id(assign_stmnt)], assign_stmnt.identifier,
+                          value)
+
+    def visit_increment(self, increment_stmnt: Statement.Increment):
+        super().visit_increment(increment_stmnt)
+        self.trace.assign(self.ids[id(increment_stmnt)],
+                          increment_stmnt.identifier,
+                          self.env[increment_stmnt.identifier])
+
+    def visit_element_assignment(self,
+                                 assign_stmnt: Statement.ElementAssignment):
+        values = get_array(self.arrays, assign_stmnt.identifier)
+        index = self.evaluate(assign_stmnt.index)
+        if assign_stmnt.checked:
+            index = subscript(values, index)
+        store_element(self.arrays, assign_stmnt.identifier, index,
+                      self.evaluate(assign_stmnt.expr))
+        self.trace.element(self.ids[id(assign_stmnt)],
+                           assign_stmnt.identifier, index,
+                           self.arrays[assign_stmnt.identifier][index])
+
+    def visit_dim(self, dim_stmnt: Statement.Dim):
+        super().visit_dim(dim_stmnt)
+        self.trace.dim(self.ids[id(dim_stmnt)], dim_stmnt.identifier,
+                       len(self.arrays[dim_stmnt.identifier]))
+
+    def visit_if(self, if_stmnt: Statement.If):
+        taken = bool(self.evaluate(if_stmnt.rel_expr))
+        self.trace.branch(self.ids[id(if_stmnt)], taken)
+        if taken:
+            for statement in if_stmnt.body:
+                self.execute(statement)
+
+    def visit_dowhile(self, dowhile_stmnt: Statement.DoWhile):
+        iterations = 0
+        try:
+            while self.evaluate(dowhile_stmnt.rel_expr):
+                iterations += 1
+                for statement in dowhile_stmnt.body:
+                    self.execute(statement)
+        finally:
+            # also when the loop is left by GOTO, END or an error
+            self.trace.loop(self.ids[id(dowhile_stmnt)], iterations)
+
+    def visit_read(self, read_stmnt: Statement.Read):
+        self.target_statement = self.ids[id(read_stmnt)]
+        super().visit_read(read_stmnt)
+
+    def visit_input(self, input_stmnt: Statement.Input):
+        self.target_statement = self.ids[id(input_stmnt)]
+        super().visit_input(input_stmnt)
+
+    def assign(self, target: Expression, value):
+        super().assign(target, value)
+        if isinstance(target, Expression.Index):
+            values = self.arrays[target.identifier]
+            index = self.evaluate(target.index)
+            if target.checked:
+                index = subscript(values, index)
+            self.trace.element(self.target_statement, target.identifier,
+                               index, values[index])
+        else:
+            self.trace.assign(self.target_statement, target.identifier,
+                              value)
+
+
+class TraceReader:
+    """
+    Reads a trace file and the enviornment at any of its steps.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Raises:
+            InterpreterError: If the file is not a trace.
+        """
+        self.file = open(filename, "rb")
+        header = self.file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise InterpreterError("Invalid trace file " + filename)
+        magic, version, statements, self.chunk_steps = \
+            HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise InterpreterError("Invalid trace file " + filename)
+        # source line of every statement
+        self.lines = struct.unpack("<{}I".format(statements),
+                                   self.file.read(4 * statements))
+        with open(filename + ".idx", "rb") as f:
+            data = f.read()
+        # an entry cut off by a crash is ignored
+        entries = [INDEX.unpack_from(data, offset) for offset in
+                   range(0, len(data) - INDEX.size + 1, INDEX.size)]
+        if not entries:
+            raise InterpreterError("Empty trace index " + filename + ".idx")
+        self.firsts = [first for first, _ in entries]
+        self.offsets = [offset for _, offset in entries]
+        first, count, _ = self.chunk_header(len(self.offsets) - 1)
+        # steps recorded in the trace
+        self.steps = first + count
+
+    def close(self):
+        self.file.close()
+
+    def chunk_header(self, number: int) -> tuple:
+        self.file.seek(self.offsets[number])
+        return CHUNK.unpack(self.file.read(CHUNK.size))
+
+    def chunk(self, number: int) -> tuple:
+        """
+        Returns the first step, the snapshot and the records of a chunk.
+        """
+        first, _, size = self.chunk_header(number)
+        data = zlib.decompress(self.file.read(size))
+        (length,) = SNAPSHOT_SIZE.unpack_from(data)
+        start = SNAPSHOT_SIZE.size
+        snapshot = pickle.loads(data[start:start + length])
+        return first, snapshot, memoryview(data)[start + length:]
+
+    def events(self, step: int = 0):
+        """
+        Generates the steps from the one after a step to the end of the
+        trace, as tuples of the step number, the kind of step, the
+        statement id, the name (None for branches and loops), the
+        subscript of an element (None otherwise) and the value. The value
+        of a branch tells whether it was taken and the value of a loop is
+        its number of iterations.
+        """
+        number = max(bisect.bisect_right(self.firsts, step) - 1, 0)
+        for number in range(number, len(self.offsets)):
+            first, _, records = self.chunk(number)
+            for event in decode(records, first):
+                if event[0] > step:
+                    yield event
+
+    def state_at(self, step: int) -> tuple:
+        """
+        Returns the enviornment and the arrays after a step, step 0 is the
+        start of the program.
+
+        Raises:
+            InterpreterError: If the trace has fewer steps.
+        """
+        if not 0 <= step <= self.steps:
+            raise InterpreterError("Step {} is not in the trace of {} "
+                                   "steps".format(step, self.steps))
+        number = bisect.bisect_right(self.firsts, step) - 1
+        first, (env, arrays), records = self.chunk(number)
+        for number, kind, _, name, index, value in decode(records, first):
+            if number > step:
+                break
+            if kind == "assign":
+                env[name] = value
+            elif kind == "element":
+                store_element(arrays, name, index, value)
+            elif kind == "dim":
+                arrays[name] = make_array(value - 1)
+        return env, arrays
+
+
+def decode(records: memoryview, step: int):
+    """
+    Generates the steps of the records of a chunk, see TraceReader.events.
+
+    Arguments:
+        records {memoryview} -- The records following the snapshot.
+        step {int} -- The first step of the chunk.
+    """
+    names = []
+    offset = 0
+    while offset < len(records):
+        tag = records[offset]
+        layout = RECORDS[tag]
+        fields = layout.unpack_from(records, offset)
+        offset += layout.size
+        if tag == NAME:
+            names.append(bytes(records[offset:offset + fields[1]]).decode())
+            offset += fields[1]
+            continue
+        step += 1
+        if tag in (BRANCH, LOOP):
+            yield step, KINDS[tag], fields[1], None, None, \
+                bool(fields[2]) if tag == BRANCH else fields[2]
+        elif tag == ASSIGN_BIG:
+            value = int(bytes(records[offset:offset + fields[3]]))
+            offset += fields[3]
+            yield step, "assign", fields[1], names[fields[2]], None, value
+        elif tag == ASSIGN_BOOL:
+            yield step, "assign", fields[1], names[fields[2]], None, \
+                bool(fields[3])
+        elif tag in (ELEMENT_INT, ELEMENT_FLOAT):
+            yield step, "element", fields[1], names[fields[2]], fields[3], \
+                fields[4]
+        else:
+            yield step, KINDS[tag], fields[1], names[fields[2]], None, \
+                fields[3]
+
+
+def describe(event: tuple, lines: tuple) -> str:
+    """
+    Returns a line describing a step of a trace.
+
+    Arguments:
+        event {tuple} -- The step, see TraceReader.events.
+        lines {tuple} -- The source line of every statement.
+    """
+    step, kind, statement, name, index, value = event
+    if kind == "branch":
+        what = "IF taken" if value else "IF not taken"
+    elif kind == "loop":
+        what = "DO WHILE ran {} iterations".format(value)
+    elif kind == "dim":
+        what = "DIM {}({})".format(name, value - 1)
+    elif kind == "element":
+        what = "{}({}) = {}".format(name, index, value)
+    else:
+        what = "{} = {}".format(name, value)
+    return "{:>10}  line {:<6}  {}".format(step, lines[statement] or "?",
+                                           what)
+
+
+def main():
+    '''
+    Ensure that the Python 3 interpreter is installed.
+    A trace recorded with basic_interpreter.py --trace FILE can be replayed
+    with:
+
+    python3 basic_trace.py <trace file> [--step N] [--events N]
+
+    The number of steps is printed, --step prints the variables and arrays
+    after step N and --events prints N steps following it with their
+    source lines.
+    '''
+    arg_parser = argparse.ArgumentParser(
+        description="Replay a BASIC execution trace.")
+    arg_parser.add_argument("trace", help="trace file")
+    arg_parser.add_argument("--step", type=int, metavar="N",
+                            help="print the variables after step N")
+    arg_parser.add_argument("--events", type=int, metavar="N",
+                            help="print N steps following --step")
+    args = arg_parser.parse_args()
+    try:
+        reader = TraceReader(args.trace)
+    except (OSError, InterpreterError) as e:
+        print(e)
+        return
+    print("{} steps in {} chunks".format(reader.steps, len(reader.offsets)))
+    step = args.step or 0
+    try:
+        if args.step is not None:
+            env, arrays = reader.state_at(step)
+            for name in sorted(env):
+                print("{} = {}".format(name, env[name]))
+            for name in sorted(arrays):
+                print("{}() = {}".format(name, list(arrays[name])))
+    except InterpreterError as e:
+        print(e)
+        return
+    if args.events:
+        for count, event in enumerate(reader.events(step)):
+            if count == args.events:
+                break
+            print(describe(event, reader.lines))
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
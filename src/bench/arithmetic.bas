@@ -0,0 +1,13 @@
+let a = 1.5
+let b = 2
+let n = 0
+DO WHILE n < 2000
+    let c = (a * b + (a - b) * (a + b)) / (b + 1)
+    let d = -c + a * a - b / 4
+    let a = a + 0.001
+    let n = n + 1
+LOOP
+PRINT a
+PRINT c
+PRINT d
+END
@@ -0,0 +1,18 @@
+DIM a(999)
+let r = 0
+DO WHILE r < 20
+    let i = 0
+    DO WHILE i < 1000
+        let a(i) = a(i) + i * r
+        let i = i + 1
+    LOOP
+    let r = r + 1
+LOOP
+let i = 0
+let total = 0
+DO WHILE i < 1000
+    let total = total + a(i)
+    let i = i + 1
+LOOP
+PRINT total
+END
@@ -0,0 +1,30 @@
+let n = 60000
+let a = 0
+let s = 0
+DO WHILE a < n
+    let s = s + (a * a) / 3 - a
+    let a = a + 1
+LOOP
+let b = 0
+let t = 0
+DO WHILE b < n
+    let t = t + (b * 2 + 1) / (b + 1)
+    let b = b + 1
+LOOP
+let c = 0
+let u = 0
+DO WHILE c < n
+    let u = u + (c - 5) * (c + 5) / 7
+    let c = c + 1
+LOOP
+let d = 0
+let v = 0
+DO WHILE d < n
+    let v = v + d / (d + 3) * 4
+    let d = d + 1
+LOOP
+PRINT s
+PRINT t
+PRINT u
+PRINT v
+END
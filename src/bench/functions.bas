@@ -0,0 +1,14 @@
+DEF FNP(X) = (X * X * X + 3 * X * X - 2 * X + 7) / (X * X + 1)
+DEF FNQ(X, Y) = FNP(X) * Y + FNP(Y) * X
+LET total = 0
+LET i = 0
+LET j = 0
+DO WHILE i < 100000
+    LET total = total + FNQ(j, j + 1)
+    LET j = j + 1
+    IF j = 10 THEN
+        LET j = 0
+    END IF
+    LET i = i + 1
+LOOP
+PRINT total
@@ -0,0 +1,12 @@
+let i = 0
+let total = 0
+DO WHILE i < 200
+    let j = 0
+    DO WHILE j < 100
+        let total = total + (i * j) / 2 - j
+        let j = j + 1
+    LOOP
+    let i = i + 1
+LOOP
+PRINT total
+END
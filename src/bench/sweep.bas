@@ -0,0 +1,22 @@
+DIM table(2000)
+let i = 0
+DO WHILE i <= 2000
+    let j = 0
+    let s = 0
+    DO WHILE j < 40
+        let s = s + (i * j) / (j + 1)
+        let j = j + 1
+    LOOP
+    let table(i) = s
+    let i = i + 1
+LOOP
+let rate = 0.5
+let steps = 200
+let total = 0
+let k = 0
+DO WHILE k < steps
+    let total = total + table(k * 7) * rate
+    let k = k + 1
+LOOP
+PRINT total
+END
@@ -0,0 +1,17 @@
+DIM a(9)
+let i = 0
+DO WHILE i < 10
+    let a(i) = i * i
+    let i = i + 1
+LOOP
+let i = 0
+let total = 0
+DO WHILE i <= 9
+    let total = total + a(i)
+    let i = i + 1
+LOOP
+PRINT total
+let a(3) = a(3) / 2
+PRINT a(3)
+PRINT a(a(2))
+END
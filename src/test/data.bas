@@ -0,0 +1,13 @@
+DIM v(4)
+let i = 0
+DO WHILE i < 5
+    READ v(i)
+    let i = i + 1
+LOOP
+READ a, b
+PRINT v(0) + v(4)
+PRINT a * b
+END
+DATA 1, 2, 3
+DATA 4, -5.5, 6
+DATA +7
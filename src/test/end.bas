@@ -0,0 +1,20 @@
+let i = 0
+
+DO WHILE i < 10
+    let i = i + 1
+    IF i = 3 THEN
+        IF i > 2 THEN
+            PRINT i
+        END IF
+    END IF
+    IF i = 5 THEN
+        PRINT i
+        END
+        PRINT 0
+    END IF
+LOOP
+PRINT 0
+END
+IF 1 > 2 THEN
+    PRINT 0
+END IF
@@ -0,0 +1,22 @@
+10 LET n = 0
+20 LET total = 0
+30 GOSUB 200
+40 IF n < 5 THEN 30
+50 PRINT total
+60 GOSUB 300
+70 GOTO 1000
+80 PRINT 999
+200 LET n = n + 1
+210 LET total = total + n
+220 RETURN
+300 LET i = 0
+DO WHILE i < 3
+    LET i = i + 1
+    IF i = 2 THEN GOSUB 400
+LOOP
+RETURN
+400 PRINT i * 100
+410 IF i > 1 THEN RETURN
+420 PRINT 0
+RETURN
+1000 END
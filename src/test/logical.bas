@@ -0,0 +1,23 @@
+LET x = 3
+LET y = 0
+DIM a(4)
+IF x > 1 AND x < 5 THEN PRINT 1
+IF x < 1 OR x = 3 THEN PRINT 2
+IF NOT x = 3 THEN PRINT 3
+IF NOT y = 0 AND 10 / y > 1 THEN PRINT 4
+IF y = 0 OR 10 / y > 1 THEN PRINT 5
+IF x > 4 AND a(x) = 0 THEN PRINT 6
+IF NOT (x < 1 OR x > 5) AND (y = 0 OR z > 1) THEN
+    PRINT 7
+END IF
+LET i = 0
+DO WHILE i < 4 AND a(i) = 0
+    LET a(i) = i * 2
+    LET i = i + 1
+LOOP
+PRINT i
+LET t = x > 1 AND y
+PRINT t
+PRINT NOT y
+PRINT x OR z
+END
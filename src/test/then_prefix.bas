@@ -0,0 +1,5006 @@
+let y = 0
+let thenx = 0
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 1
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 2
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 3
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 4
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 5
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 6
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 7
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 8
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 9
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 10
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 11
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 12
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 13
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 14
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 15
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 16
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 17
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 18
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 19
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 20
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 21
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 22
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 23
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 24
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 25
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 26
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 27
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 28
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 29
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 30
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 31
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 32
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 33
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 34
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 35
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 36
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 37
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 38
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 39
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 40
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 41
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 42
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 43
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 44
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 45
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 46
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 47
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 48
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 49
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 50
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 51
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 52
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 53
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 54
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 55
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 56
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 57
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 58
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 59
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 60
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 61
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 62
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 63
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 64
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 65
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 66
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 67
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 68
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 69
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 70
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 71
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 72
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 73
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 74
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 75
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 76
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 77
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 78
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 79
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 80
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 81
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 82
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 83
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 84
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 85
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 86
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 87
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 88
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 89
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 90
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 91
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 92
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 93
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 94
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 95
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 96
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 97
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 98
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 99
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 100
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 101
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 102
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 103
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 104
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 105
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 106
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 107
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 108
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 109
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 110
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 111
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 112
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 113
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 114
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 115
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 116
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 117
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 118
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 119
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 120
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 121
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 122
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 123
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 124
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 125
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 126
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 127
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 128
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 129
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 130
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 131
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 132
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 133
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 134
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 135
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 136
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 137
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 138
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 139
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 140
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 141
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 142
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 143
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 144
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 145
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 146
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 147
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 148
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 149
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 150
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 151
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 152
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 153
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 154
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 155
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 156
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 157
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 158
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 159
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 160
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 161
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 162
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 163
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 164
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 165
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 166
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 167
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 168
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 169
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 170
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 171
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 172
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 173
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 174
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 175
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 176
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 177
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 178
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 179
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 180
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 181
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 182
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 183
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 184
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 185
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 186
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 187
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 188
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 189
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 190
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 191
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 192
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 193
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 194
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 195
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 196
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 197
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 198
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 199
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 200
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 201
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 202
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 203
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 204
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 205
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 206
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 207
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 208
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 209
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 210
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 211
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 212
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 213
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 214
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 215
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 216
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 217
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 218
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 219
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 220
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 221
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 222
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 223
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 224
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 225
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 226
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 227
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 228
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 229
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 230
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 231
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 232
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 233
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 234
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 235
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 236
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 237
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 238
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 239
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 240
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 241
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 242
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 243
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 244
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 245
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 246
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 247
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 248
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 249
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 250
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 251
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 252
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 253
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 254
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 255
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 256
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 257
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 258
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 259
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 260
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 261
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 262
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 263
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 264
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 265
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 266
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 267
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 268
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 269
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 270
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 271
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 272
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 273
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 274
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 275
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 276
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 277
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 278
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 279
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 280
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 281
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 282
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 283
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 284
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 285
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 286
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 287
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 288
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 289
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 290
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 291
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 292
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 293
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 294
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 295
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 296
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 297
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 298
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 299
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 300
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 301
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 302
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 303
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 304
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 305
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 306
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 307
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 308
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 309
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 310
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 311
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 312
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 313
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 314
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 315
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 316
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 317
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 318
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 319
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 320
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 321
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 322
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 323
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 324
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 325
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 326
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 327
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 328
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 329
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 330
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 331
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 332
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 333
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 334
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 335
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 336
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 337
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 338
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 339
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 340
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 341
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 342
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 343
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 344
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 345
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 346
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 347
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 348
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 349
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 350
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 351
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 352
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 353
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 354
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 355
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 356
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 357
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 358
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 359
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 360
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 361
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 362
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 363
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 364
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 365
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 366
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 367
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 368
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 369
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 370
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 371
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 372
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 373
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 374
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 375
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 376
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 377
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 378
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 379
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 380
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 381
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 382
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 383
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 384
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 385
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 386
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 387
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 388
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 389
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 390
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 391
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 392
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 393
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 394
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 395
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 396
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 397
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 398
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 399
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 400
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 401
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 402
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 403
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 404
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 405
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 406
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 407
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 408
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 409
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 410
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 411
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 412
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 413
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 414
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 415
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 416
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 417
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 418
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 419
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 420
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 421
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 422
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 423
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 424
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 425
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 426
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 427
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 428
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 429
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 430
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 431
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 432
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 433
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 434
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 435
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 436
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 437
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 438
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 439
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 440
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 441
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 442
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 443
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 444
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 445
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 446
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 447
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 448
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 449
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 450
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 451
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 452
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 453
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 454
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 455
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 456
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 457
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 458
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 459
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 460
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 461
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 462
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 463
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 464
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 465
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 466
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 467
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 468
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 469
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 470
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 471
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 472
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 473
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 474
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 475
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 476
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 477
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 478
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 479
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 480
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 481
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 482
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 483
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 484
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 485
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 486
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 487
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 488
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 489
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 490
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 491
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 492
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 493
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 494
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 495
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 496
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 497
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 498
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 499
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 500
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 501
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 502
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 503
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 504
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 505
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 506
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 507
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 508
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 509
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 510
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 511
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 512
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 513
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 514
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 515
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 516
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 517
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 518
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 519
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 520
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 521
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 522
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 523
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 524
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 525
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 526
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 527
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 528
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 529
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 530
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 531
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 532
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 533
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 534
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 535
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 536
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 537
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 538
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 539
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 540
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 541
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 542
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 543
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 544
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 545
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 546
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 547
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 548
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 549
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 550
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 551
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 552
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 553
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 554
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 555
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 556
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 557
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 558
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 559
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 560
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 561
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 562
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 563
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 564
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 565
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 566
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 567
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 568
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 569
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 570
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 571
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 572
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 573
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 574
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 575
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 576
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 577
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 578
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 579
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 580
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 581
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 582
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 583
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 584
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 585
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 586
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 587
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 588
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 589
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 590
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 591
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 592
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 593
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 594
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 595
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 596
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 597
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 598
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 599
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 600
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 601
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 602
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 603
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 604
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 605
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 606
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 607
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 608
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 609
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 610
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 611
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 612
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 613
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 614
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 615
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 616
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 617
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 618
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 619
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 620
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 621
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 622
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 623
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 624
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 625
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 626
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 627
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 628
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 629
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 630
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 631
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 632
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 633
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 634
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 635
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 636
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 637
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 638
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 639
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 640
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 641
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 642
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 643
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 644
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 645
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 646
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 647
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 648
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 649
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 650
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 651
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 652
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 653
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 654
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 655
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 656
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 657
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 658
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 659
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 660
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 661
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 662
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 663
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 664
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 665
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 666
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 667
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 668
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 669
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 670
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 671
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 672
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 673
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 674
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 675
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 676
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 677
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 678
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 679
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 680
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 681
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 682
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 683
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 684
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 685
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 686
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 687
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 688
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 689
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 690
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 691
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 692
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 693
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 694
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 695
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 696
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 697
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 698
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 699
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 700
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 701
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 702
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 703
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 704
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 705
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 706
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 707
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 708
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 709
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 710
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 711
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 712
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 713
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 714
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 715
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 716
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 717
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 718
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 719
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 720
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 721
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 722
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 723
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 724
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 725
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 726
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 727
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 728
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 729
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 730
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 731
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 732
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 733
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 734
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 735
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 736
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 737
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 738
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 739
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 740
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 741
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 742
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 743
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 744
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 745
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 746
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 747
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 748
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 749
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 750
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 751
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 752
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 753
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 754
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 755
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 756
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 757
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 758
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 759
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 760
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 761
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 762
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 763
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 764
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 765
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 766
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 767
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 768
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 769
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 770
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 771
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 772
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 773
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 774
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 775
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 776
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 777
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 778
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 779
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 780
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 781
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 782
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 783
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 784
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 785
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 786
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 787
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 788
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 789
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 790
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 791
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 792
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 793
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 794
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 795
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 796
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 797
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 798
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 799
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 800
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 801
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 802
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 803
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 804
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 805
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 806
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 807
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 808
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 809
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 810
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 811
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 812
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 813
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 814
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 815
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 816
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 817
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 818
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 819
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 820
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 821
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 822
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 823
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 824
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 825
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 826
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 827
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 828
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 829
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 830
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 831
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 832
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 833
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 834
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 835
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 836
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 837
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 838
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 839
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 840
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 841
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 842
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 843
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 844
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 845
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 846
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 847
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 848
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 849
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 850
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 851
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 852
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 853
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 854
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 855
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 856
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 857
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 858
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 859
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 860
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 861
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 862
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 863
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 864
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 865
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 866
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 867
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 868
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 869
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 870
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 871
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 872
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 873
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 874
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 875
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 876
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 877
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 878
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 879
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 880
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 881
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 882
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 883
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 884
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 885
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 886
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 887
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 888
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 889
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 890
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 891
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 892
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 893
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 894
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 895
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 896
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 897
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 898
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 899
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 900
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 901
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 902
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 903
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 904
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 905
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 906
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 907
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 908
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 909
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 910
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 911
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 912
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 913
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 914
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 915
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 916
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 917
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 918
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 919
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 920
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 921
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 922
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 923
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 924
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 925
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 926
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 927
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 928
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 929
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 930
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 931
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 932
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 933
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 934
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 935
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 936
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 937
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 938
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 939
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 940
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 941
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 942
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 943
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 944
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 945
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 946
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 947
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 948
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 949
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 950
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 951
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 952
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 953
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 954
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 955
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 956
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 957
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 958
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 959
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 960
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 961
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 962
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 963
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 964
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 965
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 966
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 967
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 968
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 969
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 970
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 971
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 972
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 973
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 974
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 975
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 976
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 977
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 978
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 979
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 980
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 981
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 982
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 983
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 984
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 985
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 986
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 987
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 988
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 989
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 990
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 991
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 992
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 993
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 994
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 995
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 996
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 997
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 998
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 999
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y
+let thenx = 1000
+IF thenx > 1 THEN
+let y = thenx
+END IF
+PRINT y